@@ -0,0 +1,69 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) Scipp contributors (https://github.com/scipp)
+"""
+Measure the memory used per child by each tool, with ``tracemalloc``.
+
+Run with ``python benchmarks/memory_footprint.py``.
+"""
+
+import sys
+import tracemalloc
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+import mpltoolbox as tbx
+
+N = 500
+
+
+def geometries(n: int) -> dict:
+    x = np.arange(float(n))
+    return {
+        "Rectangles": {"x": x, "y": 0.0, "width": 0.5, "height": 1.0},
+        "Ellipses": {"x": x, "y": 0.0, "width": 0.5, "height": 1.0},
+        "Points": {"x": x, "y": 0.0},
+        "Vspans": {"left": x, "right": x + 0.5},
+        "Hspans": {"bottom": x, "top": x + 0.5},
+        "Lines": {
+            "x": np.repeat(x, 2),
+            "y": np.tile([0.0, 1.0], n),
+            "offsets": np.arange(n + 1) * 2,
+        },
+        "Polygons": {
+            "x": np.repeat(x, 3) + np.tile([0.0, 0.5, 0.5], n),
+            "y": np.tile([0.0, 0.0, 1.0], n),
+            "offsets": np.arange(n + 1) * 3,
+        },
+    }
+
+
+def footprint(name: str, n: int = N, **kwargs) -> tuple[float, int]:
+    """
+    Return the number of bytes allocated per child when adding ``n`` children
+    to a tool, and the size of a single child record.
+    """
+    _, ax = plt.subplots()
+    tool = getattr(tbx, name)(ax=ax, **kwargs)
+    arrays = geometries(n)[name]
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    children = tool.add_many(**arrays)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    plt.close(ax.figure)
+    return (after - before) / n, sys.getsizeof(children[0])
+
+
+def main():
+    for name in geometries(1):
+        total, record = footprint(name)
+        print(f"{name:<12}{total / 1024:8.1f} KiB per child, record {record} B")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) Scipp contributors (https://github.com/scipp)
+"""
+Micro-benchmark of the cost of a single resize event for the patch tools.
+
+Run with ``python benchmarks/patch_resize.py``. Drawing is excluded: only the
+update of the patch and of its handles is measured.
+"""
+
+import itertools
+import timeit
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+from mpltoolbox import DummyEvent
+from mpltoolbox.ellipses import Ellipse
+from mpltoolbox.hspans import Hspan
+from mpltoolbox.rectangles import Rectangle
+from mpltoolbox.vspans import Vspan
+
+
+def bench(spawner, ind: int, number: int = 5000, repeat: int = 7) -> float:
+    _, ax = plt.subplots()
+    ax.set(xlim=(0, 100), ylim=(0, 100))
+    child = spawner(x=20, y=20, number=0, ax=ax)
+    rng = np.random.default_rng(0)
+    events = [
+        DummyEvent(x, y, ax, 1, None) for x, y in rng.uniform(40, 80, (number, 2))
+    ]
+    it = itertools.cycle(events)
+    seconds = timeit.repeat(
+        lambda: child.move_vertex(next(it), ind=ind), number=number, repeat=repeat
+    )
+    plt.close(ax.figure)
+    # The minimum is the least affected by other processes
+    return min(seconds) / number
+
+
+def main():
+    for spawner, ind in [(Rectangle, 4), (Ellipse, 4), (Vspan, 1), (Hspan, 1)]:
+        cost = bench(spawner, ind)
+        print(f"{spawner.__name__:<12}{cost * 1e6:8.1f} us per event")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -9,26 +9,40 @@ try:
 except importlib.metadata.PackageNotFoundError:
     __version__ = "0.0.0"
 
+from .delivery import Background, Delivery, background, debounce, throttle
 from .ellipses import Ellipses
 from .event import DummyEvent
 from .hspans import Hspans
 from .lines import Lines
 from .points import Points
 from .polygons import Polygons
+from .polylines import PolylineTool
 from .rectangles import Rectangles
+from .snapshot import Snapshot, SnapshotDiff, diff
+from .spans import SpanTool
 from .tool import Tool
 from .vspans import Vspans
 
 __all__ = [
+    "Background",
+    "Delivery",
     "DummyEvent",
     "Ellipses",
     "Hspans",
     "Lines",
     "Points",
     "Polygons",
+    "PolylineTool",
     "Rectangles",
+    "Snapshot",
+    "SnapshotDiff",
+    "SpanTool",
     "Tool",
     "Vspans",
+    "background",
+    "debounce",
+    "diff",
+    "throttle",
 ]
 
 del importlib
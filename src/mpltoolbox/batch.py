@@ -0,0 +1,71 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) Scipp contributors (https://github.com/scipp)
+
+from typing import Any
+
+
+class Batch:
+    """
+    The redraw and the ``on_create``, ``on_change`` and ``on_remove`` notifications
+    deferred by the tools of a figure while :meth:`Tool.batch` is open. Batches
+    opened by several tools of the same figure are nested in a single batch, which
+    is flushed when the outermost one is closed.
+
+    The notifications are coalesced per child: a child created and then changed is
+    only reported as created, a child changed and then removed is only reported as
+    removed, and a child created and removed in the same batch is not reported.
+    """
+
+    def __init__(self):
+        self.depth = 0
+        self.draw = False
+        # The pending notifications of every tool, in the order the tools first
+        # queued them, as dicts from the keys of the children to the children
+        self._pending = {}
+
+    def queue(self, tool: Any, kind: str, event: Any):
+        if id(tool) not in self._pending:
+            self._pending[id(tool)] = (tool, {"remove": {}, "create": {}, "change": {}})
+        pending = self._pending[id(tool)][1]
+        children = event if isinstance(event, list) else [event]
+        for child in children:
+            key = child._key
+            if kind == "create":
+                pending["create"][key] = child
+            elif kind == "change":
+                if key not in pending["create"]:
+                    pending["change"][key] = child
+            else:
+                pending["change"].pop(key, None)
+                if pending["create"].pop(key, None) is None:
+                    pending["remove"][key] = child
+
+    def flush(self, canvas: Any):
+        """
+        Redraw the canvas if any tool asked for it, and deliver the pending
+        notifications: ``on_remove``, ``on_create`` and ``on_change`` are called
+        once per child, and the batched callbacks once per tool with the list of
+        children. Children that left the tool without being removed, e.g. evicted
+        by the retention policy, are not reported as created or changed.
+        """
+        if self.draw:
+            canvas.draw_idle()
+        for tool, pending in self._pending.values():
+            removed = list(pending["remove"].values())
+            if removed:
+                tool._call_each("remove", removed)
+            created = _present(tool, pending["create"])
+            if created:
+                tool._call_each("create", created)
+            changed = _present(tool, pending["change"])
+            if changed:
+                tool._call_each("change", changed)
+
+
+def _present(tool: Any, children: dict) -> list[Any]:
+    # Evicted children may be reused for new children, with a new key
+    return [
+        child
+        for key, child in children.items()
+        if child._key == key and key in tool._index
+    ]
@@ -0,0 +1,273 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) Scipp contributors (https://github.com/scipp)
+
+import warnings
+from collections.abc import Callable
+from typing import Any, NamedTuple
+
+import numpy as np
+
+
+class Delivery(NamedTuple):
+    """
+    How a callback registered on a tool is called, made with :func:`throttle` or
+    :func:`debounce`.
+
+    :param mode: ``'throttle'`` or ``'debounce'``.
+    :param interval: The interval of the throttle, or the delay of the debounce, in
+        seconds.
+    """
+
+    mode: str
+    interval: float
+
+
+def throttle(interval: float) -> Delivery:
+    """
+    Call a callback at most once every ``interval`` seconds. The first event is
+    delivered right away, and the events that arrive during the interval are
+    delivered at its end, only the latest one for every child.
+
+    :param interval: The minimum time between two calls, in seconds.
+    """
+    if interval <= 0:
+        raise ValueError("The interval of a throttle must be positive.")
+    return Delivery("throttle", interval)
+
+
+def debounce(delay: float) -> Delivery:
+    """
+    Call a callback once the events stopped arriving for ``delay`` seconds, or when
+    the mouse button is released, with the latest event for every child.
+
+    :param delay: The time without events after which the callback is called, in
+        seconds.
+    """
+    if delay <= 0:
+        raise ValueError("The delay of a debounce must be positive.")
+    return Delivery("debounce", delay)
+
+
+class TimedCallback:
+    """
+    A callback called according to a :class:`Delivery`, with a timer of the canvas
+    so that it works with every backend. The pending events are kept per child,
+    and only the latest event of every child is delivered. The pending lists of
+    children passed to the batched callbacks are merged into a single list.
+
+    :param func: The callback.
+    :param delivery: The delivery policy.
+    :param canvas: The canvas making the timer.
+    """
+
+    def __init__(self, func: Callable, delivery: Delivery, canvas: Any):
+        self._func = func
+        self._debounce = delivery.mode == "debounce"
+        self._pending = {}
+        self._running = False
+        self._timer = canvas.new_timer(interval=max(int(delivery.interval * 1000), 1))
+        self._timer.single_shot = self._debounce
+        self._timer.add_callback(self._on_timer)
+
+    def __call__(self, *args):
+        if not self._debounce and not self._running:
+            # A throttle delivers the first event right away, and holds the next
+            # ones until the end of the interval
+            self._running = True
+            self._timer.start()
+            self._func(*args)
+            return
+        # Children are the first argument, lists of children are queued together
+        key = getattr(args[0], "_key", None) if args else None
+        previous = self._pending.pop(key, None)
+        if previous is not None and isinstance(args[0], list):
+            args = _merge(previous, args)
+        self._pending[key] = args
+        if self._debounce:
+            self._timer.stop()
+            self._running = True
+            self._timer.start()
+
+    def _on_timer(self):
+        if self._debounce:
+            self._running = False
+        elif not self._pending:
+            self._timer.stop()
+            self._running = False
+            return
+        self.flush()
+
+    def flush(self):
+        """
+        Deliver the pending events right away.
+        """
+        if self._debounce and self._running:
+            self._timer.stop()
+            self._running = False
+        pending, self._pending = self._pending, {}
+        for args in pending.values():
+            self._func(*args)
+
+    def cancel(self):
+        """
+        Stop the timer and drop the pending events.
+        """
+        self._timer.stop()
+        self._running = False
+        self._pending.clear()
+
+
+def _merge(old: tuple, new: tuple) -> tuple:
+    # The lists of children passed to the batched callbacks, with the arrays of
+    # their ids, are merged by child, with the children of the latest list last
+    merged = {child._key: (child, i) for child, i in zip(*old, strict=True)}
+    for child, i in zip(*new, strict=True):
+        merged.pop(child._key, None)
+        merged[child._key] = (child, i)
+    return (
+        [child for child, _ in merged.values()],
+        np.asarray([i for _, i in merged.values()]),
+    )
+
+
+class Background(NamedTuple):
+    """
+    Run a callback registered on a tool in an executor, made with
+    :func:`background`.
+
+    :param executor: The executor running the callback.
+    :param on_result: The function called on the GUI thread with the child and the
+        result of the callback.
+    :param prepare: The function called on the GUI thread with the child, whose
+        return value is passed to the callback.
+    :param interval: The interval at which finished work is collected, in seconds.
+    """
+
+    executor: Any
+    on_result: Callable | None
+    prepare: Callable | None
+    interval: float
+
+
+def background(
+    executor: Any,
+    on_result: Callable | None = None,
+    *,
+    prepare: Callable | None = None,
+    interval: float = 0.02,
+) -> Background:
+    """
+    Run a callback in a thread or process pool, so that a slow callback does not
+    block the interaction with the figure. Every child has at most one call in
+    flight: the events that arrive in the meantime replace each other, and only
+    the latest one is submitted once the call is done, whose result is then
+    dropped as out of date. The results are collected on the GUI thread with a
+    timer of the canvas, and passed to ``on_result``.
+
+    :param executor: A :class:`concurrent.futures.Executor`, e.g. a
+        ``ThreadPoolExecutor`` or a ``ProcessPoolExecutor``.
+    :param on_result: A function called on the GUI thread with the child and the
+        result of the callback, unless the child was removed in the meantime.
+    :param prepare: A function called on the GUI thread with the child, whose
+        return value is passed to the callback instead of the child. Children
+        cannot be sent to another process, so a process pool needs e.g.
+        ``prepare=lambda child: child.xy``.
+    :param interval: The interval at which finished calls are collected, in
+        seconds.
+    """
+    if interval <= 0:
+        raise ValueError("The interval of a background delivery must be positive.")
+    return Background(executor, on_result, prepare, interval)
+
+
+class BackgroundCallback:
+    """
+    A callback run in an executor according to a :class:`Background`, with the
+    same interface as :class:`TimedCallback`.
+
+    :param func: The callback.
+    :param delivery: The executor and the handling of the results.
+    :param canvas: The canvas making the timer collecting the results.
+    """
+
+    def __init__(self, func: Callable, delivery: Background, canvas: Any):
+        self._func = func
+        self._delivery = delivery
+        # The call in flight and the latest event waiting for it, per child
+        self._running = {}
+        self._queued = {}
+        self._timer = canvas.new_timer(interval=max(int(delivery.interval * 1000), 1))
+        self._timer.add_callback(self._on_timer)
+
+    def __call__(self, *args):
+        key = getattr(args[0], "_key", None) if args else None
+        if key in self._running:
+            previous = self._queued.get(key)
+            if previous is not None and isinstance(args[0], list):
+                args = _merge(previous, args)
+            self._queued[key] = args
+            return
+        if not self._running:
+            self._timer.start()
+        self._submit(key, args)
+
+    def _submit(self, key: Any, args: tuple):
+        prepare = self._delivery.prepare
+        if prepare is not None:
+            inputs = [prepare(*args)]
+        else:
+            inputs = args
+        future = self._delivery.executor.submit(self._func, *inputs)
+        self._running[key] = (future, args)
+
+    def _on_timer(self):
+        done = [key for key, (future, _) in self._running.items() if future.done()]
+        try:
+            for key in done:
+                self._collect(key)
+        finally:
+            if not self._running:
+                self._timer.stop()
+
+    def _collect(self, key: Any):
+        future, args = self._running.pop(key)
+        if key in self._queued:
+            # The result is out of date: only the latest event is worked on
+            self._submit(key, self._queued.pop(key))
+            return
+        # Removed children are detached from their tool, and evicted children may
+        # be reused with a new key
+        if key is not None and (
+            args[0]._key != key or args[0]._on_geometry_change is None
+        ):
+            return
+        if future.cancelled():
+            return
+        # The error of a call is reported without stopping the collection of the
+        # other calls
+        error = future.exception()
+        if error is not None:
+            warnings.warn(
+                f"A callback running in the background raised {error!r}.",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+            return
+        if self._delivery.on_result is not None:
+            self._delivery.on_result(*args, future.result())
+
+    def flush(self):
+        """
+        Nothing is delivered on release: the calls in flight are left to finish in
+        the background.
+        """
+
+    def cancel(self):
+        """
+        Stop the timer, cancel the calls that did not start and drop the results.
+        """
+        self._timer.stop()
+        for future, _ in self._running.values():
+            future.cancel()
+        self._running.clear()
+        self._queued.clear()
@@ -6,13 +6,16 @@ from functools import partial
 import numpy as np
 from matplotlib import patches as mp
 from matplotlib.backend_bases import Event
-from matplotlib.pyplot import Axes
+from matplotlib.pyplot import Artist, Axes
 
-from .patch import Patch
+from .patch import Patch, move_edges
 from .tool import Tool
 
 
 class Ellipse(Patch):
+    __slots__ = ()
+    _geometry_fields = ("x", "y", "width", "height")
+
     def __init__(self, x: float, y: float, number: int, ax: Axes, **kwargs):
         super().__init__(x=x, y=y, number=number, ax=ax, **kwargs)
 
@@ -23,6 +26,15 @@ class Ellipse(Patch):
             f"edgecolor={self.edgecolor}, facecolor={self.facecolor}"
         )
 
+    @classmethod
+    def _can_adopt(cls, artist: Artist, ax: Axes) -> bool:
+        # Rotated ellipses are not supported
+        return (
+            isinstance(artist, mp.Ellipse)
+            and artist.get_angle() == 0
+            and artist.get_data_transform() is ax.transData
+        )
+
     def _make_patch(self, x: float, y: float, **kwargs):
         self._patch = mp.Ellipse((x, y), 0, 0, **kwargs)
         self._ax.add_patch(self._patch)
@@ -42,16 +54,34 @@ class Ellipse(Patch):
             np.array([btm, btm, btm, mid, top, top, top, mid]),
         )
 
+    def _write_vertices(self, x: np.ndarray, y: np.ndarray):
+        xc, yc = self._patch.get_center()
+        hw = 0.5 * self._patch.get_width()
+        hh = 0.5 * self._patch.get_height()
+        x[0] = x[6] = x[7] = xc - hw
+        x[1] = x[5] = xc
+        x[2] = x[3] = x[4] = xc + hw
+        y[0] = y[1] = y[2] = yc - hh
+        y[3] = y[7] = yc
+        y[4] = y[5] = y[6] = yc + hh
+
     def move_vertex(self, event: Event, ind: int, **ignored):
-        props = super().get_new_patch_props(event=event, ind=ind)
-        center = list(self.center)
-        if "width" in props:
-            center[0] = props["corner"][0] + 0.5 * props["width"]
-        if "height" in props:
-            center[1] = props["corner"][1] + 0.5 * props["height"]
-        props["center"] = center
-        del props["corner"]
-        self.update(**props)
+        xc, yc = self._patch.get_center()
+        hw = 0.5 * self._patch.get_width()
+        hh = 0.5 * self._patch.get_height()
+        x0, y0, x1, y1 = move_edges(
+            xc - hw, yc - hh, xc + hw, yc + hh, event.xdata, event.ydata, ind
+        )
+        self.set_bounds(0.5 * (x0 + x1), 0.5 * (y0 + y1), x1 - x0, y1 - y0)
+
+    def set_bounds(self, x: float, y: float, width: float, height: float):
+        """
+        Set the center, width and height of the ellipse at once.
+        """
+        self._patch.set_center((x, y))
+        self._patch.set_width(width)
+        self._patch.set_height(height)
+        self._update_vertices()
 
     @property
     def center(self) -> tuple[float, float]:
@@ -70,6 +100,19 @@ class Ellipse(Patch):
     def xy(self, xy: tuple[float, float]):
         self.center = xy
 
+    def _get_geometry(self) -> tuple[float, float, float, float]:
+        return (*self.center, self.width, self.height)
+
+    def _set_geometry(self, geometry: tuple[float, float, float, float]):
+        self.set_bounds(*geometry)
+
+    @property
+    def bbox(self) -> tuple[float, float, float, float]:
+        x, y = self.center
+        dx = 0.5 * abs(self.width)
+        dy = 0.5 * abs(self.height)
+        return (x - dx, y - dy, x + dx, y + dy)
+
 
 Ellipses = partial(Tool, spawner=Ellipse)
 Ellipses.__doc__ = """
@@ -79,6 +122,8 @@ Controls:
   - Left-click and hold to make new ellipses
   - Right-click and hold to drag/move ellipse
   - Middle-click to delete ellipse
+  - Shift + left-click and drag to select several ellipses, which are then
+    dragged and deleted together (requires ``enable_select=True``)
 
 :param ax: The Matplotlib axes to which the Ellipses tool will be attached.
 :param autostart: Automatically activate the tool upon creation if `True`.
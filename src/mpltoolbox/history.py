@@ -0,0 +1,137 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) Scipp contributors (https://github.com/scipp)
+
+from collections import deque
+from typing import Any, NamedTuple
+
+import numpy as np
+
+# Rough size of an entry without its arrays, used for the memory accounting
+_ENTRY_OVERHEAD = 200
+
+
+class Edit(NamedTuple):
+    """
+    A single operation made with a tool, recorded for undo and redo.
+
+    - ``'create'``: the children in ``keys`` were created with the geometries
+      ``after``
+    - ``'remove'``: the children in ``keys``, with the geometries ``before``, were
+      removed
+    - ``'change'``: the geometry of the children in ``keys`` changed from
+      ``before`` to ``after``, possibly stored as a compact difference
+    - ``'drag'``: the children in ``keys`` were moved by the offset ``after``
+
+    :param kind: The kind of operation.
+    :param keys: The internal keys of the children.
+    :param before: The geometries before the operation.
+    :param after: The geometries after the operation.
+    :param ids: The ids of the children, where they were generated, so that they
+        are restored along with the children.
+    """
+
+    kind: str
+    keys: np.ndarray
+    before: Any = None
+    after: Any = None
+    ids: tuple | None = None
+
+    @property
+    def nbytes(self) -> int:
+        return _ENTRY_OVERHEAD + _nbytes((self.keys, self.before, self.after, self.ids))
+
+
+def _nbytes(obj: Any) -> int:
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if isinstance(obj, tuple | list):
+        return sum(_nbytes(item) for item in obj)
+    if isinstance(obj, dict):
+        return sum(_nbytes(item) for item in obj.values())
+    return 0 if obj is None else 8
+
+
+class History:
+    """
+    The undo and redo stacks of a tool, holding at most ``max_bytes`` of edits.
+    When recording a new edit goes over the limit, the oldest edits are forgotten,
+    and an edit larger than the limit on its own cannot be undone.
+
+    :param max_bytes: The memory limit of the recorded edits, in bytes.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._undo = deque()
+        self._redo = []
+        self._nbytes = 0
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The approximate memory used by the recorded edits, in bytes.
+        """
+        return self._nbytes
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def record(self, edit: Edit):
+        """
+        Record a new edit, which discards the edits that could be redone.
+        """
+        self._nbytes -= sum(e.nbytes for e in self._redo)
+        self._redo.clear()
+        self._undo.append(edit)
+        self._nbytes += edit.nbytes
+        while self._undo and self._nbytes > self.max_bytes:
+            self._nbytes -= self._undo.popleft().nbytes
+
+    def undo(self) -> Edit | None:
+        """
+        Return the last edit, moving it to the redo stack.
+        """
+        if not self._undo:
+            return None
+        edit = self._undo.pop()
+        self._redo.append(edit)
+        return edit
+
+    def redo(self) -> Edit | None:
+        """
+        Return the last undone edit, moving it back to the undo stack.
+        """
+        if not self._redo:
+            return None
+        edit = self._redo.pop()
+        self._undo.append(edit)
+        return edit
+
+    def amend(self, edit: Edit, redo: bool):
+        """
+        Replace the edit on top of the redo stack if ``redo`` is `True`, or on top
+        of the undo stack otherwise, e.g. to store the ids generated since it was
+        recorded.
+        """
+        stack = self._redo if redo else self._undo
+        self._nbytes += edit.nbytes - stack[-1].nbytes
+        stack[-1] = edit
+
+    def drop(self, redo: bool):
+        """
+        Forget the edit on top of the redo stack if ``redo`` is `True`, or on top
+        of the undo stack otherwise.
+        """
+        stack = self._redo if redo else self._undo
+        if stack:
+            self._nbytes -= stack.pop().nbytes
+
+    def clear(self):
+        self._undo.clear()
+        self._redo.clear()
+        self._nbytes = 0
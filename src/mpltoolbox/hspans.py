@@ -3,20 +3,25 @@
 
 from functools import partial
 
+import numpy as np
+from matplotlib import patches as mp
 from matplotlib.backend_bases import Event
-from matplotlib.pyplot import Axes
+from matplotlib.pyplot import Artist, Axes
 
 from .patch import Patch
-from .tool import Tool
+from .spans import SpanTool
 
 
 class Hspan(Patch):
+    __slots__ = ("_median", "_median_y")
+    _geometry_fields = ("bottom", "top")
+    # The retention window of the tool runs along y
+    _window_axis = 1
+
     def __init__(
         self, x: float, y: float, number: int, ax: Axes, hide_median=False, **kwargs
     ):
         super().__init__(x=x, y=y, number=number, ax=ax, **kwargs)
-        self._median = self._ax.axhline(y, ls="dashed", color=self.edgecolor)
-        self._vertices.set_transform(self._median.get_transform())
         if hide_median:
             self._median.set_visible(False)
 
@@ -26,10 +31,42 @@ class Hspan(Patch):
             f"edgecolor={self.edgecolor}, facecolor={self.facecolor}"
         )
 
+    def _recycle(self, number: int, hide_median: bool = False, **kwargs):
+        super()._recycle(number, **kwargs)
+        if self._median is not None:
+            self._median.set(color=self.edgecolor, visible=not hide_median)
+
+    @classmethod
+    def _can_adopt(cls, artist: Artist, ax: Axes) -> bool:
+        # Spans are made by ax.axhspan, and span the axes along x
+        return isinstance(
+            artist, mp.Rectangle | mp.Polygon
+        ) and artist.get_data_transform() is ax.get_yaxis_transform(which="grid")
+
+    def _make_handles(self):
+        # The median is made along with the handles, using the same transform
+        super()._make_handles()
+        self._median_y = np.full(2, 0.5 * (self.bottom + self.top), dtype=float)
+        self._median = self._ax.axhline(
+            self._median_y[0], ls="dashed", color=self.edgecolor
+        )
+        self._vertices.set_transform(self._median.get_transform())
+
+    def _clear_handles(self):
+        super()._clear_handles()
+        self._median = None
+        self._median_y = None
+
     def _update_vertices(self):
-        super()._update_vertices()
-        mid = 0.5 * (self.bottom + self.top)
-        self._median.set_ydata([mid, mid])
+        if self._vertices is None:
+            self._geometry_changed()
+            return
+        # The handles and the median only move along y
+        self._write_vertices(self._handle_x, self._handle_y)
+        self._vertices.set_ydata(self._handle_y)
+        self._median_y[:] = 0.5 * (self._handle_y[0] + self._handle_y[1])
+        self._median.set_ydata(self._median_y)
+        self._geometry_changed()
 
     def _make_patch(self, x, y, **kwargs):
         self._patch = self._ax.axhspan(y, y, **kwargs)
@@ -37,6 +74,10 @@ class Hspan(Patch):
     def _make_vertices(self) -> tuple[tuple[float, float], tuple[float, float]]:
         return ([0.5, 0.5], [self.bottom, self.top])
 
+    def _write_vertices(self, x: np.ndarray, y: np.ndarray):
+        y[0] = self.bottom
+        y[1] = self.top
+
     def move_vertex(self, event: Event, ind: int, **ignored):
         y = event.ydata
         if ind == 0:
@@ -44,9 +85,10 @@ class Hspan(Patch):
         else:
             self.top = y
 
-    def remove(self):
-        super().remove()
-        self._median.remove()
+    def _get_artists(self) -> list[Artist]:
+        if self._median is None:
+            return super()._get_artists()
+        return [*super()._get_artists(), self._median]
 
     @property
     def bottom(self) -> float:
@@ -67,7 +109,8 @@ class Hspan(Patch):
                 xy += [xy[0, 0], y]
             self._patch.set_xy(xy)
         else:
-            self._patch.set(height=xy[1] - y + self.height, xy=(0, y))
+            self._patch.set_height(xy[1] - y + self._patch.get_height())
+            self._patch.set_y(y)
         self._update_vertices()
 
     @property
@@ -85,7 +128,7 @@ class Hspan(Patch):
                 xy[i, 1] = y
             self._patch.set_xy(xy)
         else:
-            self._patch.set(height=y - xy[1])
+            self._patch.set_height(y - xy[1])
         self._update_vertices()
 
     @property
@@ -109,12 +152,36 @@ class Hspan(Patch):
         self._patch.set_xy(_xy)
         self._update_vertices()
 
+    def _get_geometry(self) -> tuple[float, float]:
+        return (self.bottom, self.top)
+
+    def _set_geometry(self, geometry: tuple[float, float]):
+        bottom, top = geometry
+        if len(self._patch.get_xy()) > 2:
+            self.bottom, self.top = bottom, top
+        else:
+            self._patch.set_y(bottom)
+            self._patch.set_height(top - bottom)
+            self._update_vertices()
+
+    @property
+    def bbox(self) -> tuple[float, float, float, float]:
+        start, end = self.interval
+        return (-np.inf, start, np.inf, end)
+
+    @property
+    def interval(self) -> tuple[float, float]:
+        bottom = self.bottom
+        top = self.top
+        return (min(bottom, top), max(bottom, top))
+
     def set(self, **kwargs):
         super().set(**kwargs)
-        self._median.set(**kwargs)
+        if self._median is not None:
+            self._median.set(**kwargs)
 
 
-Hspans = partial(Tool, spawner=Hspan)
+Hspans = partial(SpanTool, spawner=Hspan)
 Hspans.__doc__ = """
 Hspans: Add horizontal spans to the supplied axes.
 
@@ -122,6 +189,8 @@ Controls:
   - Left-click and hold to make new spans
   - Right-click and hold to drag/move span
   - Middle-click to delete span
+  - Shift + left-click and drag to select several spans, which are then
+    dragged and deleted together (requires ``enable_select=True``)
 
 :param ax: The Matplotlib axes to which the Hspans tool will be attached.
 :param autostart: Automatically activate the tool upon creation if `True`.
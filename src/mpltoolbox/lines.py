@@ -1,18 +1,41 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) Scipp contributors (https://github.com/scipp)
 
-import uuid
 from functools import partial
 
 import numpy as np
 from matplotlib.backend_bases import Event
+from matplotlib.lines import Line2D
 from matplotlib.pyplot import Artist, Axes
 
-from .tool import Tool
-from .utils import parse_kwargs
+from .polylines import PolylineTool
+from .spatial import SegmentIndex
+from .store import VertexChild
+from .utils import get_parent, parse_kwargs, set_parent
+
+
+def _pick_line(artist: Artist, mouseevent: Event) -> tuple[bool, dict]:
+    # A function rather than a bound method, so that the artist does not keep the
+    # line alive
+    line = get_parent(artist)
+    if line is None:
+        return False, {}
+    return line._pick(artist, mouseevent)
+
+
+class Line(VertexChild):
+    __slots__ = (
+        "__dict__",
+        "__weakref__",
+        "_ax",
+        "_highlighted",
+        "_line",
+        "_max_clicks",
+        "_on_geometry_change",
+        "_segment_index",
+        "_segment_index_view",
+    )
 
-
-class Line:
     def __init__(
         self,
         x: float,
@@ -23,8 +46,56 @@ class Line:
         hide_vertices: bool = False,
         **kwargs,
     ):
-        self._max_clicks = n
+        self._init_state(ax, max_clicks=n)
+        (self._line,) = self._ax.plot(x, y, **self._parse_style(number, kwargs))
+        if hide_vertices:
+            self.mec = "None"
+            self.mfc = "None"
+        set_parent(self._line, self)
+
+    @classmethod
+    def _adopt(cls, artist: Artist, ax: Axes) -> "Line | None":
+        # Wrap a line that is already on the axes, or return None if the artist
+        # does not match. The line itself holds the vertices, so nothing is made.
+        if not cls._can_adopt(artist, ax):
+            return None
+        line = cls.__new__(cls)
+        line._init_state(ax, max_clicks=len(artist.get_xdata()))
+        line._line = artist
+        set_parent(artist, line)
+        return line
+
+    def _init_state(self, ax: Axes, max_clicks: int):
+        # The state shared by new and adopted lines
+        self._new_identity()
+        self._max_clicks = max_clicks
         self._ax = ax
+        self._on_geometry_change = None
+        self._highlighted = False
+        self._segment_index = None
+        self._segment_index_view = None
+        self._buffer = None
+        self._bbox = None
+
+    @classmethod
+    def _can_adopt(cls, artist: Artist, ax: Axes) -> bool:
+        return (
+            isinstance(artist, Line2D)
+            and artist.get_transform() is ax.transData
+            and len(artist.get_xdata()) > 0
+        )
+
+    def _ensure_handles(self) -> bool:
+        return False
+
+    def __repr__(self):
+        return f"Line: x={self.x}, y={self.y}, color={self.color}"
+
+    def __str__(self):
+        return repr(self)
+
+    @staticmethod
+    def _parse_style(number: int, kwargs: dict) -> dict:
         kwargs = parse_kwargs(kwargs, number)
         if {"ls", "linestyle"}.isdisjoint(set(kwargs.keys())):
             kwargs["ls"] = "solid"
@@ -32,18 +103,20 @@ class Line:
             kwargs["marker"] = "o"
         if "color" not in kwargs:
             kwargs["color"] = f"C{number}"
-        (self._line,) = self._ax.plot(x, y, **kwargs)
+        return kwargs
+
+    def _recycle(self, number: int, hide_vertices: bool = False, **kwargs):
+        # Turn a removed line into a new one with the given number, reusing its
+        # artist
+        self._new_identity()
+        self.set_highlight(False)
+        self._line.set(**self._parse_style(number, kwargs))
         if hide_vertices:
             self.mec = "None"
             self.mfc = "None"
-        self._line.parent = self
-        self.id = uuid.uuid1().hex
-
-    def __repr__(self):
-        return f"Line: x={self.x}, y={self.y}, color={self.color}"
-
-    def __str__(self):
-        return repr(self)
+        self._segment_index = None
+        self._buffer = None
+        self._bbox = None
 
     def __len__(self):
         return len(self.x)
@@ -51,22 +124,26 @@ class Line:
     def move_vertex(
         self, event: Event, ind: int, move_x: bool = True, move_y: bool = True
     ):
-        new_data = self.xy
-        if ind is None:
-            ind = -1
-        if move_x:
-            new_data[0][ind] = event.xdata
-        if move_y:
-            new_data[1][ind] = event.ydata
-        self.xy = new_data
+        buffer = self._get_buffer()
+        ind = (-1 if ind is None else ind) % len(buffer)
+        old = buffer.vertices[ind].copy()
+        buffer.set_vertex(
+            ind, event.xdata if move_x else None, event.ydata if move_y else None
+        )
+        self._line.set_data(buffer.x, buffer.y)
+        # Only the segments around the moved vertex need updating in the index
+        if self._segment_index is not None:
+            self._segment_index.update_vertex(
+                ind, self._line.get_transform().transform(buffer.vertices[ind])
+            )
+        self._vertices_moved(ind, old)
 
     def after_persist_vertex(self, event: Event):
         # Duplicate the last vertex
-        new_data = self.xy
-        self.xy = (
-            np.append(new_data[0], new_data[0][-1]),
-            np.append(new_data[1], new_data[1][-1]),
-        )
+        buffer = self._get_buffer()
+        buffer.append(*buffer.vertices[-1])
+        self._line.set_data(buffer.x, buffer.y)
+        self._geometry_changed()
 
     @property
     def x(self) -> np.ndarray:
@@ -75,6 +152,8 @@ class Line:
     @x.setter
     def x(self, x: np.ndarray):
         self._line.set_xdata(x)
+        self._buffer = None
+        self._geometry_changed()
 
     @property
     def y(self) -> np.ndarray:
@@ -83,6 +162,8 @@ class Line:
     @y.setter
     def y(self, y: np.ndarray):
         self._line.set_ydata(y)
+        self._buffer = None
+        self._geometry_changed()
 
     @property
     def xy(self) -> tuple[np.ndarray, np.ndarray]:
@@ -90,7 +171,48 @@ class Line:
 
     @xy.setter
     def xy(self, xy: tuple[np.ndarray, np.ndarray]):
-        self._line.set_data(xy)
+        buffer = self._get_buffer()
+        buffer.set(*xy)
+        self._line.set_data(buffer.x, buffer.y)
+        self._geometry_changed()
+
+    def _get_vertices(self) -> tuple[np.ndarray, np.ndarray]:
+        return self._line.get_data()
+
+    def _set_geometry(self, geometry: tuple[np.ndarray, np.ndarray]):
+        self.xy = geometry
+
+    def _geometry_changed(self):
+        self._segment_index = None
+        self._bbox = None
+        if self._on_geometry_change is not None:
+            self._on_geometry_change(self)
+
+    def _get_segment_index(self) -> SegmentIndex:
+        # The index is built in display space, and is rebuilt when the view changes
+        ax = self._ax
+        view = (ax.viewLim.bounds, ax.bbox.bounds, ax.get_xscale(), ax.get_yscale())
+        if self._segment_index is None or view != self._segment_index_view:
+            vertices = self._line.get_transform().transform(
+                np.column_stack(self._line.get_data())
+            )
+            self._segment_index = SegmentIndex(vertices)
+            self._segment_index_view = view
+        return self._segment_index
+
+    def _hits(self, xdisplay: float, ydisplay: float, radius: float) -> np.ndarray:
+        segments = self._line.get_linestyle() not in ("None", "none", "", " ")
+        return self._get_segment_index().query(
+            (xdisplay, ydisplay), radius, segments=segments
+        )
+
+    def _pick(self, artist: Artist, mouseevent: Event) -> tuple[bool, dict]:
+        # Replaces Line2D.contains, which tests every vertex and segment of the line
+        if not self._line.get_visible():
+            return False, {}
+        radius = self._ax.figure.dpi / 72.0 * self._line.get_pickradius()
+        ind = self._hits(mouseevent.x, mouseevent.y, radius)
+        return len(ind) > 0, {"ind": ind}
 
     @property
     def color(self) -> str:
@@ -175,8 +297,12 @@ class Line:
     def remove(self):
         self._line.remove()
 
+    def _get_artists(self) -> list[Artist]:
+        return [self._line]
+
     def set_picker(self, pick: float):
-        self._line.set_picker(pick)
+        self._line.set_pickradius(pick)
+        self._line.set_picker(_pick_line)
 
     def is_moveable(self, artist: Artist) -> bool:
         return True
@@ -187,6 +313,28 @@ class Line:
     def is_removable(self, artist: Artist) -> bool:
         return True
 
+    def artist_at(self, event: Event) -> Artist | None:
+        """
+        Return the line if it is located under the mouse event.
+        """
+        return self._line if self._pick(self._line, event)[0] else None
+
+    def contains_point(self, x: float, y: float, radius: float = 0.0) -> bool:
+        """
+        Return `True` if the point ``(x, y)`` in data coordinates lies on the line.
+
+        :param radius: Tolerance in pixels around the line.
+        """
+        return len(self._hits(*self._ax.transData.transform((x, y)), radius)) > 0
+
+    def set_highlight(self, highlight: bool):
+        if highlight == self._highlighted:
+            return
+        scale = 2.0 if highlight else 0.5
+        self._line.set_linewidth(self._line.get_linewidth() * scale)
+        self._line.set_markeredgewidth(self._line.get_markeredgewidth() * scale)
+        self._highlighted = highlight
+
     def show_vertices(self):
         pass
 
@@ -194,7 +342,7 @@ class Line:
         pass
 
 
-Lines = partial(Tool, spawner=Line)
+Lines = partial(PolylineTool, spawner=Line)
 Lines.__doc__ = """
 Lines: Add lines to the supplied axes.
 
@@ -203,6 +351,8 @@ Controls:
   - Left-click and hold on line vertex to move vertex
   - Right-click and hold to drag/move the entire line
   - Middle-click to delete line
+  - Shift + left-click and drag to select several lines, which are then
+    dragged and deleted together (requires ``enable_select=True``)
 
 :param ax: The Matplotlib axes to which the Lines tool will be attached.
 :param n: The number of vertices for each line. Default is 2.
@@ -1,16 +1,28 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) Scipp contributors (https://github.com/scipp)
 
-import uuid
-
+import numpy as np
 from matplotlib.backend_bases import Event
 from matplotlib.colors import to_rgb
 from matplotlib.pyplot import Artist, Axes
 
-from .utils import parse_kwargs
+from .utils import Child, parse_kwargs, set_parent
+
 
+class Patch(Child):
+    __slots__ = (
+        "__dict__",
+        "__weakref__",
+        "_ax",
+        "_handle_x",
+        "_handle_y",
+        "_highlighted",
+        "_max_clicks",
+        "_on_geometry_change",
+        "_patch",
+        "_vertices",
+    )
 
-class Patch:
     def __init__(
         self,
         x: float,
@@ -20,33 +32,109 @@ class Patch:
         hide_vertices: bool = False,
         **kwargs,
     ):
+        self._init_state(ax)
+        self._make_patch(x=x, y=y, **self._parse_style(number, kwargs))
+        self._make_handles()
+        if hide_vertices:
+            self.hide_vertices()
+
+        set_parent(self._vertices, self)
+        set_parent(self._patch, self)
+
+    @classmethod
+    def _adopt(cls, artist: Artist, ax: Axes) -> "Patch | None":
+        # Wrap a patch that is already on the axes, or return None if the artist
+        # does not match this kind of patch. The handles are only made when they
+        # are first needed.
+        if not cls._can_adopt(artist, ax):
+            return None
+        patch = cls.__new__(cls)
+        patch._init_state(ax)
+        patch._patch = artist
+        patch._clear_handles()
+        set_parent(artist, patch)
+        return patch
+
+    def _init_state(self, ax: Axes):
+        # The state shared by new and adopted patches
+        self._new_identity()
         self._max_clicks = 2
         self._ax = ax
+        self._on_geometry_change = None
+        self._highlighted = False
+
+    @classmethod
+    def _can_adopt(cls, artist: Artist, ax: Axes) -> bool:
+        return False
+
+    def _make_handles(self):
+        # The positions of the handles are rewritten in place when the patch changes
+        self._handle_x, self._handle_y = (
+            np.array(v, dtype=float) for v in self._make_vertices()
+        )
+        (self._vertices,) = self._ax.plot(
+            self._handle_x,
+            self._handle_y,
+            "o",
+            ls="None",
+            mec=self.edgecolor,
+            mfc="None",
+        )
+
+    def _clear_handles(self):
+        self._handle_x = None
+        self._handle_y = None
+        self._vertices = None
+
+    def _ensure_handles(self) -> bool:
+        # Make the handles of an adopted patch, returning True if they were made
+        if self._vertices is not None:
+            return False
+        self._make_handles()
+        self._vertices.set_picker(self._patch.get_picker())
+        set_parent(self._vertices, self)
+        return True
+
+    def __str__(self):
+        return repr(self)
+
+    @staticmethod
+    def _parse_style(number: int, kwargs: dict) -> dict:
         kwargs = parse_kwargs(kwargs, number)
         defaut_color = f"C{number}"
         if {"ec", "edgecolor"}.isdisjoint(set(kwargs.keys())):
             kwargs["ec"] = defaut_color
         if {"fc", "facecolor"}.isdisjoint(set(kwargs.keys())):
             kwargs["fc"] = (*to_rgb(defaut_color), 0.05)
-        self._make_patch(x=x, y=y, **kwargs)
-        (self._vertices,) = self._ax.plot(
-            *self._make_vertices(), "o", ls="None", mec=self.edgecolor, mfc="None"
-        )
-        if hide_vertices:
-            self.hide_vertices()
+        return kwargs
 
-        self._vertices.parent = self
-        self._patch.parent = self
-        self.id = uuid.uuid1().hex
-
-    def __str__(self):
-        return repr(self)
+    def _recycle(self, number: int, hide_vertices: bool = False, **kwargs):
+        # Turn a removed patch into a new one with the given number, reusing its
+        # artists
+        self._new_identity()
+        self.set_highlight(False)
+        self._patch.set(**self._parse_style(number, kwargs))
+        if self._vertices is not None:
+            self._vertices.set(mec=self.edgecolor, visible=not hide_vertices)
 
     def __eq__(self, other):
-        return self.id == other.id
+        return self._key == other._key
 
     def _update_vertices(self):
-        self._vertices.set_data(*self._make_vertices())
+        if self._vertices is None:
+            self._geometry_changed()
+            return
+        self._write_vertices(self._handle_x, self._handle_y)
+        self._vertices.set_data(self._handle_x, self._handle_y)
+        self._geometry_changed()
+
+    def _write_vertices(self, x: np.ndarray, y: np.ndarray):
+        # Subclasses write the handle positions directly, without temporary arrays
+        x[:], y[:] = self._make_vertices()
+
+    def _geometry_changed(self):
+        if self._on_geometry_change is not None:
+            self._on_geometry_change(self)
 
     @property
     def width(self) -> float:
@@ -73,7 +161,8 @@ class Patch:
     @edgecolor.setter
     def edgecolor(self, color: str):
         self._patch.set_edgecolor(color)
-        self._vertices.set_edgecolor(color)
+        if self._vertices is not None:
+            self._vertices.set_edgecolor(color)
 
     @property
     def facecolor(self) -> str:
@@ -84,8 +173,13 @@ class Patch:
         self._patch.set_facecolor(color)
 
     def remove(self):
-        self._patch.remove()
-        self._vertices.remove()
+        for artist in self._get_artists():
+            artist.remove()
+
+    def _get_artists(self) -> list[Artist]:
+        if self._vertices is None:
+            return [self._patch]
+        return [self._patch, self._vertices]
 
     def update(self, **kwargs):
         self._patch.update(kwargs)
@@ -93,21 +187,27 @@ class Patch:
 
     @property
     def vertices(self):
+        if self._vertices is None:
+            return self._make_vertices()
         return self._vertices.get_data()
 
     def show_vertices(self):
+        self._ensure_handles()
         self._vertices.set_visible(True)
 
     def hide_vertices(self):
-        self._vertices.set_visible(False)
+        if self._vertices is not None:
+            self._vertices.set_visible(False)
 
     def set(self, **kwargs):
         self._patch.set(**kwargs)
-        self._vertices.set(**kwargs)
+        if self._vertices is not None:
+            self._vertices.set(**kwargs)
 
     def set_picker(self, pick: float):
         self._patch.set_picker(pick)
-        self._vertices.set_picker(pick)
+        if self._vertices is not None:
+            self._vertices.set_picker(pick)
 
     def is_moveable(self, artist: Artist) -> bool:
         return artist is self._vertices
@@ -118,49 +218,78 @@ class Patch:
     def is_removable(self, artist: Artist) -> bool:
         return artist is self._patch
 
+    def artist_at(self, event: Event) -> Artist | None:
+        """
+        Return the artist of the patch located under the mouse event, giving the
+        vertices precedence over the body of the patch.
+        """
+        if (
+            self._vertices is not None
+            and self._vertices.get_visible()
+            and self._vertices.contains(event)[0]
+        ):
+            return self._vertices
+        if self._patch.contains(event)[0]:
+            return self._patch
+        return None
+
+    def contains_point(self, x: float, y: float, radius: float = 0.0) -> bool:
+        """
+        Return `True` if the point ``(x, y)`` in data coordinates is inside the patch.
+
+        :param radius: Tolerance in pixels, added around the edge of the patch.
+        """
+        point = self._ax.transData.transform((x, y))
+        return self._patch.contains_point(point, radius=radius)
+
+    def set_highlight(self, highlight: bool):
+        if highlight == self._highlighted:
+            return
+        scale = 2.0 if highlight else 0.5
+        self._patch.set_linewidth(self._patch.get_linewidth() * scale)
+        self._highlighted = highlight
+
     def get_new_patch_props(self, event: Event, ind: int) -> dict[str, float]:
-        x = event.xdata
-        y = event.ydata
-        verts = self.vertices
-        if ind is None:
-            ind = 4
-        opp = (ind + 4) % 8
-        xopp = verts[0][opp]
-        yopp = verts[1][opp]
-        width = None
-        height = None
-        corner = [verts[0][0], verts[1][0]]
-        if ind == 0:
-            width = xopp - x
-            height = yopp - y
-            corner = [x, y]
-        elif ind == 1:
-            height = yopp - y
-            corner[1] = y
-        elif ind == 2:
-            width = x - xopp
-            height = yopp - y
-            corner[1] = y
-        elif ind == 3:
-            width = x - xopp
-        elif ind == 4:
-            width = x - xopp
-            height = y - yopp
-        elif ind == 5:
-            height = y - yopp
-        elif ind == 6:
-            width = xopp - x
-            height = y - yopp
-            corner[0] = x
-        elif ind == 7:
-            width = xopp - x
-            corner[0] = x
-        out = {"corner": corner}
-        if width is not None:
-            out["width"] = width
-        if height is not None:
-            out["height"] = height
+        """
+        Return the ``corner`` of the patch, with the ``width`` and the ``height``
+        that change, after moving the handle ``ind`` to the position of the event.
+        The edges are moved with :func:`move_edges`.
+        """
+        x, y = self.vertices
+        x0, y0, x1, y1 = move_edges(
+            x[0], y[0], x[4], y[4], event.xdata, event.ydata, ind
+        )
+        ind = 4 if ind is None else ind
+        out = {"corner": [x0, y0]}
+        # The middles of the bottom and top edges only move vertically, and the
+        # middles of the left and right edges only horizontally
+        if ind % 4 != 1:
+            out["width"] = x1 - x0
+        if ind % 4 != 3:
+            out["height"] = y1 - y0
         return out
 
     def after_persist_vertex(self, event: Event):
         return
+
+
+def move_edges(
+    x0: float, y0: float, x1: float, y1: float, x: float, y: float, ind: int | None
+) -> tuple[float, float, float, float]:
+    """
+    Return the edges ``(x0, y0, x1, y1)`` of a box after moving one of its eight
+    handles to ``(x, y)``. The handles are numbered counter-clockwise from the
+    ``(x0, y0)`` corner, with corners at even indices and the middles of the edges
+    at odd indices. An index of `None` moves the ``(x1, y1)`` corner.
+    """
+    if ind is None:
+        ind = 4
+    if ind in (0, 6, 7):
+        x0 = x
+    elif ind in (2, 3, 4):
+        x1 = x
+    if ind in (0, 1, 2):
+        y0 = y
+    elif ind in (4, 5, 6):
+        y1 = y
+    return x0, y0, x1, y1
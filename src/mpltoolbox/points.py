@@ -4,17 +4,24 @@
 from functools import partial
 
 from matplotlib.backend_bases import Event
-from matplotlib.pyplot import Axes
+from matplotlib.pyplot import Artist, Axes
 
 from .lines import Line
 from .tool import Tool
 
 
 class Point(Line):
+    __slots__ = ()
+    _geometry_fields = ("x", "y")
+
     def __init__(self, x: float, y: float, number: int, ax: Axes, **kwargs):
         super().__init__(x=x, y=y, number=number, ax=ax, **kwargs)
         self._max_clicks = 1
 
+    @classmethod
+    def _can_adopt(cls, artist: Artist, ax: Axes) -> bool:
+        return super()._can_adopt(artist, ax) and len(artist.get_xdata()) == 1
+
     def __repr__(self):
         return f"Point: x={self.x}, y={self.y}, color={self.color}"
 
@@ -31,6 +38,7 @@ class Point(Line):
     @x.setter
     def x(self, x: float):
         self._line.set_xdata([x])
+        self._geometry_changed()
 
     @property
     def y(self) -> float:
@@ -39,6 +47,7 @@ class Point(Line):
     @y.setter
     def y(self, y: float):
         self._line.set_ydata([y])
+        self._geometry_changed()
 
     @property
     def xy(self) -> float:
@@ -48,14 +57,17 @@ class Point(Line):
     @xy.setter
     def xy(self, xy: float):
         self._line.set_data([xy[0]], [xy[1]])
+        self._geometry_changed()
+
+    def _get_geometry(self) -> tuple[float, float]:
+        return self.xy
 
     def move_vertex(
         self, event: Event, ind: int, move_x: bool = True, move_y: bool = True
     ):
-        if move_x:
-            self.x = event.xdata
-        if move_y:
-            self.y = event.ydata
+        # Both coordinates are set at once, so that the tool sees a single change
+        x, y = self.xy
+        self.xy = (event.xdata if move_x else x, event.ydata if move_y else y)
 
     def after_persist_vertex(self, event: Event):
         return
@@ -69,6 +81,8 @@ Controls:
   - Left-click to make new points
   - Left-click and hold on point to move point
   - Middle-click to delete point
+  - Shift + left-click and drag to select several points, which are then
+    dragged and deleted together (requires ``enable_select=True``)
 
 :param ax: The Matplotlib axes to which the Points tool will be attached.
 :param autostart: Automatically activate the tool upon creation if `True`.
@@ -1,18 +1,38 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) Scipp contributors (https://github.com/scipp)
 
-import uuid
 from functools import partial
 
 import numpy as np
+from matplotlib import patches as mp
 from matplotlib.backend_bases import Event
+from matplotlib.lines import Line2D
 from matplotlib.pyplot import Artist, Axes
 
-from .tool import Tool
-from .utils import parse_kwargs
+from .polylines import PolylineTool
+from .store import VertexChild
+from .utils import parse_kwargs, set_parent
+
+
+class Polygon(VertexChild):
+    __slots__ = (
+        "__dict__",
+        "__weakref__",
+        "_ax",
+        "_data_to_axes",
+        "_fill",
+        "_first_point_position_axes",
+        "_first_point_position_data",
+        "_first_point_view",
+        "_highlighted",
+        "_max_clicks",
+        "_on_geometry_change",
+        "_vertices",
+        "_vertices_colors_backup",
+    )
+
+    _distance_from_first_point = 0.05
 
-
-class Polygon:
     def __init__(
         self,
         x: float,
@@ -22,8 +42,7 @@ class Polygon:
         hide_vertices: bool = False,
         **kwargs,
     ):
-        self._max_clicks = 0
-        self._ax = ax
+        self._init_state(ax, first_point=(x, y))
         line_kwargs = parse_kwargs(kwargs, number)
         fill_kwargs = {}
         for arg in ("ec", "edgecolor", "fc", "facecolor", "alpha"):
@@ -46,15 +65,68 @@ class Polygon:
         if fill_kwargs["fc"] is None:
             fill_kwargs["fc"] = self._vertices.get_color()
         (self._fill,) = self._ax.fill(x, y, **fill_kwargs)
-        self._vertices_colors_backup = {'mec': self.mec, 'mfc': self.mfc}
+        self._vertices_colors_backup = (self.mec, self.mfc)
         if hide_vertices:
             self.hide_vertices()
-        self._fill.parent = self
-        self._vertices.parent = self
-        self.id = uuid.uuid1().hex
-        self._distance_from_first_point = 0.05
-        self._first_point_position_data = (x, y)
-        self._first_point_position_axes = self._data_to_axes_transform(x, y)
+        set_parent(self._fill, self)
+        set_parent(self._vertices, self)
+
+    @classmethod
+    def _adopt(cls, artist: Artist, ax: Axes) -> "Polygon | None":
+        # Wrap a polygon patch that is already on the axes, or return None if the
+        # artist is not a polygon. The handles are only made when first needed.
+        if not (
+            isinstance(artist, mp.Polygon)
+            and artist.get_data_transform() is ax.transData
+        ):
+            return None
+        polygon = cls.__new__(cls)
+        polygon._init_state(ax, first_point=tuple(artist.get_xy()[0]))
+        polygon._fill = artist
+        polygon._vertices = None
+        polygon._vertices_colors_backup = None
+        set_parent(artist, polygon)
+        return polygon
+
+    def _init_state(self, ax: Axes, first_point: tuple[float, float]):
+        # The state shared by new and adopted polygons
+        self._new_identity()
+        self._max_clicks = 0
+        self._ax = ax
+        self._on_geometry_change = None
+        self._highlighted = False
+        self._buffer = None
+        self._bbox = None
+        self._first_point_position_data = first_point
+        self._first_point_position_axes = None
+        self._first_point_view = None
+        self._data_to_axes = None
+
+    def _ensure_handles(self) -> bool:
+        # Make the handles of an adopted polygon, returning True if they were made.
+        # The outline is still drawn by the adopted patch, so that the handles only
+        # mark the vertices.
+        if self._vertices is not None:
+            return False
+        (self._vertices,) = self._ax.plot(
+            *self._get_vertices(),
+            "o",
+            ls="None",
+            color=self._fill.get_edgecolor(),
+            mfc="None",
+        )
+        self._vertices_colors_backup = (self.mec, self.mfc)
+        self._vertices.set_picker(self._fill.get_picker())
+        set_parent(self._vertices, self)
+        return True
+
+    def _get_handles(self) -> Line2D:
+        self._ensure_handles()
+        return self._vertices
+
+    def _set_line_data(self, x: np.ndarray, y: np.ndarray):
+        if self._vertices is not None:
+            self._vertices.set_data(x, y)
 
     def __repr__(self):
         return (
@@ -69,84 +141,154 @@ class Polygon:
         return len(self.x)
 
     def after_persist_vertex(self, event: Event):
-        new_data = self.xy
-        self.xy = (
-            np.append(new_data[0], new_data[0][-1]),
-            np.append(new_data[1], new_data[1][-1]),
-        )
+        # Duplicate the last vertex
+        buffer = self._get_buffer()
+        buffer.append(*buffer.vertices[-1])
+        self._set_line_data(buffer.x, buffer.y)
+        self._update_fill()
 
     def _data_to_axes_transform(self, x: float, y: float) -> tuple[float, float]:
-        trans = self._ax.transData.transform((x, y))
-        return self._ax.transAxes.inverted().transform(trans)
+        # The transform is only needed while the polygon is being created, and is
+        # made on first use. Composite transforms are invalidated by matplotlib when
+        # the view changes.
+        if self._data_to_axes is None:
+            self._data_to_axes = self._ax.transData - self._ax.transAxes
+        return self._data_to_axes.transform((x, y))
 
     def _get_distance_from_first_point(self, x: float, y: float) -> float:
-        xdisplay, ydisplay = self._data_to_axes_transform(x, y)
-        dist = np.sqrt(
-            (xdisplay - self._first_point_position_axes[0]) ** 2
-            + (ydisplay - self._first_point_position_axes[1]) ** 2
+        # The position of the first point in axes coordinates is only recomputed
+        # when the view changes
+        ax = self._ax
+        view = (ax.viewLim.bounds, ax.bbox.bounds, ax.get_xscale(), ax.get_yscale())
+        if view != self._first_point_view:
+            self._first_point_position_axes = self._data_to_axes_transform(
+                *self._first_point_position_data
+            )
+            self._first_point_view = view
+        xaxes, yaxes = self._data_to_axes_transform(x, y)
+        return np.hypot(
+            xaxes - self._first_point_position_axes[0],
+            yaxes - self._first_point_position_axes[1],
         )
-        return dist
 
     def move_vertex(
         self, event: Event, ind: int, move_x: bool = True, move_y: bool = True
     ):
         x = event.xdata
         y = event.ydata
-        if self._get_distance_from_first_point(x, y) < self._distance_from_first_point:
-            x = self._first_point_position_data[0]
-            y = self._first_point_position_data[1]
-            self._max_clicks = len(self)
-        else:
-            self._max_clicks = 0
-        new_data = self.xy
+        buffer = self._get_buffer()
         if ind is None:
-            ind = -1
-        elif ind in (0, len(new_data[0])):
-            ind = [0, -1]
-        if move_x:
-            new_data[0][ind] = x
-        if move_y:
-            new_data[1][ind] = y
-        self.xy = new_data
-        self._update_fill()
+            # The polygon is being created: the last vertex snaps to the first one
+            # to close the polygon
+            if (
+                self._get_distance_from_first_point(x, y)
+                < self._distance_from_first_point
+            ):
+                x, y = self._first_point_position_data
+                self._max_clicks = len(self)
+            else:
+                self._max_clicks = 0
+            buffer.set_vertex(-1, x if move_x else None, y if move_y else None)
+            self._set_line_data(buffer.x, buffer.y)
+            self._update_fill()
+            return
+        # The first and last vertices of a closed polygon move together
+        rows = (
+            [0, len(buffer) - 1] if ind % len(buffer) in (0, len(buffer) - 1) else ind
+        )
+        old = buffer.vertices[rows].copy()
+        buffer.set_vertex(rows, x if move_x else None, y if move_y else None)
+        self._set_line_data(buffer.x, buffer.y)
+        self._update_fill(rows, old)
+
+    def _update_fill(
+        self, rows: int | list[int] | None = None, old: np.ndarray | None = None
+    ):
+        buffer = self._get_buffer()
+        vertices = self._fill.get_path().vertices
+        if (
+            rows is not None
+            and len(vertices) == len(buffer)
+            and vertices.flags.writeable
+        ):
+            # Only rewrite the moved rows of the fill path
+            vertices[rows] = buffer.vertices[rows]
+            self._fill.stale = True
+        else:
+            self._fill.set_xy(buffer.vertices)
+        if rows is None:
+            self._geometry_changed()
+        else:
+            self._vertices_moved(rows, old)
+
+    def _geometry_changed(self):
+        self._bbox = None
+        if self._on_geometry_change is not None:
+            self._on_geometry_change(self)
 
-    def _update_fill(self):
-        self._fill.set_xy(np.array(self._vertices.get_data()).T)
+    def _get_vertices(self) -> tuple[np.ndarray, np.ndarray]:
+        if self._vertices is None:
+            xy = self._fill.get_xy()
+            return xy[:, 0], xy[:, 1]
+        return self._vertices.get_data()
+
+    def _set_geometry(self, geometry: tuple[np.ndarray, np.ndarray]):
+        x, y = geometry
+        # Polygons repeat their first vertex at the end to close the outline
+        if len(x) and (x[0] != x[-1] or y[0] != y[-1]):
+            x = np.append(x, x[0])
+            y = np.append(y, y[0])
+        self.xy = (x, y)
 
     @property
     def x(self) -> np.ndarray:
-        return self._vertices.get_xdata()
+        return self._get_vertices()[0]
 
     @x.setter
     def x(self, x: np.ndarray):
+        if self._vertices is None:
+            self.xy = (x, self.y)
+            return
         self._vertices.set_xdata(x)
+        self._buffer = None
         self._update_fill()
 
     @property
     def y(self) -> np.ndarray:
-        return self._vertices.get_ydata()
+        return self._get_vertices()[1]
 
     @y.setter
     def y(self, y: np.ndarray):
+        if self._vertices is None:
+            self.xy = (self.x, y)
+            return
         self._vertices.set_ydata(y)
+        self._buffer = None
         self._update_fill()
 
     @property
     def xy(self) -> tuple[np.ndarray, np.ndarray]:
-        return self._vertices.get_data()
+        return self._get_vertices()
 
     @xy.setter
     def xy(self, xy: tuple[np.ndarray, np.ndarray]):
-        self._vertices.set_data(xy)
+        buffer = self._get_buffer()
+        buffer.set(*xy)
+        self._set_line_data(buffer.x, buffer.y)
         self._update_fill()
 
     @property
     def edgecolor(self) -> str:
+        if self._vertices is None:
+            return self._fill.get_edgecolor()
         return self._vertices.get_color()
 
     @edgecolor.setter
     def edgecolor(self, c: str):
-        self._vertices.set_color(c)
+        if self._vertices is None:
+            self._fill.set_edgecolor(c)
+        else:
+            self._vertices.set_color(c)
 
     @property
     def facecolor(self) -> str:
@@ -158,19 +300,19 @@ class Polygon:
 
     @property
     def markerfacecolor(self) -> str:
-        return self._vertices.get_markerfacecolor()
+        return self._get_handles().get_markerfacecolor()
 
     @markerfacecolor.setter
     def markerfacecolor(self, color: str):
-        self._vertices.set_markerfacecolor(color)
+        self._get_handles().set_markerfacecolor(color)
 
     @property
     def markeredgecolor(self) -> str:
-        return self._vertices.get_markeredgecolor()
+        return self._get_handles().get_markeredgecolor()
 
     @markeredgecolor.setter
     def markeredgecolor(self, color: str):
-        self._vertices.set_markeredgecolor(color)
+        self._get_handles().set_markeredgecolor(color)
 
     @property
     def mfc(self) -> str:
@@ -190,19 +332,19 @@ class Polygon:
 
     @property
     def marker(self) -> str:
-        return self._vertices.get_marker()
+        return self._get_handles().get_marker()
 
     @marker.setter
     def marker(self, m: str):
-        self._vertices.set_marker(m)
+        self._get_handles().set_marker(m)
 
     @property
     def linestyle(self) -> str:
-        return self._vertices.get_linestyle()
+        return self._get_handles().get_linestyle()
 
     @linestyle.setter
     def linestyle(self, style: str):
-        self._vertices.set_linestyle(style)
+        self._get_handles().set_linestyle(style)
 
     @property
     def ls(self) -> str:
@@ -214,11 +356,11 @@ class Polygon:
 
     @property
     def linewidth(self) -> float:
-        return self._vertices.get_linewidth()
+        return self._get_handles().get_linewidth()
 
     @linewidth.setter
     def linewidth(self, width: float):
-        self._vertices.set_linewidth(width)
+        self._get_handles().set_linewidth(width)
 
     @property
     def lw(self) -> float:
@@ -229,12 +371,18 @@ class Polygon:
         self.linewidth = width
 
     def remove(self):
-        self._fill.remove()
-        self._vertices.remove()
+        for artist in self._get_artists():
+            artist.remove()
+
+    def _get_artists(self) -> list[Artist]:
+        if self._vertices is None:
+            return [self._fill]
+        return [self._fill, self._vertices]
 
     def set_picker(self, pick: float):
         self._fill.set_picker(pick)
-        self._vertices.set_picker(pick)
+        if self._vertices is not None:
+            self._vertices.set_picker(pick)
 
     def is_moveable(self, artist: Artist) -> bool:
         return artist is self._vertices
@@ -245,16 +393,47 @@ class Polygon:
     def is_removable(self, artist: Artist) -> bool:
         return artist is self._fill
 
+    def artist_at(self, event: Event) -> Artist | None:
+        """
+        Return the artist of the polygon located under the mouse event, giving the
+        vertices precedence over the fill.
+        """
+        if self._vertices is not None and self._vertices.contains(event)[0]:
+            return self._vertices
+        if self._fill.contains(event)[0]:
+            return self._fill
+        return None
+
+    def contains_point(self, x: float, y: float, radius: float = 0.0) -> bool:
+        """
+        Return `True` if the point ``(x, y)`` in data coordinates is inside the
+        polygon.
+
+        :param radius: Tolerance in pixels, added around the edge of the polygon.
+        """
+        point = self._ax.transData.transform((x, y))
+        return self._fill.contains_point(point, radius=radius)
+
+    def set_highlight(self, highlight: bool):
+        if highlight == self._highlighted:
+            return
+        scale = 2.0 if highlight else 0.5
+        outline = self._fill if self._vertices is None else self._vertices
+        outline.set_linewidth(outline.get_linewidth() * scale)
+        self._highlighted = highlight
+
     def show_vertices(self):
-        self.mec = self._vertices_colors_backup['mec']
-        self.mfc = self._vertices_colors_backup['mfc']
+        self._ensure_handles()
+        self.mec, self.mfc = self._vertices_colors_backup
 
     def hide_vertices(self):
+        if self._vertices is None:
+            return
         self.mec = "None"
         self.mfc = "None"
 
 
-Polygons = partial(Tool, spawner=Polygon)
+Polygons = partial(PolylineTool, spawner=Polygon)
 Polygons.__doc__ = """
 Polygons: Add closed polygons to the supplied axes.
 
@@ -263,6 +442,8 @@ Controls:
   - Left-click and hold on polygon vertex to move vertex
   - Right-click and hold to drag/move the entire polygon
   - Middle-click to delete polygon
+  - Shift + left-click and drag to select several polygons, which are then
+    dragged and deleted together (requires ``enable_select=True``)
 
 :param ax: The Matplotlib axes to which the Polygons tool will be attached.
 :param autostart: Automatically activate the tool upon creation if `True`.
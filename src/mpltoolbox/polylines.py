@@ -0,0 +1,153 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) Scipp contributors (https://github.com/scipp)
+
+from itertools import pairwise
+from typing import Any
+
+import numpy as np
+
+from .store import RaggedStore
+from .tool import Tool
+
+
+class PolylineTool(Tool):
+    """
+    A tool for children with a variable number of vertices (lines and polygons),
+    which keeps the vertices of all its children in a single flat buffer so that
+    they can be exported and aggregated without looping over the children.
+
+    The spawner must create children with a ``_get_vertices`` method returning the
+    ``x`` and ``y`` coordinates of their vertices.
+    """
+
+    def __init__(self, *args, geometry_dtype: np.dtype | str = float, **kwargs):
+        self._ragged = RaggedStore(dtype=geometry_dtype)
+        super().__init__(*args, geometry_dtype=geometry_dtype, **kwargs)
+
+    def _add_to_indices(self, child):
+        super()._add_to_indices(child)
+        self._ragged.add(child._key, *child._get_vertices())
+
+    def _update_indices(self, child, rows=None):
+        super()._update_indices(child, rows)
+        if rows is None:
+            self._ragged.update(child._key, *child._get_vertices())
+        else:
+            self._ragged.update_rows(child._key, rows, *child._get_vertices())
+
+    def _update_many_indices(self, children):
+        super()._update_many_indices(children)
+        for child in children:
+            self._ragged.update(child._key, *child._get_vertices())
+
+    def _remove_from_indices(self, children):
+        super()._remove_from_indices(children)
+        self._ragged.remove_many([child._key for child in children])
+
+    def _clear_indices(self):
+        super()._clear_indices()
+        self._ragged.clear()
+
+    def _snapshot_store(self) -> RaggedStore:
+        return self._ragged
+
+    def _split_geometries(self, arrays: dict) -> list[tuple[float, float, Any]]:
+        if set(arrays) != {"x", "y", "offsets"}:
+            raise ValueError(
+                f"Expected arrays for x, y, offsets, got {', '.join(arrays) or 'none'}."
+            )
+        x = np.asarray(arrays["x"], dtype=float)
+        y = np.asarray(arrays["y"], dtype=float)
+        offsets = np.asarray(arrays["offsets"])
+        if x.shape != y.shape or len(offsets) == 0 or offsets[-1] != len(x):
+            raise ValueError("The offsets do not match the number of vertices.")
+        if np.any(np.diff(offsets) <= 0):
+            raise ValueError("Every child needs at least one vertex.")
+        return [
+            (x[start], y[start], (x[start:stop], y[start:stop]))
+            for start, stop in pairwise(offsets)
+        ]
+
+    def _pack_geometries(self, children: list) -> tuple[np.ndarray, ...]:
+        # The vertices of all children are stored in a ragged layout
+        vertices = [child._get_vertices() for child in children]
+        offsets = np.zeros(len(vertices) + 1, dtype=int)
+        np.cumsum([len(x) for x, _ in vertices], out=offsets[1:])
+        return (
+            np.concatenate([x for x, _ in vertices], dtype=float),
+            np.concatenate([y for _, y in vertices], dtype=float),
+            offsets,
+        )
+
+    def _unpack_geometries(self, packed: tuple[np.ndarray, ...]) -> list[Any]:
+        x, y, offsets = packed
+        return [(x[start:stop], y[start:stop]) for start, stop in pairwise(offsets)]
+
+    def _anchor(self, geometry: tuple[np.ndarray, np.ndarray]) -> tuple[float, float]:
+        return geometry[0][0], geometry[1][0]
+
+    def _diff_geometries(self, before: tuple, after: tuple) -> tuple[Any, Any] | None:
+        if not np.array_equal(before[2], after[2]):
+            return before, after
+        # With the same number of vertices, only store the vertices that moved
+        rows = np.flatnonzero((before[0] != after[0]) | (before[1] != after[1]))
+        if not len(rows):
+            return None
+        return (
+            {"rows": rows, "x": before[0][rows], "y": before[1][rows]},
+            {"rows": rows, "x": after[0][rows], "y": after[1][rows]},
+        )
+
+    def _patch_geometries(self, children: list, stored: Any) -> tuple[np.ndarray, ...]:
+        if not isinstance(stored, dict):
+            return stored
+        x, y, offsets = self._pack_geometries(children)
+        x[stored["rows"]] = stored["x"]
+        y[stored["rows"]] = stored["y"]
+        return x, y, offsets
+
+    def to_arrays(self) -> dict[str, np.ndarray]:
+        """
+        Return the vertices of all children in a ragged layout, as a dict with
+        entries:
+
+        - ``x`` and ``y``: the coordinates of the vertices of all children,
+          concatenated in the order of ``tool.children``
+        - ``offsets``: the vertices of child ``i`` are found between
+          ``offsets[i]`` and ``offsets[i + 1]``
+
+        The same layout is accepted by :meth:`add_many` and :meth:`set_geometry`.
+        The ids of the children, in the same order, are returned by :meth:`ids`.
+        The coordinates and offsets are read-only views of the storage maintained
+        by the tool, so no data is copied. They follow later changes to the
+        vertices, but ``to_arrays`` should be called again after children or
+        vertices are added or removed, and after a :meth:`snapshot` is taken, which
+        detaches the arrays exported earlier from the storage of the tool.
+        """
+        return self._ragged.to_arrays()
+
+    def vertex_counts(self) -> np.ndarray:
+        """
+        Return the number of vertices of every child.
+        """
+        return self._ragged.vertex_counts()
+
+    def bounding_boxes(self) -> np.ndarray:
+        """
+        Return the ``(xmin, ymin, xmax, ymax)`` bounding box of every child, as an
+        ``(n, 4)`` array.
+        """
+        return self._ragged.bounding_boxes()
+
+    def areas(self) -> np.ndarray:
+        """
+        Return the area enclosed by every child, closing lines implicitly between
+        their last and first vertices.
+        """
+        return self._ragged.areas()
+
+    def lengths(self) -> np.ndarray:
+        """
+        Return the length of the path going through the vertices of every child.
+        """
+        return self._ragged.lengths()
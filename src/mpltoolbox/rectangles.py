@@ -6,13 +6,16 @@ from functools import partial
 import numpy as np
 from matplotlib import patches as mp
 from matplotlib.backend_bases import Event
-from matplotlib.pyplot import Axes
+from matplotlib.pyplot import Artist, Axes
 
-from .patch import Patch
+from .patch import Patch, move_edges
 from .tool import Tool
 
 
 class Rectangle(Patch):
+    __slots__ = ()
+    _geometry_fields = ("x", "y", "width", "height")
+
     def __init__(self, x: float, y: float, number: int, ax: Axes, **kwargs):
         super().__init__(x=x, y=y, number=number, ax=ax, **kwargs)
 
@@ -22,6 +25,15 @@ class Rectangle(Patch):
             f"edgecolor={self.edgecolor}, facecolor={self.facecolor}"
         )
 
+    @classmethod
+    def _can_adopt(cls, artist: Artist, ax: Axes) -> bool:
+        # Rotated rectangles are not supported
+        return (
+            isinstance(artist, mp.Rectangle)
+            and artist.get_angle() == 0
+            and artist.get_data_transform() is ax.transData
+        )
+
     def _make_patch(self, x: float, y: float, **kwargs):
         self._patch = mp.Rectangle((x, y), 0, 0, **kwargs)
         self._ax.add_patch(self._patch)
@@ -42,10 +54,32 @@ class Rectangle(Patch):
         y[1::2] = y_mid
         return (x, y)
 
+    def _write_vertices(self, x: np.ndarray, y: np.ndarray):
+        x0, y0 = self._patch.get_xy()
+        x1 = x0 + self._patch.get_width()
+        y1 = y0 + self._patch.get_height()
+        xm = 0.5 * (x0 + x1)
+        ym = 0.5 * (y0 + y1)
+        x[0] = x[6] = x[7] = x0
+        x[1] = x[5] = xm
+        x[2] = x[3] = x[4] = x1
+        y[0] = y[1] = y[2] = y0
+        y[3] = y[7] = ym
+        y[4] = y[5] = y[6] = y1
+
     def move_vertex(self, event: Event, ind: int, **ignored):
-        props = super().get_new_patch_props(event=event, ind=ind)
-        props["xy"] = props.pop("corner")
-        self.update(**props)
+        x0, y0 = self._patch.get_xy()
+        x1 = x0 + self._patch.get_width()
+        y1 = y0 + self._patch.get_height()
+        x0, y0, x1, y1 = move_edges(x0, y0, x1, y1, event.xdata, event.ydata, ind)
+        self.set_bounds(x0, y0, x1 - x0, y1 - y0)
+
+    def set_bounds(self, x: float, y: float, width: float, height: float):
+        """
+        Set the corner, width and height of the rectangle at once.
+        """
+        self._patch.set_bounds(x, y, width, height)
+        self._update_vertices()
 
     @property
     def xy(self) -> tuple[float, float]:
@@ -56,6 +90,19 @@ class Rectangle(Patch):
         self._patch.set_xy(xy)
         self._update_vertices()
 
+    def _get_geometry(self) -> tuple[float, float, float, float]:
+        return (*self.xy, self.width, self.height)
+
+    def _set_geometry(self, geometry: tuple[float, float, float, float]):
+        self.set_bounds(*geometry)
+
+    @property
+    def bbox(self) -> tuple[float, float, float, float]:
+        x0, y0 = self.xy
+        x1 = x0 + self.width
+        y1 = y0 + self.height
+        return (min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1))
+
 
 Rectangles = partial(Tool, spawner=Rectangle)
 Rectangles.__doc__ = """
@@ -65,6 +112,8 @@ Controls:
   - Left-click and hold to make new rectangles
   - Right-click and hold to drag/move rectangle
   - Middle-click to delete rectangle
+  - Shift + left-click and drag to select several rectangles, which are then
+    dragged and deleted together (requires ``enable_select=True``)
 
 :param ax: The Matplotlib axes to which the Rectangles tool will be attached.
 :param autostart: Automatically activate the tool upon creation if `True`.
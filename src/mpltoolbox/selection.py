@@ -0,0 +1,75 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) Scipp contributors (https://github.com/scipp)
+
+import numpy as np
+from matplotlib import patches as mp
+from matplotlib.lines import Line2D
+from matplotlib.path import Path
+from matplotlib.pyplot import Axes
+
+
+class RubberBand:
+    """
+    The box or lasso drawn on the axes while selecting several children of a tool.
+
+    :param ax: The axes on which the selection is drawn.
+    :param x: The x coordinate where the selection started.
+    :param y: The y coordinate where the selection started.
+    :param mode: ``'box'`` for a rectangular selection, ``'lasso'`` for a free-hand
+        selection.
+    """
+
+    def __init__(self, ax: Axes, x: float, y: float, mode: str = "box"):
+        if mode not in ("box", "lasso"):
+            raise ValueError(f"Unknown selection mode '{mode}'.")
+        self._mode = mode
+        self._origin = (x, y)
+        self._corner = (x, y)
+        self._x = [x]
+        self._y = [y]
+        style = {"ls": "--", "color": "gray", "lw": 1}
+        if mode == "box":
+            self._artist = mp.Rectangle((x, y), 0, 0, fill=False, **style)
+        else:
+            self._artist = Line2D([x], [y], **style)
+        # Use add_artist so that the selection does not change the data limits
+        ax.add_artist(self._artist)
+
+    def extend(self, x: float, y: float):
+        if self._mode == "box":
+            self._corner = (x, y)
+            self._artist.set_width(x - self._origin[0])
+            self._artist.set_height(y - self._origin[1])
+        else:
+            self._x.append(x)
+            self._y.append(y)
+            self._artist.set_data(self._x, self._y)
+
+    def select(self, boxes: np.ndarray) -> np.ndarray:
+        """
+        Return the rows of the ``(n, 4)`` array of bounding boxes that are selected.
+        A box selection selects all the boxes it intersects, while a lasso selects
+        the boxes whose center lies inside it.
+        """
+        if self._mode == "box":
+            xmin, xmax = sorted((self._origin[0], self._corner[0]))
+            ymin, ymax = sorted((self._origin[1], self._corner[1]))
+            mask = (
+                (boxes[:, 0] <= xmax)
+                & (boxes[:, 2] >= xmin)
+                & (boxes[:, 1] <= ymax)
+                & (boxes[:, 3] >= ymin)
+            )
+            return np.flatnonzero(mask)
+        if len(self._x) < 3:
+            return np.empty(0, dtype=int)
+        vertices = np.column_stack([self._x, self._y])
+        # Boxes of spans are unbounded in one direction: use the center of the lasso
+        # in that direction instead.
+        with np.errstate(invalid="ignore"):
+            centers = 0.5 * (boxes[:, :2] + boxes[:, 2:])
+        centers = np.where(np.isfinite(centers), centers, vertices.mean(axis=0))
+        return np.flatnonzero(Path(vertices).contains_points(centers))
+
+    def remove(self):
+        self._artist.remove()
@@ -0,0 +1,100 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) Scipp contributors (https://github.com/scipp)
+
+import sys
+from collections.abc import Hashable
+from typing import Any, NamedTuple
+
+import numpy as np
+
+
+class Snapshot:
+    """
+    An immutable view of the children of a tool, as they were when
+    :meth:`Tool.snapshot` was called.
+
+    The geometry is shared with the tool, which copies its storage before the next
+    write to the rows of existing children, so that taking a snapshot does not copy
+    anything. A snapshot keeps its tool alive.
+
+    :param tool: The tool the snapshot was taken from.
+    :param epoch: The position of the snapshot in the sequence of snapshots of the
+        tool.
+    :param keys: The internal keys of the children, of which only the first
+        ``size`` are part of the snapshot.
+    :param size: The number of children.
+    :param arrays: The geometry of the children, in the layout of
+        :meth:`Tool.to_arrays`.
+    """
+
+    def __init__(
+        self,
+        tool: Any,
+        epoch: int,
+        keys: list[Hashable],
+        size: int,
+        arrays: dict[str, np.ndarray],
+    ):
+        self._tool = tool
+        self._epoch = epoch
+        self._keys = keys
+        self._size = size
+        self._arrays = arrays
+
+    def __del__(self):
+        if not sys.is_finalizing():
+            self._tool._release_snapshot(self._epoch)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __repr__(self) -> str:
+        return f"Snapshot(epoch={self._epoch}, children={self._size})"
+
+    @property
+    def tool(self) -> Any:
+        """
+        The tool the snapshot was taken from.
+        """
+        return self._tool
+
+    @property
+    def ids(self) -> list[str | int]:
+        """
+        The ids of the children, in the order of the arrays.
+        """
+        return self._tool._ids_of(self._keys[: self._size])
+
+    def to_arrays(self) -> dict[str, np.ndarray]:
+        """
+        Return the geometry of the children as read-only arrays, in the same layout
+        as :meth:`Tool.to_arrays`.
+        """
+        return dict(self._arrays)
+
+
+class SnapshotDiff(NamedTuple):
+    """
+    The ids of the children added, removed and modified between two snapshots.
+    """
+
+    added: list[str | int]
+    removed: list[str | int]
+    modified: list[str | int]
+
+
+def diff(a: Snapshot, b: Snapshot) -> SnapshotDiff:
+    """
+    Compare two snapshots of the same tool. The children present in both snapshots
+    whose geometry was changed in between are reported as modified.
+
+    The tool logs the children it changes while snapshots are alive, so that the
+    comparison only looks at the children that changed, and not at all children.
+
+    :param a: The earlier snapshot.
+    :param b: The later snapshot. If it was taken before ``a``, added and removed
+        children are swapped.
+    """
+    if a.tool is not b.tool:
+        raise ValueError("Only snapshots of the same tool can be compared.")
+    return SnapshotDiff(*a.tool._diff_snapshots(a._epoch, b._epoch))
@@ -0,0 +1,94 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) Scipp contributors (https://github.com/scipp)
+
+import numpy as np
+
+from .spatial import IntervalIndex
+from .tool import Tool
+
+
+class SpanTool(Tool):
+    """
+    A tool for spans, which keeps an index of the intervals covered by its children
+    to answer stabbing and overlap queries along the axis of the spans.
+
+    The spawner must create children with an ``interval`` property returning the
+    sorted ``(start, end)`` extent of the span.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._intervals = IntervalIndex()
+        super().__init__(*args, **kwargs)
+
+    def _add_to_indices(self, child):
+        super()._add_to_indices(child)
+        self._intervals.add(child._key, child.interval)
+
+    def _update_indices(self, child):
+        super()._update_indices(child)
+        self._intervals.update(child._key, child.interval)
+
+    def _update_many_indices(self, children):
+        super()._update_many_indices(children)
+        self._intervals.update_many(
+            [child._key for child in children], [child.interval for child in children]
+        )
+
+    def _remove_from_indices(self, children):
+        super()._remove_from_indices(children)
+        self._intervals.remove_many([child._key for child in children])
+
+    def _clear_indices(self):
+        super()._clear_indices()
+        self._intervals.clear()
+
+    def spans_containing(self, t: float) -> list:
+        """
+        Return the spans containing the coordinate ``t``, in the order in which they
+        were created.
+
+        :param t: The coordinate along the axis of the spans.
+        """
+        return [self.children[row] for row in self._intervals.containing(t)]
+
+    def spans_overlapping(self, start: float, end: float) -> list:
+        """
+        Return the spans overlapping the range ``[start, end]``, in the order in
+        which they were created.
+
+        :param start: The start of the range along the axis of the spans.
+        :param end: The end of the range along the axis of the spans.
+        """
+        return [self.children[row] for row in self._intervals.overlapping(start, end)]
+
+    def count_containing(self, t: float | np.ndarray) -> int | np.ndarray:
+        """
+        Return the number of spans containing each of the coordinates ``t``.
+
+        :param t: A coordinate or an array of coordinates along the axis of the
+            spans.
+        """
+        return self._intervals.count_containing(t)
+
+    def count_overlapping(
+        self, start: float | np.ndarray, end: float | np.ndarray
+    ) -> int | np.ndarray:
+        """
+        Return the number of spans overlapping each of the ranges ``[start, end]``.
+
+        :param start: The start(s) of the range(s) along the axis of the spans.
+        :param end: The end(s) of the range(s) along the axis of the spans.
+        """
+        return self._intervals.count_overlapping(start, end)
+
+    def overlaps(
+        self, start: float | np.ndarray, end: float | np.ndarray
+    ) -> bool | np.ndarray:
+        """
+        Return `True` for each range ``[start, end]`` which overlaps an existing
+        span.
+
+        :param start: The start(s) of the range(s) along the axis of the spans.
+        :param end: The end(s) of the range(s) along the axis of the spans.
+        """
+        return self.count_overlapping(start, end) > 0
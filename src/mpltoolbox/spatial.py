@@ -0,0 +1,341 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) Scipp contributors (https://github.com/scipp)
+
+from collections.abc import Hashable
+
+import numpy as np
+
+from .utils import segment_distances
+
+
+class RowIndex:
+    """
+    Base class for indices that store a fixed number of values per child of a tool.
+
+    The values are stored as rows of a single growable array, in the same order as
+    the children were added. Updating a child only rewrites its row, and queries
+    implemented by subclasses are vectorized over all rows so that they remain
+    cheap for thousands of children.
+    """
+
+    _ncols = 1
+
+    def __init__(self, capacity: int = 16, dtype: np.dtype | str = float):
+        self._data = np.empty((capacity, self._ncols), dtype=dtype)
+        self._keys: list[Hashable] = []
+        self._rows: dict[Hashable, int] | None = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._row_lookup()
+
+    @property
+    def keys(self) -> list[Hashable]:
+        return self._keys
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        The values of all entries, as a read-only ``(n, ncols)`` view.
+        """
+        view = self._data[: len(self._keys)]
+        view.flags.writeable = False
+        return view
+
+    def _row_lookup(self) -> dict[Hashable, int]:
+        # The lookup table is rebuilt lazily after removals, so that removing many
+        # entries in a row only pays for a single rebuild.
+        if self._rows is None:
+            self._rows = {key: i for i, key in enumerate(self._keys)}
+        return self._rows
+
+    def _changed(self):
+        # Hook for subclasses that cache data derived from the rows
+        return
+
+    def row(self, key: Hashable) -> int:
+        return self._row_lookup()[key]
+
+    def add(self, key: Hashable, values: tuple[float, ...]):
+        n = len(self._keys)
+        if n == len(self._data):
+            data = np.empty((2 * len(self._data), self._ncols), dtype=self._data.dtype)
+            data[:n] = self._data[:n]
+            self._data = data
+        self._data[n] = values
+        self._keys.append(key)
+        if self._rows is not None:
+            self._rows[key] = n
+        self._changed()
+
+    def update(self, key: Hashable, values: tuple[float, ...]):
+        self._data[self.row(key)] = values
+        self._changed()
+
+    def update_many(self, keys: list[Hashable], values: np.ndarray):
+        """
+        Update several entries at once, notifying subclasses of the change only once.
+        """
+        lookup = self._row_lookup()
+        self._data[[lookup[key] for key in keys]] = values
+        self._changed()
+
+    def remove(self, key: Hashable):
+        row = self.row(key)
+        n = len(self._keys)
+        self._data[row : n - 1] = self._data[row + 1 : n]
+        del self._keys[row]
+        if row == n - 1:
+            del self._rows[key]
+        else:
+            # Rows after the removed one have shifted
+            self._rows = None
+        self._changed()
+
+    def remove_many(self, keys: list[Hashable]):
+        """
+        Remove several entries at once, compacting the remaining rows in one pass.
+        """
+        lookup = self._row_lookup()
+        n = len(self._keys)
+        keep = np.ones(n, dtype=bool)
+        keep[[lookup[key] for key in keys]] = False
+        self._data[: np.count_nonzero(keep)] = self._data[:n][keep]
+        self._keys = [key for key, k in zip(self._keys, keep, strict=True) if k]
+        self._rows = None
+        self._changed()
+
+    def clear(self):
+        self._keys.clear()
+        self._rows = {}
+        self._changed()
+
+
+class BoxIndex(RowIndex):
+    """
+    A spatial index holding the data-space bounding box of every child of a tool,
+    stored as rows ``(xmin, ymin, xmax, ymax)``.
+
+    Boxes may be unbounded in one direction (e.g. spans), using ``-inf`` and
+    ``inf`` as limits.
+    """
+
+    _ncols = 4
+
+    @property
+    def boxes(self) -> np.ndarray:
+        """
+        The bounding boxes of all entries, as a read-only ``(n, 4)`` view.
+        """
+        return self.values
+
+    def query_point(
+        self, x: float, y: float, xtol: float = 0.0, ytol: float = 0.0
+    ) -> np.ndarray:
+        """
+        Return the rows whose box, grown by the given tolerances, contains the point
+        ``(x, y)``.
+        """
+        boxes = self._data[: len(self._keys)]
+        mask = (
+            (boxes[:, 0] - xtol <= x)
+            & (boxes[:, 2] + xtol >= x)
+            & (boxes[:, 1] - ytol <= y)
+            & (boxes[:, 3] + ytol >= y)
+        )
+        return np.flatnonzero(mask)
+
+    def query_box(
+        self, xmin: float, ymin: float, xmax: float, ymax: float
+    ) -> np.ndarray:
+        """
+        Return the rows whose box intersects the box ``(xmin, ymin, xmax, ymax)``.
+        """
+        boxes = self._data[: len(self._keys)]
+        mask = (
+            (boxes[:, 0] <= xmax)
+            & (boxes[:, 2] >= xmin)
+            & (boxes[:, 1] <= ymax)
+            & (boxes[:, 3] >= ymin)
+        )
+        return np.flatnonzero(mask)
+
+    def distances(self, x: float, y: float) -> np.ndarray:
+        """
+        Return the distance from the point ``(x, y)`` to every box, which is zero
+        for boxes containing the point.
+        """
+        boxes = self._data[: len(self._keys)]
+        dx = np.maximum(np.maximum(boxes[:, 0] - x, x - boxes[:, 2]), 0.0)
+        dy = np.maximum(np.maximum(boxes[:, 1] - y, y - boxes[:, 3]), 0.0)
+        return np.hypot(dx, dy)
+
+    def nearest(self, x: float, y: float, k: int = 1) -> np.ndarray:
+        """
+        Return the rows of the ``k`` boxes closest to the point ``(x, y)``, sorted by
+        increasing distance.
+        """
+        dist = self.distances(x, y)
+        k = min(k, len(dist))
+        if k <= 0:
+            return np.empty(0, dtype=int)
+        rows = np.argpartition(dist, k - 1)[:k]
+        return rows[np.argsort(dist[rows], kind="stable")]
+
+
+class IntervalIndex(RowIndex):
+    """
+    An index of closed intervals ``[lo, hi]``, one per child of a tool, answering
+    stabbing and overlap queries.
+
+    Sorted copies of the interval endpoints are built lazily on the first query
+    after a change, so that a sequence of edits only pays for a single sort.
+    Counting queries are then fully vectorized binary searches, and listing
+    queries only scan the intervals whose start lies within one maximum interval
+    length of the query.
+    """
+
+    _ncols = 2
+
+    def __init__(self, capacity: int = 16):
+        super().__init__(capacity=capacity)
+        self._sorted = None
+
+    def _changed(self):
+        self._sorted = None
+
+    def _sorted_endpoints(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+        if self._sorted is None:
+            data = self._data[: len(self._keys)]
+            order = np.argsort(data[:, 0], kind="stable")
+            maxlen = float((data[:, 1] - data[:, 0]).max()) if len(data) else 0.0
+            self._sorted = (order, data[order, 0], np.sort(data[:, 1]), maxlen)
+        return self._sorted
+
+    def count_containing(self, t: float | np.ndarray) -> int | np.ndarray:
+        """
+        Return the number of intervals containing ``t``, for every value of ``t``.
+        """
+        _, lo, hi, _ = self._sorted_endpoints()
+        return np.searchsorted(lo, t, side="right") - np.searchsorted(
+            hi, t, side="left"
+        )
+
+    def count_overlapping(
+        self, start: float | np.ndarray, end: float | np.ndarray
+    ) -> int | np.ndarray:
+        """
+        Return the number of intervals overlapping ``[start, end]``, for every pair
+        of ``start`` and ``end``.
+        """
+        _, lo, hi, _ = self._sorted_endpoints()
+        return np.searchsorted(lo, end, side="right") - np.searchsorted(
+            hi, start, side="left"
+        )
+
+    def containing(self, t: float) -> np.ndarray:
+        """
+        Return the rows of the intervals containing ``t``, in increasing row order.
+        """
+        return self.overlapping(t, t)
+
+    def overlapping(self, start: float, end: float) -> np.ndarray:
+        """
+        Return the rows of the intervals overlapping ``[start, end]``, in increasing
+        row order.
+        """
+        order, lo, _, maxlen = self._sorted_endpoints()
+        # Only intervals starting in [start - maxlen, end] can overlap
+        first = np.searchsorted(lo, start - maxlen, side="left")
+        last = np.searchsorted(lo, end, side="right")
+        rows = order[first:last]
+        return np.sort(rows[self._data[rows, 1] >= start])
+
+
+class SegmentIndex:
+    """
+    A bounding-volume hierarchy over the segments of a polyline, used to find the
+    vertices and segments close to a position without testing all of them.
+
+    Level 0 holds the bounding box of every segment, and each following level holds
+    the boxes enclosing pairs of consecutive boxes of the level below. Since
+    consecutive segments of a polyline are close to each other, this gives a
+    hierarchy in which a query only descends into a few branches.
+
+    :param vertices: The ``(n, 2)`` positions of the vertices of the polyline.
+    """
+
+    def __init__(self, vertices: np.ndarray):
+        self._vertices = np.array(vertices, dtype=float).reshape(-1, 2)
+        start = self._vertices[:-1]
+        end = self._vertices[1:]
+        boxes = np.concatenate([np.minimum(start, end), np.maximum(start, end)], axis=1)
+        self._levels = [boxes]
+        while len(boxes) > 1:
+            if len(boxes) % 2:
+                boxes = np.concatenate([boxes, boxes[-1:]])
+            boxes = np.concatenate(
+                [
+                    np.minimum(boxes[0::2, :2], boxes[1::2, :2]),
+                    np.maximum(boxes[0::2, 2:], boxes[1::2, 2:]),
+                ],
+                axis=1,
+            )
+            self._levels.append(boxes)
+
+    def __len__(self) -> int:
+        return len(self._vertices)
+
+    def update_vertex(self, ind: int, position: tuple[float, float]):
+        """
+        Move a single vertex, updating only the boxes of the two adjacent segments
+        and their ancestors.
+        """
+        self._vertices[ind] = position
+        if not len(self._levels[0]):
+            return
+        segments = {max(ind - 1, 0), min(ind, len(self._levels[0]) - 1)}
+        for seg in segments:
+            pts = self._vertices[seg : seg + 2]
+            self._levels[0][seg] = (*pts.min(axis=0), *pts.max(axis=0))
+            node = seg
+            for lower, upper in zip(self._levels[:-1], self._levels[1:], strict=True):
+                node //= 2
+                pair = lower[2 * node : 2 * node + 2]
+                upper[node] = (*pair[:, :2].min(axis=0), *pair[:, 2:].max(axis=0))
+
+    def query(
+        self, point: tuple[float, float], radius: float, segments: bool = True
+    ) -> np.ndarray:
+        """
+        Return the indices of the vertices within ``radius`` of ``point``, followed
+        by the indices of the first vertex of the segments within ``radius`` of
+        ``point`` if ``segments`` is `True`.
+        """
+        x, y = point
+        if len(self._vertices) < 2:
+            dist = np.hypot(*(self._vertices - point).T)
+            return np.flatnonzero(dist <= radius)
+        nodes = np.zeros(1, dtype=int)
+        for level in reversed(self._levels):
+            if len(nodes) and level is not self._levels[-1]:
+                nodes = np.stack([2 * nodes, 2 * nodes + 1], axis=1).ravel()
+                nodes = nodes[nodes < len(level)]
+            boxes = level[nodes]
+            nodes = nodes[
+                (boxes[:, 0] - radius <= x)
+                & (boxes[:, 2] + radius >= x)
+                & (boxes[:, 1] - radius <= y)
+                & (boxes[:, 3] + radius >= y)
+            ]
+        candidates = np.unique(np.concatenate([nodes, nodes + 1]))
+        dist = np.hypot(*(self._vertices[candidates] - point).T)
+        hits = candidates[dist <= radius]
+        if segments:
+            dist = segment_distances(
+                self._vertices[nodes], self._vertices[nodes + 1], point
+            )
+            hits = np.concatenate([hits, nodes[dist <= radius]])
+        return hits
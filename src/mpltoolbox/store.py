@@ -0,0 +1,386 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) Scipp contributors (https://github.com/scipp)
+
+from collections.abc import Hashable
+
+import numpy as np
+
+from .spatial import RowIndex
+from .utils import Child
+
+
+class GeometryStore(RowIndex):
+    """
+    Columnar storage of the geometry of the children of a tool, with one named
+    column per geometric parameter (e.g. ``x``, ``y``, ``width`` and ``height`` for
+    rectangles), and one row per child in the order of ``tool.children``.
+
+    The storage can be shared with snapshots, in which case it is copied before
+    the first write to the rows of existing children. Adding children only writes
+    past the rows seen by the snapshots, and does not copy.
+
+    :param fields: The names of the columns.
+    :param capacity: The number of rows to allocate initially.
+    :param dtype: The type of the stored values, e.g. ``float32`` to halve the
+        memory used by the store.
+    """
+
+    def __init__(
+        self,
+        fields: tuple[str, ...],
+        capacity: int = 16,
+        dtype: np.dtype | str = float,
+    ):
+        self._ncols = len(fields)
+        self.fields = tuple(fields)
+        self._shared = False
+        super().__init__(capacity=capacity, dtype=dtype)
+
+    def _own(self):
+        # Copy the storage shared with snapshots before writing to it
+        if self._shared:
+            self._data = self._data.copy()
+            self._keys = list(self._keys)
+            self._shared = False
+
+    def update(self, key: Hashable, values: tuple[float, ...]):
+        self._own()
+        super().update(key, values)
+
+    def update_many(self, keys: list[Hashable], values: np.ndarray):
+        self._own()
+        super().update_many(keys, values)
+
+    def remove(self, key: Hashable):
+        self._own()
+        super().remove(key)
+
+    def remove_many(self, keys: list[Hashable]):
+        self._own()
+        super().remove_many(keys)
+
+    def clear(self):
+        if self._shared:
+            self._data = np.empty_like(self._data)
+            self._keys = []
+            self._shared = False
+        super().clear()
+
+    def snapshot(self) -> tuple[list[Hashable], dict[str, np.ndarray]]:
+        """
+        Return the keys and the columns of the current rows, sharing the storage
+        until the next write to these rows. Only the first ``len(self)`` keys of the
+        returned list are part of the snapshot.
+        """
+        self._shared = True
+        return self._keys, self.to_arrays()
+
+    def to_arrays(self) -> dict[str, np.ndarray]:
+        """
+        Return one read-only view of the internal storage per column.
+        """
+        data = self.values
+        return {field: data[:, i] for i, field in enumerate(self.fields)}
+
+
+class RaggedStore:
+    """
+    Storage of the vertices of children with a variable number of vertices (lines
+    and polygons), as one flat ``(total_vertices, 2)`` buffer. The vertices of child
+    ``i`` are found in rows ``offsets[i]`` to ``offsets[i + 1]``, with children in
+    the order of ``tool.children``.
+
+    Changing the vertices of a child without changing their number overwrites its
+    rows in place. Adding vertices to the last child (as happens while it is being
+    created) only grows the end of the buffer.
+
+    Like :class:`GeometryStore`, the buffers can be shared with snapshots, and are
+    copied before the vertices of existing children are overwritten.
+
+    :param capacity: The number of vertices to allocate initially.
+    :param dtype: The type of the stored coordinates, e.g. ``float32`` to halve the
+        memory used by the store.
+    """
+
+    def __init__(self, capacity: int = 64, dtype: np.dtype | str = float):
+        self._vertices = np.empty((capacity, 2), dtype=dtype)
+        self._offsets = np.zeros(17, dtype=np.intp)
+        self._keys: list[Hashable] = []
+        self._rows: dict[Hashable, int] | None = {}
+        self._shared = False
+
+    def _own(self):
+        if self._shared:
+            self._vertices = self._vertices.copy()
+            self._offsets = self._offsets.copy()
+            self._keys = list(self._keys)
+            self._shared = False
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    @property
+    def keys(self) -> list[Hashable]:
+        return self._keys
+
+    @property
+    def _total(self) -> int:
+        return int(self._offsets[len(self._keys)])
+
+    def _row_lookup(self) -> dict[Hashable, int]:
+        if self._rows is None:
+            self._rows = {key: i for i, key in enumerate(self._keys)}
+        return self._rows
+
+    def _reserve(self, nvertices: int, nchildren: int):
+        if nvertices > len(self._vertices):
+            vertices = np.empty(
+                (max(nvertices, 2 * len(self._vertices)), 2),
+                dtype=self._vertices.dtype,
+            )
+            vertices[: self._total] = self._vertices[: self._total]
+            self._vertices = vertices
+        if nchildren + 1 > len(self._offsets):
+            offsets = np.zeros(max(nchildren + 1, 2 * len(self._offsets)), np.intp)
+            offsets[: len(self._keys) + 1] = self._offsets[: len(self._keys) + 1]
+            self._offsets = offsets
+
+    def add(self, key: Hashable, x: np.ndarray, y: np.ndarray):
+        total = self._total
+        n = len(self._keys)
+        self._reserve(total + len(x), n + 1)
+        self._vertices[total : total + len(x), 0] = x
+        self._vertices[total : total + len(x), 1] = y
+        self._offsets[n + 1] = total + len(x)
+        self._keys.append(key)
+        if self._rows is not None:
+            self._rows[key] = n
+
+    def update_rows(
+        self, key: Hashable, rows: int | list[int], x: np.ndarray, y: np.ndarray
+    ):
+        """
+        Overwrite only the given rows of the vertices of a child, whose number of
+        vertices did not change.
+        """
+        self._own()
+        start = self._offsets[self._row_lookup()[key]]
+        self._vertices[start + np.asarray(rows), 0] = x[rows]
+        self._vertices[start + np.asarray(rows), 1] = y[rows]
+
+    def update(self, key: Hashable, x: np.ndarray, y: np.ndarray):
+        self._own()
+        row = self._row_lookup()[key]
+        start, stop = self._offsets[row : row + 2]
+        delta = len(x) - (stop - start)
+        if delta:
+            # Shift the vertices of the following children
+            total = self._total
+            self._reserve(total + delta, len(self._keys))
+            self._vertices[stop + delta : total + delta] = self._vertices[stop:total]
+            self._offsets[row + 1 : len(self._keys) + 1] += delta
+        self._vertices[start : start + len(x), 0] = x
+        self._vertices[start : start + len(x), 1] = y
+
+    def remove_many(self, keys: list[Hashable]):
+        self._own()
+        lookup = self._row_lookup()
+        n = len(self._keys)
+        keep = np.ones(n, dtype=bool)
+        keep[[lookup[key] for key in keys]] = False
+        counts = np.diff(self._offsets[: n + 1])
+        vertices = self._vertices[: self._total][np.repeat(keep, counts)]
+        self._vertices[: len(vertices)] = vertices
+        self._offsets[1 : np.count_nonzero(keep) + 1] = np.cumsum(counts[keep])
+        self._keys = [key for key, k in zip(self._keys, keep, strict=True) if k]
+        self._rows = None
+
+    def clear(self):
+        if self._shared:
+            self._vertices = np.empty_like(self._vertices)
+            self._offsets = np.zeros_like(self._offsets)
+            self._keys = []
+            self._shared = False
+        self._keys.clear()
+        self._rows = {}
+
+    def snapshot(self) -> tuple[list[Hashable], dict[str, np.ndarray]]:
+        """
+        Return the keys, the coordinates and the offsets of the current children,
+        sharing the buffers until the next write to their vertices.
+        """
+        self._shared = True
+        return self._keys, self.to_arrays()
+
+    def to_arrays(self) -> dict[str, np.ndarray]:
+        """
+        Return read-only views of the ``x`` and ``y`` coordinates of all vertices
+        and of the ``offsets`` of the children.
+        """
+        vertices = self._vertices[: self._total]
+        offsets = self._offsets[: len(self._keys) + 1]
+        vertices.flags.writeable = False
+        offsets.flags.writeable = False
+        return {
+            "x": vertices[:, 0],
+            "y": vertices[:, 1],
+            "offsets": offsets,
+        }
+
+    def vertex_counts(self) -> np.ndarray:
+        return np.diff(self._offsets[: len(self._keys) + 1])
+
+    def bounding_boxes(self) -> np.ndarray:
+        """
+        Return the ``(xmin, ymin, xmax, ymax)`` bounding box of every child.
+        """
+        if not self._keys:
+            return np.empty((0, 4))
+        vertices = self._vertices[: self._total]
+        starts = self._offsets[: len(self._keys)]
+        return np.concatenate(
+            [
+                np.minimum.reduceat(vertices, starts, axis=0),
+                np.maximum.reduceat(vertices, starts, axis=0),
+            ],
+            axis=1,
+        )
+
+    def areas(self) -> np.ndarray:
+        """
+        Return the area enclosed by the vertices of every child, using the shoelace
+        formula with each child implicitly closed.
+        """
+        if not self._keys:
+            return np.empty(0)
+        x, y = self._vertices[: self._total].astype(float, copy=False).T
+        starts = self._offsets[: len(self._keys)]
+        # Index of the next vertex, wrapping around to the first vertex of the child
+        following = np.arange(1, len(x) + 1)
+        following[self._offsets[1 : len(self._keys) + 1] - 1] = starts
+        cross = x * y[following] - x[following] * y
+        return 0.5 * np.abs(np.add.reduceat(cross, starts))
+
+    def lengths(self) -> np.ndarray:
+        """
+        Return the length of the path going through the vertices of every child.
+        """
+        if not self._keys:
+            return np.empty(0)
+        vertices = self._vertices[: self._total].astype(float, copy=False)
+        segments = np.zeros(len(vertices))
+        segments[:-1] = np.hypot(*np.diff(vertices, axis=0).T)
+        # Discard the segments joining the last vertex of a child to the next child
+        segments[self._offsets[1 : len(self._keys) + 1] - 1] = 0.0
+        return np.add.reduceat(segments, self._offsets[: len(self._keys)])
+
+
+class VertexBuffer:
+    """
+    Growable storage for the vertices of a single line or polygon, as the first
+    rows of an ``(capacity, 2)`` array. The capacity doubles when the buffer is
+    full, so that adding vertices one at a time takes amortized constant time, and
+    moving a vertex only writes its row.
+
+    :param x: The x coordinates of the initial vertices.
+    :param y: The y coordinates of the initial vertices.
+    :param capacity: The number of vertices to allocate initially.
+    """
+
+    def __init__(self, x: np.ndarray, y: np.ndarray, capacity: int = 8):
+        self._data = np.empty((capacity, 2), dtype=float)
+        self._size = 0
+        self.set(x, y)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def vertices(self) -> np.ndarray:
+        """
+        The ``(n, 2)`` positions of the vertices, as a view of the buffer.
+        """
+        return self._data[: self._size]
+
+    @property
+    def x(self) -> np.ndarray:
+        return self._data[: self._size, 0]
+
+    @property
+    def y(self) -> np.ndarray:
+        return self._data[: self._size, 1]
+
+    def _reserve(self, size: int):
+        if size > len(self._data):
+            data = np.empty((max(size, 2 * len(self._data)), 2), dtype=float)
+            data[: self._size] = self._data[: self._size]
+            self._data = data
+
+    def set(self, x: np.ndarray, y: np.ndarray):
+        """
+        Replace all the vertices.
+        """
+        x = np.atleast_1d(np.asarray(x, dtype=float))
+        y = np.atleast_1d(np.asarray(y, dtype=float))
+        self._reserve(len(x))
+        self._data[: len(x), 0] = x
+        self._data[: len(y), 1] = y
+        self._size = len(x)
+
+    def append(self, x: float, y: float):
+        self._reserve(self._size + 1)
+        self._data[self._size] = (x, y)
+        self._size += 1
+
+    def set_vertex(self, ind: int | list[int], x: float | None, y: float | None):
+        """
+        Move the vertex (or vertices) at ``ind``. A coordinate given as `None` is
+        left unchanged.
+        """
+        vertices = self._data[: self._size]
+        if x is not None:
+            vertices[ind, 0] = x
+        if y is not None:
+            vertices[ind, 1] = y
+
+
+class VertexChild(Child):
+    """
+    A child whose vertices are edited in a :class:`VertexBuffer`. The buffer is
+    rebuilt from the vertices returned by ``_get_vertices`` if the coordinates were
+    set separately, which is signalled by setting ``_buffer`` to `None`.
+
+    The bounding box of the vertices is cached, and is reset by setting ``_bbox``
+    to `None` when the vertices are replaced. Moving single vertices with
+    :meth:`_vertices_moved` only recomputes it when a vertex leaves its bounds.
+    """
+
+    __slots__ = ("_bbox", "_buffer")
+
+    def _get_buffer(self) -> VertexBuffer:
+        if self._buffer is None:
+            self._buffer = VertexBuffer(*self._get_vertices())
+        return self._buffer
+
+    @property
+    def bbox(self) -> tuple[float, float, float, float]:
+        if self._bbox is None:
+            x, y = self._get_vertices()
+            self._bbox = (np.min(x), np.min(y), np.max(x), np.max(y))
+        return self._bbox
+
+    def _vertices_moved(self, rows: int | list[int], old: np.ndarray):
+        # The vertices in rows of the buffer were moved from the positions old. The
+        # bounding box grows to include their new positions, and is only recomputed
+        # if one of them was on its bounds. The tool updates only these rows.
+        if self._bbox is not None:
+            xmin, ymin, xmax, ymax = self._bbox
+            if np.any(old == (xmin, ymin)) or np.any(old == (xmax, ymax)):
+                self._bbox = None
+            else:
+                new = np.atleast_2d(self._buffer.vertices[rows])
+                lower = np.minimum((xmin, ymin), new.min(axis=0))
+                upper = np.maximum((xmax, ymax), new.max(axis=0))
+                self._bbox = (lower[0], lower[1], upper[0], upper[1])
+        if self._on_geometry_change is not None:
+            self._on_geometry_change(self, rows)
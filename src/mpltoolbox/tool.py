@@ -1,14 +1,30 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) Scipp contributors (https://github.com/scipp)
 
-from collections.abc import Callable
-from functools import partial
+import sys
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from typing import Any
 
+import numpy as np
 from matplotlib.backend_bases import Event
-from matplotlib.pyplot import Axes
+from matplotlib.backend_tools import Cursors
+from matplotlib.pyplot import Artist, Axes
 
+from .batch import Batch
+from .delivery import Background, BackgroundCallback, Delivery, TimedCallback
 from .event import DummyEvent
+from .history import Edit, History
+from .selection import RubberBand
+from .snapshot import Snapshot
+from .spatial import BoxIndex, RowIndex
+from .store import GeometryStore
+from .utils import (
+    WeakCallback,
+    add_artists,
+    get_parent,
+    remove_artists,
+)
 
 
 class Tool:
@@ -28,6 +44,14 @@ class Tool:
     :param on_drag_press: A function to be called when an artist is dragged.
     :param on_drag_move: A function to be called when an artist is moved.
     :param on_drag_release: A function to be called when an artist is released.
+    :param on_evict: A function to be called with the list of children evicted by
+        the retention policy (see ``max_children`` and ``window``).
+    :param on_create_batch: A function to be called with the list of children
+        created by a single event or :meth:`batch`, and the array of their ids.
+    :param on_remove_batch: A function to be called with the list of children
+        removed by a single event or :meth:`batch`, and the array of their ids.
+    :param on_change_batch: A function to be called with the list of children
+        changed by a single event or :meth:`batch`, and the array of their ids.
     :param enable_drag: If `True`, dragging the artists is enabled.
         If `'xonly'` or `'yonly'`, dragging is restricted to the x or y direction,
         respectively. If `False`, dragging is disabled.
@@ -35,9 +59,52 @@ class Tool:
     :param enable_vertex_move: If `True`, moving the vertices of the artists is
         enabled. If `'xonly'` or `'yonly'`, moving is restricted to the x or y
         direction, respectively. If `False`, moving vertices is disabled.
+    :param enable_hover: If `True`, the artist under the mouse cursor is highlighted
+        and the cursor changes shape over vertices and draggable artists.
+    :param enable_select: If `True` or `'box'`, holding shift while dragging with
+        the left mouse button selects all the artists intersecting the drawn box.
+        If `'lasso'`, the selection is drawn free-hand and selects the artists whose
+        center is inside it. Selected artists are dragged and removed together. If
+        `False` (the default), selecting is disabled.
+    :param geometry_dtype: The type of the arrays in which the tool stores the
+        geometry of its children, as returned by :meth:`to_arrays`. Use
+        ``'float32'`` to halve their memory. The artists on the figure always use
+        double precision.
+    :param max_children: If set, the oldest children are evicted when more children
+        are added. Children are evicted a few at a time, so that the tool holds
+        slightly fewer children than this after an eviction.
+    :param window: If set, the children lying entirely to the left of the
+        rightmost child minus ``window``, in data coordinates along x, are evicted
+        when children are added. For horizontal spans, the window runs along y
+        instead, and the children lying entirely below the topmost child minus
+        ``window`` are evicted.
+    :param undo_memory: The memory, in bytes, available to record the creation,
+        removal and changes of children for :meth:`undo` and :meth:`redo`. The
+        oldest operations are forgotten beyond this limit. Undo is disabled by
+        default, with ``0``.
+    :param child_ids: ``'uuid'`` to give every child a unique string id, generated
+        when the id is first read, or ``'int'`` to number the children of the tool
+        with increasing integers, which are never reused.
     :param kwargs: Additional keyword arguments for the artist constructor.
+
+    The callbacks of single children (``on_create``, ``on_remove``, ``on_change``,
+    and the vertex and drag callbacks) are always called once per child, whether
+    the child was changed with the mouse or by a bulk operation such as
+    :meth:`add_many`, :meth:`remove_many`, :meth:`set_geometry`, :meth:`undo` or a
+    :meth:`batch`. The batched callbacks (``on_create_batch``, ``on_remove_batch``
+    and ``on_change_batch``) are called once per operation instead, with the list
+    of all the children it affected and the array of their ids. ``on_evict`` is
+    called once per eviction with the list of evicted children.
+
+    A tool can be used as a context manager, which calls :meth:`close` on exit.
     """
 
+    _pickradius = 5.0
+    # Evictions remove 1/16 of max_children more than needed, and up to 64 evicted
+    # children are kept for reuse
+    _evict_batch = 16
+    _max_pooled = 64
+
     def __init__(
         self,
         ax: Axes,
@@ -53,9 +120,20 @@ class Tool:
         on_drag_press: Callable | None = None,
         on_drag_move: Callable | None = None,
         on_drag_release: Callable | None = None,
+        on_evict: Callable | None = None,
+        on_create_batch: Callable | None = None,
+        on_remove_batch: Callable | None = None,
+        on_change_batch: Callable | None = None,
         enable_drag: bool | str = True,
         enable_remove: bool | str = True,
         enable_vertex_move: bool | str = True,
+        enable_hover: bool = False,
+        enable_select: bool | str = False,
+        geometry_dtype: np.dtype | str = float,
+        undo_memory: int = 0,
+        child_ids: str = "uuid",
+        max_children: int | None = None,
+        window: float | None = None,
         **kwargs,
     ):
         self._ax = ax
@@ -65,6 +143,8 @@ class Tool:
         self._enable_drag = enable_drag
         self._enable_remove = enable_remove
         self._enable_vertex_move = enable_vertex_move
+        self._enable_hover = enable_hover
+        self._enable_select = enable_select
 
         self._on_create = []
         self._on_remove = []
@@ -75,6 +155,12 @@ class Tool:
         self._on_drag_press = []
         self._on_drag_move = []
         self._on_drag_release = []
+        self._on_evict = []
+        self._on_create_batch = []
+        self._on_remove_batch = []
+        self._on_change_batch = []
+        # The callbacks called with a throttle, a debounce or in the background
+        self._timed_callbacks = []
 
         self.on_create(on_create)
         self.on_remove(on_remove)
@@ -85,48 +171,131 @@ class Tool:
         self.on_drag_press(on_drag_press)
         self.on_drag_move(on_drag_move)
         self.on_drag_release(on_drag_release)
+        self.on_evict(on_evict)
+        self.on_create_batch(on_create_batch)
+        self.on_remove_batch(on_remove_batch)
+        self.on_change_batch(on_change_batch)
 
         self._kwargs = kwargs
         self._owner_counter = 0
+        self._child_ids = child_ids
+        self._next_id = 0
 
         self._spawner = spawner
         self.children = []
+        # The children notify the tool of their changes through a weak reference,
+        # so that the artists left on the figure do not keep the tool alive
+        self._geometry_callback = WeakCallback(self._update_indices)
         self._drag_patch = False
         self._grabbed_child = None
         self._grab_mouse_origin = None
         self._grabbed_artist_origin = None
         self._pick_lock = False
+        # Set when a click was used to make the handles of an adopted child, so
+        # that it does not also start a new child
+        self._press_consumed = False
         self._nclicks = 0
+        self._index = BoxIndex()
+        # The version of the tool is increased by every change to its children, and
+        # the version at which each child last changed is kept in the same order as
+        # the children
+        self._version = 0
+        self._versions = RowIndex(dtype=np.int64)
+        # Children with a fixed number of geometric parameters are mirrored in a
+        # columnar store, which can be exported without copies
+        fields = getattr(spawner, "_geometry_fields", None)
+        self._geometry = GeometryStore(fields, dtype=geometry_dtype) if fields else None
+        self._hovered = None
+        self._cursor = None
+        self._selected = {}
+        self._rubber_band = None
+        self._grabbed_group = []
+        self._closed = False
+        self._max_children = max_children
+        self._window = window
+        # Children evicted by the retention policy, whose artists are reused for new
+        # children
+        self._pool = []
+        self._history = History(undo_memory) if undo_memory > 0 else None
+        self._vertex_origin = None
+        self._grab_offset = (0.0, 0.0)
+        # While snapshots are alive, the children that are created, changed or
+        # removed are logged in one dict per interval between two snapshots
+        self._epoch = 0
+        self._changes_start = 0
+        self._live_snapshots = set()
+        self._changes = []
+        self._removed_ids = {}
 
+        if child_ids not in ("uuid", "int"):
+            raise ValueError(
+                f"Unknown child_ids '{child_ids}', expected 'uuid' or 'int'."
+            )
+        if max_children is not None and max_children < 1:
+            raise ValueError("max_children must be at least 1.")
+        if window is not None and window <= 0:
+            raise ValueError("window must be positive.")
         if autostart:
             self.start()
 
     def __del__(self):
-        self.shutdown()
+        # Only release the figure resources: drawing during garbage collection may
+        # happen at any time, e.g. while the figure itself is being closed. At
+        # interpreter exit, the figure is going away anyway.
+        if not sys.is_finalizing():
+            self._release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
 
     def on_create(self, func: Callable):
         if func is not None:
             self._on_create.append(func)
 
     def call_on_create(self, event: Event):
+        if self._defer("create", event):
+            return
         for func in self._on_create:
             func(event)
+        self._call_batch(self._on_create_batch, event)
 
     def on_remove(self, func: Callable):
         if func is not None:
             self._on_remove.append(func)
 
     def call_on_remove(self, event: Event):
+        if self._defer("remove", event):
+            return
         for func in self._on_remove:
             func(event)
+        self._call_batch(self._on_remove_batch, event)
+
+    def on_change(
+        self, func: Callable, delivery: str | Delivery | Background = "immediate"
+    ):
+        """
+        Register a function to be called when a child is changed.
 
-    def on_change(self, func: Callable):
+        :param func: The function, called with the child.
+        :param delivery: ``'immediate'`` to call the function on every change, or a
+            policy made with :func:`throttle` or :func:`debounce` to call it less
+            often with the latest state of the children, e.g. while a child is
+            dragged. Pending calls are made when the mouse button is released.
+            With :func:`background`, the function runs in an executor and its
+            results are passed back on the GUI thread.
+        """
         if func is not None:
-            self._on_change.append(func)
+            self._on_change.append(self._timed(func, delivery))
 
     def call_on_change(self, event: Event):
+        if self._defer("change", event):
+            return
         for func in self._on_change:
             func(event)
+        self._call_batch(self._on_change_batch, event)
 
     def on_vertex_press(self, func: Callable):
         if func is not None:
@@ -136,9 +305,17 @@ class Tool:
         for func in self._on_vertex_press:
             func(event)
 
-    def on_vertex_move(self, func: Callable):
+    def on_vertex_move(
+        self, func: Callable, delivery: str | Delivery | Background = "immediate"
+    ):
+        """
+        Register a function to be called when a vertex is moved.
+
+        :param func: The function, called with the child.
+        :param delivery: How the function is called, as in :meth:`on_change`.
+        """
         if func is not None:
-            self._on_vertex_move.append(func)
+            self._on_vertex_move.append(self._timed(func, delivery))
 
     def call_on_vertex_move(self, event: Event):
         for func in self._on_vertex_move:
@@ -160,9 +337,17 @@ class Tool:
         for func in self._on_drag_press:
             func(event)
 
-    def on_drag_move(self, func: Callable):
+    def on_drag_move(
+        self, func: Callable, delivery: str | Delivery | Background = "immediate"
+    ):
+        """
+        Register a function to be called when a child is dragged.
+
+        :param func: The function, called with the child.
+        :param delivery: How the function is called, as in :meth:`on_change`.
+        """
         if func is not None:
-            self._on_drag_move.append(func)
+            self._on_drag_move.append(self._timed(func, delivery))
 
     def call_on_drag_move(self, event: Event):
         for func in self._on_drag_move:
@@ -176,6 +361,72 @@ class Tool:
         for func in self._on_drag_release:
             func(event)
 
+    def on_evict(self, func: Callable):
+        if func is not None:
+            self._on_evict.append(func)
+
+    def call_on_evict(self, event: Event):
+        for func in self._on_evict:
+            func(event)
+
+    def on_create_batch(self, func: Callable):
+        if func is not None:
+            self._on_create_batch.append(func)
+
+    def on_remove_batch(self, func: Callable):
+        if func is not None:
+            self._on_remove_batch.append(func)
+
+    def on_change_batch(
+        self, func: Callable, delivery: str | Delivery | Background = "immediate"
+    ):
+        """
+        Register a function to be called with the children changed by a single
+        event or :meth:`batch`, and the array of their ids.
+
+        :param func: The function, called with the list of children and their ids.
+        :param delivery: How the function is called, as in :meth:`on_change`. A
+            throttled or debounced function gets the latest list of children.
+        """
+        if func is not None:
+            self._on_change_batch.append(self._timed(func, delivery))
+
+    def _timed(self, func: Callable, delivery: str | Delivery | Background) -> Callable:
+        if isinstance(delivery, Delivery):
+            callback = TimedCallback(func, delivery, self._fig.canvas)
+        elif isinstance(delivery, Background):
+            callback = BackgroundCallback(func, delivery, self._fig.canvas)
+        elif delivery == "immediate":
+            return func
+        else:
+            raise ValueError(
+                f"Unknown delivery '{delivery}', expected 'immediate', or a "
+                "throttle, debounce or background policy."
+            )
+        self._timed_callbacks.append(callback)
+        return callback
+
+    def _call_batch(self, funcs: list[Callable], event: Any):
+        if not funcs:
+            return
+        children = event if isinstance(event, list) else [event]
+        if not children:
+            return
+        # The ids are only generated when a batched callback asks for them
+        ids = np.asarray([child.id for child in children])
+        for func in funcs:
+            func(children, ids)
+
+    def _call_each(self, kind: str, children: list):
+        # Call the callbacks of every child in turn, and the batched callbacks once
+        # with all the children
+        if self._defer(kind, children):
+            return
+        for func in getattr(self, f"_on_{kind}"):
+            for child in children:
+                func(child)
+        self._call_batch(getattr(self, f"_on_{kind}_batch"), children)
+
     def _parse_kwargs(self):
         parsed = {}
         for key, value in self._kwargs.items():
@@ -188,12 +439,63 @@ class Tool:
         return parsed
 
     def _draw(self):
+        batch = getattr(self._fig, "_mpltoolbox_batch", None)
+        if batch is not None:
+            batch.draw = True
+            return
         self._fig.canvas.draw_idle()
 
+    def _defer(self, kind: str, event: Any) -> bool:
+        batch = getattr(self._fig, "_mpltoolbox_batch", None)
+        if batch is None:
+            return False
+        batch.queue(self, kind, event)
+        return True
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Defer the redraws and the ``on_create``, ``on_change`` and ``on_remove``
+        callbacks until the end of a block, e.g. around a scripted sequence of
+        clicks, removals and changes to the children:
+
+        .. code-block:: python
+
+            with rects.batch():
+                rects.click(10, 10)
+                rects.click(20, 30)
+                rects.remove(0)
+
+        On exit, the figure is redrawn once, and the callbacks are called with the
+        children created, changed and removed in the block: ``on_remove``,
+        ``on_create`` and ``on_change`` once per child, and the batched callbacks,
+        such as ``on_create_batch``, once with the list of children. A child
+        created and removed in the block is not reported, and a child created and
+        then changed is only reported as created.
+
+        The batch applies to all the tools of the figure, and batches can be
+        nested, also when opened by different tools of the same figure: everything
+        is deferred until the outermost batch is closed. The other callbacks, such
+        as ``on_drag_move`` or ``on_evict``, are not deferred.
+        """
+        batch = getattr(self._fig, "_mpltoolbox_batch", None)
+        if batch is None:
+            batch = self._fig._mpltoolbox_batch = Batch()
+        batch.depth += 1
+        try:
+            yield
+        finally:
+            batch.depth -= 1
+            if batch.depth == 0:
+                del self._fig._mpltoolbox_batch
+                batch.flush(self._fig.canvas)
+
     def start(self):
         """
         Activate the tool.
         """
+        if self._closed:
+            raise RuntimeError("The tool was closed and cannot be restarted.")
         self._connections["button_press_event"] = self._fig.canvas.mpl_connect(
             "button_press_event", self._on_button_press
         )
@@ -201,6 +503,10 @@ class Tool:
             self._connections["pick_event"] = self._fig.canvas.mpl_connect(
                 "pick_event", self._on_pick
             )
+        if self._enable_hover and "hover" not in self._connections:
+            self._connections["hover"] = self._fig.canvas.mpl_connect(
+                "motion_notify_event", self._on_hover
+            )
         for child in self.children:
             child.show_vertices()
         self._draw()
@@ -211,7 +517,11 @@ class Tool:
         still possible.
         """
         self._disconnect(
-            [key for key in self._connections.keys() if key != "pick_event"]
+            [
+                key
+                for key in self._connections.keys()
+                if key not in ("pick_event", "hover")
+            ]
         )
 
     def freeze(self):
@@ -220,6 +530,8 @@ class Tool:
         existing children cannot be moved or resized.
         """
         self._disconnect(list(self._connections.keys()))
+        self._set_hovered(None)
+        self.clear_selection()
         for child in self.children:
             child.hide_vertices()
         self._draw()
@@ -228,25 +540,81 @@ class Tool:
         """
         Remove all children from the axes.
         """
-        for a in self.children:
-            a.remove()
-        self.children.clear()
+        self._record("remove", self.children)
+        self._remove_all()
         self._draw()
 
+    def _remove_all(self):
+        self._log_changes(self.children, "remove")
+        if self.children:
+            self._version += 1
+        remove_artists([a for child in self.children for a in child._get_artists()])
+        for child in self.children:
+            child._on_geometry_change = None
+        self.children.clear()
+        self._clear_indices()
+        self._hovered = None
+        self._selected.clear()
+        self._pool.clear()
+
     def reset(self):
         """
         Reset the tool to its initial state.
         """
         self.clear()
         self._owner_counter = 0
+        if self._history is not None:
+            self._history.clear()
 
     def shutdown(self):
         """
         Deactivate the tool and remove all children from the axes.
         """
+        self._release()
+        self._draw()
+
+    def close(self):
+        """
+        Shut the tool down and drop the callbacks registered on it, so that the
+        tool, its children and anything the callbacks refer to can be freed.
+        A closed tool cannot be restarted.
+        """
+        self.shutdown()
+        for callbacks in (
+            self._on_create,
+            self._on_remove,
+            self._on_change,
+            self._on_vertex_press,
+            self._on_vertex_move,
+            self._on_vertex_release,
+            self._on_drag_press,
+            self._on_drag_move,
+            self._on_drag_release,
+            self._on_evict,
+            self._on_create_batch,
+            self._on_remove_batch,
+            self._on_change_batch,
+        ):
+            callbacks.clear()
+        for callback in self._timed_callbacks:
+            callback.cancel()
+        self._timed_callbacks.clear()
+        if self._history is not None:
+            self._history.clear()
+        self._closed = True
+
+    def _release(self):
+        # Tools whose constructor failed may be missing some attributes
+        if not hasattr(self, "_closed"):
+            return
         self._disconnect(list(self._connections.keys()))
-        self._connections.clear()
-        self.clear()
+        if self._rubber_band is not None:
+            self._rubber_band.remove()
+            self._rubber_band = None
+        if self._pick_lock:
+            self._pick_lock = False
+            self._ax._mpltoolbox_lock = False
+        self._remove_all()
 
     def _get_active_tool(self) -> str:
         return self._fig.canvas.toolbar.mode
@@ -268,15 +636,26 @@ class Tool:
             self._connections[key] = self._fig.canvas.mpl_connect(key, func)
 
     def _on_button_press(self, event: Event):
+        if self._press_consumed:
+            self._press_consumed = False
+            return
         if (
             event.button != 1
             or self._pick_lock
+            or self._rubber_band is not None
             or self._get_active_tool()
             or self._locked_by_other_tool()
-            or event.modifiers
             or event.inaxes != self._ax
         ):
             return
+        if event.modifiers:
+            if (
+                self._enable_select
+                and set(event.modifiers) == {"shift"}
+                and not self._motion_connected()
+            ):
+                self._start_selection(event)
+            return
         if not self._motion_connected():
             self._nclicks = 0
             self._spawn_new_owner(x=event.xdata, y=event.ydata)
@@ -285,12 +664,132 @@ class Tool:
         self._persist_vertex(event=event, owner=self.children[-1])
 
     def _spawn_new_owner(self, x: float, y: float):
-        owner = self._spawner(
-            x=x, y=y, number=self._owner_counter, ax=self._ax, **self._kwargs
-        )
+        self._add_owner(x=x, y=y)
+        self._apply_retention()
+        self._draw()
+
+    def _add_owner(
+        self, x: float, y: float, geometry: Any = None, key: int | None = None
+    ) -> Any:
+        # The geometry is set before the child is connected to the indices, so that
+        # they are only written once
+        if geometry is not None and self._pool:
+            owner = self._pool.pop()
+            owner._recycle(number=self._owner_counter, **self._kwargs)
+            owner._set_geometry(geometry)
+            add_artists(self._ax, owner._get_artists())
+        else:
+            owner = self._spawner(
+                x=x, y=y, number=self._owner_counter, ax=self._ax, **self._kwargs
+            )
+            if geometry is not None:
+                owner._set_geometry(geometry)
+        # Children restored by undo get back their key
+        if key is not None:
+            owner._key = key
+        self._attach_owner(owner)
+        return owner
+
+    def _attach_owner(self, owner):
+        if self._child_ids == "int":
+            owner.id = self._next_id
+            self._next_id += 1
         self.children.append(owner)
+        self._add_to_indices(owner)
+        owner._on_geometry_change = self._geometry_callback
         self._owner_counter += 1
-        self._draw()
+
+    def _apply_retention(self):
+        # Called once per operation, after all its children were added, so that
+        # the children are evicted in a single pass
+        if self._max_children is not None or self._window is not None:
+            self._evict()
+
+    def _evict(self):
+        n = len(self.children)
+        if n == 0:
+            # E.g. add_many with empty arrays, or adopt on empty axes
+            return
+        # The child that was just added is never evicted, as it may still be drawn
+        evict = np.zeros(n - 1, dtype=bool)
+        if self._max_children is not None and n > self._max_children:
+            # Evict a few more children than needed, so that evictions are batched
+            count = n - self._max_children + self._max_children // self._evict_batch
+            evict[: min(count, n - 1)] = True
+        if self._window is not None:
+            # The window runs along x, or along y for horizontal spans
+            axis = getattr(self._spawner, "_window_axis", 0)
+            right = self._index.boxes[:, 2 + axis]
+            finite = np.isfinite(right)
+            if finite.any():
+                evict |= right[:-1] < right[finite].max() - self._window
+        if not evict.any():
+            return
+        owners = [child for child, k in zip(self.children, evict, strict=False) if k]
+        self._detach_owners(owners)
+        # Only children with a fixed number of geometric parameters can be reused
+        # by add_many, which gives them a new geometry
+        if self._geometry is not None:
+            space = self._max_pooled - len(self._pool)
+            self._pool.extend(owners[:space])
+        self.call_on_evict(owners)
+
+    def _add_to_indices(self, child):
+        self._log_changes([child], "create")
+        self._version += 1
+        self._versions.add(child._key, self._version)
+        self._index.add(child._key, child.bbox)
+        if self._geometry is not None:
+            self._geometry.add(child._key, child._get_geometry())
+
+    def _update_indices(self, child, rows=None):
+        # rows are the vertices that moved, if only some of them did
+        self._log_changes([child], "change")
+        self._version += 1
+        self._versions.update(child._key, self._version)
+        self._index.update(child._key, child.bbox)
+        if self._geometry is not None:
+            self._geometry.update(child._key, child._get_geometry())
+
+    def _update_many_indices(self, children):
+        self._log_changes(children, "change")
+        ids = [child._key for child in children]
+        self._version += 1
+        self._versions.update_many(ids, self._version)
+        self._index.update_many(ids, [child.bbox for child in children])
+        if self._geometry is not None:
+            self._geometry.update_many(
+                ids, [child._get_geometry() for child in children]
+            )
+
+    def _remove_from_indices(self, children):
+        self._log_changes(children, "remove")
+        ids = [child._key for child in children]
+        self._version += 1
+        self._versions.remove_many(ids)
+        self._index.remove_many(ids)
+        if self._geometry is not None:
+            self._geometry.remove_many(ids)
+
+    def _log_changes(self, children: list, kind: str):
+        if not self._changes:
+            return
+        changes = self._changes[-1]
+        for child in children:
+            # Whether the child existed at the start of the interval, and exists now
+            existed = changes[child._key][0] if child._key in changes else None
+            if existed is None:
+                existed = kind != "create"
+            changes[child._key] = (existed, kind != "remove")
+            if kind == "remove":
+                # The ids of removed children are needed to report them in a diff
+                self._removed_ids[child._key] = child.id
+
+    def _clear_indices(self):
+        self._versions.clear()
+        self._index.clear()
+        if self._geometry is not None:
+            self._geometry.clear()
 
     def _on_motion_notify(self, event: Event):
         self._move_vertex(event=event, ind=None, owner=self.children[-1])
@@ -318,52 +817,200 @@ class Tool:
 
     def _finalize_owner(self):
         child = self.children[-1]
-        child.set_picker(5.0)
+        child.set_picker(self._pickradius)
+        self._record("create", [child])
         if self.on_create is not None:
             self.call_on_create(child)
 
     def _on_pick(self, event: Event):
         mev = event.mouseevent
+        owner = get_parent(event.artist)
         if (
             self._motion_connected()
             or self._get_active_tool()
-            or event.artist.parent not in self.children
+            or owner is None
+            or owner._key not in self._index
             or mev.inaxes != self._ax
         ):
             return
         art = event.artist
-        if (mev.button == 1) and ("ctrl" not in mev.modifiers):
-            if (not art.parent.is_moveable(art)) or (not self._enable_vertex_move):
+        # Shift + left-click is reserved for drawing a selection
+        selecting = self._enable_select and ("shift" in mev.modifiers)
+        if (mev.button == 1) and ("ctrl" not in mev.modifiers) and not selecting:
+            if not self._enable_vertex_move:
+                return
+            if (
+                not owner.is_moveable(art)
+                and not self._kwargs.get("hide_vertices", False)
+                and owner._ensure_handles()
+            ):
+                # Adopted children get their handles when they are first clicked
+                self._press_consumed = True
+                self._draw()
+                return
+            if not owner.is_moveable(art):
                 return
             self._pick_lock = True
             self._ax._mpltoolbox_lock = True
             self._grab_vertex(event)
         if mev.button == 3:
-            if (not art.parent.is_draggable(art)) or (not self._enable_drag):
+            if (not owner.is_draggable(art)) or (not self._enable_drag):
                 return
             self._pick_lock = True
             self._grab_owner(event)
         if (mev.button == 2) or ((mev.button == 1) and ("ctrl" in mev.modifiers)):
-            if (not art.parent.is_removable(art)) or (not self._enable_remove):
+            if (not owner.is_removable(art)) or (not self._enable_remove):
                 return
-            self._remove_owner(art.parent)
+            if owner._key in self._selected:
+                self._remove_owners(self.selected)
+            else:
+                self._remove_owner(owner)
 
     def _remove_owner(self, owner):
-        owner.remove()
-        self.children.remove(owner)
+        self._remove_owners([owner])
+
+    def _remove_owners(self, owners: list):
+        self._record("remove", owners)
+        self._detach_owners(owners)
+        self._draw()
+        self._call_each("remove", owners)
+
+    def _detach_owners(self, owners: list):
+        ids = {owner._key for owner in owners}
+        remove_artists([a for owner in owners for a in owner._get_artists()])
+        for owner in owners:
+            owner._on_geometry_change = None
+            self._selected.pop(owner._key, None)
+        self.children[:] = [child for child in self.children if child._key not in ids]
+        self._remove_from_indices(owners)
+        if self._hovered is not None and self._hovered._key in ids:
+            self._hovered = None
+
+    def _on_hover(self, event: Event):
+        # Hovering is suspended while an artist is being created or grabbed
+        if self._motion_connected() or self._pick_lock:
+            return
+        # The toolbar owns the cursor while zooming or panning, and nothing is
+        # highlighted
+        if self._get_active_tool():
+            self._cursor = None
+            if self._hovered is not None:
+                self._set_hovered(None)
+                self._draw()
+            return
+        child, artist = None, None
+        if event.inaxes == self._ax:
+            child, artist = self._find_artist_at(event)
+        self._set_cursor(child, artist)
+        if child is not self._hovered:
+            self._set_hovered(child)
+            self._draw()
+
+    def _data_tolerance(
+        self, xdisplay: float, ydisplay: float, radius: float
+    ) -> tuple[float, float]:
+        # Convert a radius in pixels around a display position to data units
+        inv = self._ax.transData.inverted()
+        (x0, y0), (x1, y1) = inv.transform(
+            [
+                (xdisplay - radius, ydisplay - radius),
+                (xdisplay + radius, ydisplay + radius),
+            ]
+        )
+        return 0.5 * abs(x1 - x0), 0.5 * abs(y1 - y0)
+
+    def _find_artist_at(self, event: Event) -> tuple[Any, Artist | None]:
+        # Get the candidates from the index before running the exact hit test
+        xtol, ytol = self._data_tolerance(event.x, event.y, self._pickradius)
+        rows = self._index.query_point(event.xdata, event.ydata, xtol, ytol)
+        # Children created last are drawn on top and take precedence
+        for row in rows[::-1]:
+            child = self.children[row]
+            artist = child.artist_at(event)
+            if artist is not None:
+                return child, artist
+        return None, None
+
+    def _set_hovered(self, child):
+        if self._hovered is not None and self._hovered._key not in self._selected:
+            self._hovered.set_highlight(False)
+        if child is not None:
+            child.set_highlight(True)
+        self._hovered = child
+
+    def _set_cursor(self, child, artist: Artist | None):
+        cursor = Cursors.POINTER
+        if artist is not None:
+            if self._enable_vertex_move and child.is_moveable(artist):
+                cursor = Cursors.HAND
+            elif self._enable_drag and child.is_draggable(artist):
+                cursor = Cursors.MOVE
+        if cursor != self._cursor:
+            self._fig.canvas.set_cursor(cursor)
+            self._cursor = cursor
+
+    def _start_selection(self, event: Event):
+        mode = "lasso" if self._enable_select == "lasso" else "box"
+        self._rubber_band = RubberBand(self._ax, event.xdata, event.ydata, mode=mode)
+        self._connect(
+            {
+                "motion_notify_event": self._on_selection_motion,
+                "button_release_event": self._finish_selection,
+            }
+        )
+
+    def _on_selection_motion(self, event: Event):
+        if event.inaxes != self._ax:
+            return
+        self._rubber_band.extend(event.xdata, event.ydata)
         self._draw()
-        if self.on_remove is not None:
-            self.call_on_remove(owner)
+
+    def _finish_selection(self, event: Event):
+        self._disconnect(["motion_notify_event", "button_release_event"])
+        rows = self._rubber_band.select(self._index.boxes)
+        self._rubber_band.remove()
+        self._rubber_band = None
+        self.select([self.children[row] for row in rows])
+
+    @property
+    def selected(self) -> list[Any]:
+        """
+        The list of currently selected children.
+        """
+        return list(self._selected.values())
+
+    def select(self, children: list[Any]):
+        """
+        Replace the current selection with the given children. Selected children are
+        highlighted, and are dragged and removed together.
+
+        :param children: The children to select.
+        """
+        for child in self._selected.values():
+            if child is not self._hovered:
+                child.set_highlight(False)
+        self._selected = {child._key: child for child in children}
+        for child in children:
+            child.set_highlight(True)
+        self._draw()
+
+    def clear_selection(self):
+        """
+        Deselect all children.
+        """
+        self.select([])
 
     def _grab_vertex(self, event: Event):
         self._connect(
             {
                 "motion_notify_event": self._on_vertex_motion,
-                "button_release_event": partial(self._release_owner, kind="vertex"),
+                "button_release_event": self._release_vertex,
             }
         )
         self._moving_vertex_index = event.ind[0]
-        self._moving_vertex_owner = event.artist.parent
+        self._moving_vertex_owner = get_parent(event.artist)
+        if self._history is not None:
+            self._vertex_origin = self._pack_geometries([self._moving_vertex_owner])
         if self.on_vertex_press is not None:
             self.call_on_vertex_press(self._moving_vertex_owner)
 
@@ -388,14 +1035,29 @@ class Tool:
         self._connect(
             {
                 "motion_notify_event": self._move_owner,
-                "button_release_event": partial(self._release_owner, kind="drag"),
+                "button_release_event": self._release_drag,
             }
         )
-        self._grabbed_owner = event.artist.parent
+        self._grabbed_owner = get_parent(event.artist)
         self._grab_mouse_origin = event.mouseevent.xdata, event.mouseevent.ydata
-        self._grabbed_owner_origin = self._grabbed_owner.xy
+        # Dragging a selected child moves the whole selection
+        if self._grabbed_owner._key in self._selected:
+            self._grabbed_group = self.selected
+        else:
+            self._grabbed_group = [self._grabbed_owner]
+        # Store the positions of the whole group in flat arrays, so that the drag
+        # offset is applied to all of them in a single operation
+        origins = [child.xy for child in self._grabbed_group]
+        self._grabbed_group_scalar = [np.ndim(xy[0]) == 0 for xy in origins]
+        self._grabbed_group_splits = np.cumsum([np.size(xy[0]) for xy in origins])[:-1]
+        self._grabbed_group_origin = (
+            np.concatenate([np.ravel(xy[0]) for xy in origins]),
+            np.concatenate([np.ravel(xy[1]) for xy in origins]),
+        )
+        self._grab_offset = (0.0, 0.0)
         if self.on_drag_press is not None:
-            self.call_on_drag_press(self._grabbed_owner)
+            for child in self._grabbed_group:
+                self.call_on_drag_press(child)
 
     def _move_owner(self, event: Event):
         if event.inaxes != self._ax:
@@ -404,24 +1066,49 @@ class Tool:
         move_y = self._enable_drag in (True, "yonly")
         dx = (event.xdata - self._grab_mouse_origin[0]) if move_x else 0
         dy = (event.ydata - self._grab_mouse_origin[1]) if move_y else 0
-        self._grabbed_owner.xy = (
-            self._grabbed_owner_origin[0] + dx,
-            self._grabbed_owner_origin[1] + dy,
-        )
+        self._grab_offset = (dx, dy)
+        xs = np.split(self._grabbed_group_origin[0] + dx, self._grabbed_group_splits)
+        ys = np.split(self._grabbed_group_origin[1] + dy, self._grabbed_group_splits)
+        # The per-child index updates are suspended, and made in bulk below
+        for child, x, y, scalar in zip(
+            self._grabbed_group, xs, ys, self._grabbed_group_scalar, strict=True
+        ):
+            child._on_geometry_change = None
+            child.xy = (x[0], y[0]) if scalar else (x, y)
+            child._on_geometry_change = self._geometry_callback
+        self._update_many_indices(self._grabbed_group)
         self._draw()
         if self.on_drag_move is not None:
-            self.call_on_drag_move(self._grabbed_owner)
-        if self.on_change is not None:
-            self.call_on_change(self._grabbed_owner)
+            for child in self._grabbed_group:
+                self.call_on_drag_move(child)
+        self._call_each("change", self._grabbed_group)
+
+    def _release_vertex(self, event: Event):
+        self._release_owner(event, kind="vertex")
+
+    def _release_drag(self, event: Event):
+        self._release_owner(event, kind="drag")
 
     def _release_owner(self, event: Event, kind: str):
         self._disconnect(["motion_notify_event", "button_release_event"])
         self._pick_lock = False
         self._ax._mpltoolbox_lock = False
+        # A drag is recorded as a single edit, from the press to the release
+        if kind == "vertex" and self._vertex_origin is not None:
+            owner = self._moving_vertex_owner
+            self._record_change([owner], self._vertex_origin)
+            self._vertex_origin = None
+        elif kind == "drag" and any(self._grab_offset):
+            self._record("drag", self._grabbed_group, after=self._grab_offset)
+        # The changes held back by throttled and debounced callbacks are delivered
+        # before the release
+        for callback in self._timed_callbacks:
+            callback.flush()
         if (kind == "vertex") and (self.on_vertex_release is not None):
             self.call_on_vertex_release(self._moving_vertex_owner)
         elif (kind == "drag") and (self.on_drag_release is not None):
-            self.call_on_drag_release(self._grabbed_owner)
+            for child in self._grabbed_group:
+                self.call_on_drag_release(child)
 
     def click(
         self,
@@ -451,7 +1138,7 @@ class Tool:
         ev = DummyEvent(
             xdata=x, ydata=y, inaxes=self._ax, button=button, modifiers=modifiers
         )
-        if self._motion_connected():
+        if self._motion_connected() and self._rubber_band is None:
             self._on_motion_notify(ev)
         self._on_button_press(ev)
 
@@ -466,12 +1153,546 @@ class Tool:
             - an artist (using `tool.children` will give a list of all artists the tool
                 is responsible for)
             - a string, which should be the `id` (uuid) of the artist to be removed
+
+            Integer ids (see ``child_ids``) are not accepted here, since integers
+            are positions: use ``tool.remove(tool.get_child(id))`` instead.
         """
         if isinstance(child, int):
             self._remove_owner(self.children[child])
         elif isinstance(child, str):
-            for c in self.children:
-                if c.id == child:
-                    self._remove_owner(c)
+            owners = self._children_with_ids([child], missing_ok=True)
+            if owners:
+                self._remove_owner(owners[0])
         else:
             self._remove_owner(child)
+
+    def remove_many(self, children: list | np.ndarray):
+        """
+        Remove several children at once. The figure is redrawn only once, and
+        ``on_remove_batch`` is called a single time with the list of removed
+        children.
+
+        :param children: The children to be removed. Can be supplied as:
+
+            - a boolean mask with one entry per child in ``tool.children``
+            - a list of integers, giving the positions of the children in
+                ``tool.children``
+            - a list of strings, giving the ids of the children
+            - a list of children
+        """
+        owners = self._resolve_children(children)
+        if not owners:
+            return
+        self._record("remove", owners)
+        self._detach_owners(owners)
+        self._draw()
+        self._call_each("remove", owners)
+
+    def _resolve_children(self, items: list | np.ndarray) -> list[Any]:
+        items = list(items)
+        if not items:
+            return []
+        first = items[0]
+        if isinstance(first, bool | np.bool_):
+            if len(items) != len(self.children):
+                raise ValueError(
+                    f"The mask has {len(items)} entries, but the tool has "
+                    f"{len(self.children)} children."
+                )
+            owners = [child for child, k in zip(self.children, items, strict=True) if k]
+        elif isinstance(first, int | np.integer):
+            owners = [self.children[i] for i in items]
+        elif isinstance(first, str):
+            owners = self._children_with_ids(items)
+        else:
+            owners = items
+        # Drop duplicates, keeping the order
+        return list({owner._key: owner for owner in owners}.values())
+
+    def _children_with_ids(
+        self, ids: list[str | int], missing_ok: bool = False
+    ) -> list[Any]:
+        # Only the ids that were already generated can match, so that looking up
+        # ids never generates the uuids of the other children
+        lookup = {c._id: c for c in self.children if c._id is not None}
+        if missing_ok:
+            return [lookup[i] for i in ids if i in lookup]
+        missing = [i for i in ids if i not in lookup]
+        if missing:
+            raise KeyError(f"No children with ids {missing}.")
+        return [lookup[i] for i in ids]
+
+    def get_child(self, id: str | int) -> Any:
+        """
+        Return the child with the given id.
+
+        :param id: The id of the child, a string or an integer depending on the
+            ``child_ids`` of the tool.
+        """
+        return self._children_with_ids([id])[0]
+
+    def add_many(self, **arrays) -> list[Any]:
+        """
+        Create several children at once from arrays describing their geometry, in
+        the same layout as returned by :meth:`to_arrays`. The axes limits are
+        updated and the figure is redrawn only once, and ``on_create_batch`` is
+        called a single time with the list of new children.
+
+        :param arrays: One array per geometric parameter of the children, e.g.
+            ``x``, ``y``, ``width`` and ``height`` for rectangles, or ``left`` and
+            ``right`` for vertical spans. Scalars are broadcast against the other
+            arrays.
+        :return: The list of new children. With a retention policy, children added
+            by the same call may already have been evicted, and are not returned.
+        """
+        added = []
+        for x, y, geometry in self._split_geometries(arrays):
+            child = self._add_owner(x=x, y=y, geometry=geometry)
+            child.set_picker(self._pickradius)
+            added.append((child, child._key))
+        self._apply_retention()
+        # Evicted children may be reused with a new key
+        children = [child for child, key in added if key in self._index]
+        if not children:
+            return children
+        self._record("create", children)
+        self._update_data_limits(self._index.values[-len(children) :])
+        self._ax.autoscale_view()
+        self._draw()
+        self._call_each("create", children)
+        return children
+
+    def adopt(self, artists: list[Artist] | None = None) -> list[Any]:
+        """
+        Turn artists that are already on the axes into children of the tool, so
+        that they can be edited, e.g. patches made by an earlier analysis. The
+        artists are reused as they are, in a single pass, and ``on_create_batch``
+        is called a single time with the list of new children.
+
+        The handles used to move the vertices of rectangles, ellipses, spans and
+        polygons are only made when they are first needed: clicking on an adopted
+        child with the left mouse button, or calling its ``show_vertices`` method,
+        makes its handles. Adopting artists is not recorded for :meth:`undo`.
+
+        :param artists: The artists to adopt: patches for rectangles, ellipses,
+            polygons and spans (as made by ``ax.axvspan`` and ``ax.axhspan``), and
+            lines for lines and points. If `None`, all the artists of the axes that
+            match the children of the tool, and do not belong to a tool yet, are
+            adopted.
+        :return: The list of new children. With a retention policy, children
+            adopted by the same call may already have been evicted, and are not
+            returned.
+        """
+        adopt = getattr(self._spawner, "_adopt", None)
+        if adopt is None:
+            raise TypeError("The children of this tool cannot adopt artists.")
+        explicit = artists is not None
+        if not explicit:
+            artists = [*self._ax.patches, *self._ax.lines]
+        added = []
+        for artist in artists:
+            child = None if get_parent(artist) is not None else adopt(artist, self._ax)
+            if child is None:
+                if explicit:
+                    raise TypeError(
+                        f"The artist {artist} cannot be adopted by this tool."
+                    )
+                continue
+            child.set_picker(self._pickradius)
+            self._attach_owner(child)
+            added.append((child, child._key))
+        nchildren = len(self.children)
+        self._apply_retention()
+        # The adopted artists are already drawn, so only evictions need a redraw
+        if len(self.children) < nchildren:
+            self._draw()
+        children = [child for child, key in added if key in self._index]
+        if children:
+            self._call_each("create", children)
+        return children
+
+    def _update_data_limits(self, boxes: np.ndarray):
+        # Children only add their first vertex to the data limits of the axes when
+        # they are spawned. Instead of a full relim, grow the limits with the
+        # bounding boxes in one go, one direction at a time because spans are
+        # unbounded in one of them.
+        corners = np.concatenate([boxes[:, :2], boxes[:, 2:]])
+        for dim in (0, 1):
+            values = corners[:, dim]
+            xys = np.zeros((np.count_nonzero(np.isfinite(values)), 2))
+            xys[:, dim] = values[np.isfinite(values)]
+            self._ax.update_datalim(xys, updatex=dim == 0, updatey=dim == 1)
+
+    def _split_geometries(self, arrays: dict) -> list[tuple[float, float, Any]]:
+        # Return the position at which each child is spawned, along with its
+        # geometry
+        if self._geometry is None:
+            raise TypeError("The children of this tool cannot be created from arrays.")
+        fields = self._geometry.fields
+        if set(arrays) != set(fields):
+            raise ValueError(
+                f"Expected arrays for {', '.join(fields)}, "
+                f"got {', '.join(arrays) or 'none'}."
+            )
+        columns = np.broadcast_arrays(
+            *(np.atleast_1d(np.asarray(arrays[field], dtype=float)) for field in fields)
+        )
+        out = []
+        for row in zip(*columns, strict=True):
+            geometry = dict(zip(fields, row, strict=True))
+            # Spans ignore the coordinate across their extent
+            x = geometry.get("x", geometry.get("left", 0.0))
+            y = geometry.get("y", geometry.get("bottom", 0.0))
+            out.append((x, y, row))
+        return out
+
+    def set_geometry(self, ids: list[str | int] | None = None, **arrays):
+        """
+        Update the geometry of several children at once, from arrays in the same
+        layout as for :meth:`add_many`. The indices of the tool are updated and the
+        figure is redrawn only once, after which ``on_change`` is called once for
+        every updated child.
+
+        :param ids: The ids of the children to update, in the order of the arrays.
+            If `None`, all children are updated, in the order of ``tool.children``.
+        :param arrays: One array per geometric parameter of the children.
+        """
+        if ids is None:
+            children = list(self.children)
+        else:
+            children = self._children_with_ids(list(ids))
+        geometries = self._split_geometries(arrays)
+        if len(geometries) != len(children):
+            raise ValueError(
+                f"Got the geometry of {len(geometries)} children, "
+                f"but {len(children)} children to update."
+            )
+        before = None if self._history is None else self._pack_geometries(children)
+        self._set_geometries(children, [geometry for _, _, geometry in geometries])
+        if before is not None:
+            self._record_change(children, before)
+        self._draw()
+        self._call_each("change", children)
+
+    def _set_geometries(self, children: list, geometries: list):
+        for child, geometry in zip(children, geometries, strict=True):
+            # Suspend the per-child index updates, which are made in bulk below
+            child._on_geometry_change = None
+            child._set_geometry(geometry)
+            child._on_geometry_change = self._geometry_callback
+        self._update_many_indices(children)
+
+    def _shift_children(self, children: list, dx: float, dy: float):
+        for child in children:
+            x, y = child.xy
+            child._on_geometry_change = None
+            child.xy = (np.add(x, dx), np.add(y, dy))
+            child._on_geometry_change = self._geometry_callback
+        self._update_many_indices(children)
+
+    def undo(self) -> bool:
+        """
+        Undo the last creation, removal, move or resize of children. Children that
+        are restored are added at the end of ``tool.children``, with their former
+        ids, and the ``on_create``, ``on_remove`` and ``on_change`` callbacks are
+        called once per child, as for the original operations.
+
+        :return: `False` if there was nothing to undo.
+        """
+        return self._apply_edit(undo=True)
+
+    def redo(self) -> bool:
+        """
+        Redo the last operation undone with :meth:`undo`.
+
+        :return: `False` if there was nothing to redo.
+        """
+        return self._apply_edit(undo=False)
+
+    def _apply_edit(self, undo: bool) -> bool:
+        # Nothing is undone while a child is being drawn or moved
+        if self._history is None or self._motion_connected():
+            return False
+        while True:
+            edit = self._history.undo() if undo else self._history.redo()
+            if edit is None:
+                return False
+            if self._apply(edit, undo):
+                return True
+            # The edit refers to children that were removed without being recorded
+            # (e.g. evicted), and is skipped.
+            self._history.drop(redo=undo)
+
+    def _apply(self, edit: Edit, undo: bool) -> bool:
+        present = [key in self._index for key in edit.keys]
+        if edit.kind in ("create", "remove") and (edit.kind == "create") == undo:
+            owners = [
+                self.children[self._index.row(key)]
+                for key, alive in zip(edit.keys, present, strict=True)
+                if alive
+            ]
+            if not owners:
+                return False
+            # The ids may have been generated since the edit was recorded, and are
+            # kept so that the children get them back when they are restored
+            live = iter(owner._id for owner in owners)
+            ids = tuple(
+                next(live) if alive else (None if edit.ids is None else edit.ids[i])
+                for i, alive in enumerate(present)
+            )
+            if any(i is not None for i in ids):
+                self._history.amend(edit._replace(ids=ids), redo=undo)
+            self._detach_owners(owners)
+            self._draw()
+            self._call_each("remove", owners)
+        elif edit.kind in ("create", "remove"):
+            packed = edit.after if edit.kind == "create" else edit.before
+            children = []
+            for i, geometry in enumerate(self._unpack_geometries(packed)):
+                x, y = self._anchor(geometry)
+                child = self._add_owner(x=x, y=y, geometry=geometry, key=edit.keys[i])
+                child.set_picker(self._pickradius)
+                if edit.ids is not None and edit.ids[i] is not None:
+                    child.id = edit.ids[i]
+                children.append(child)
+            self._update_data_limits(self._index.values[-len(children) :])
+            self._apply_retention()
+            children = [child for child in children if child._key in self._index]
+            self._draw()
+            if children:
+                self._call_each("create", children)
+        else:
+            if edit.kind == "change" and not all(present):
+                return False
+            children = [
+                self.children[self._index.row(key)]
+                for key, alive in zip(edit.keys, present, strict=True)
+                if alive
+            ]
+            if not children:
+                return False
+            if edit.kind == "drag":
+                sign = -1 if undo else 1
+                self._shift_children(
+                    children, sign * edit.after[0], sign * edit.after[1]
+                )
+            else:
+                packed = self._patch_geometries(
+                    children, edit.before if undo else edit.after
+                )
+                self._set_geometries(children, self._unpack_geometries(packed))
+            self._draw()
+            self._call_each("change", children)
+        return True
+
+    def _record(self, kind: str, children: list, before: Any = None, after: Any = None):
+        if self._history is None or not children:
+            return
+        if kind == "create":
+            after = self._pack_geometries(children)
+        elif kind == "remove":
+            before = self._pack_geometries(children)
+        ids = tuple(child._id for child in children)
+        self._history.record(
+            Edit(
+                kind=kind,
+                keys=np.array([child._key for child in children]),
+                before=before,
+                after=after,
+                ids=None if all(i is None for i in ids) else ids,
+            )
+        )
+
+    def _record_change(self, children: list, before: Any):
+        after = self._pack_geometries(children)
+        diff = self._diff_geometries(before, after)
+        if diff is not None:
+            self._record("change", children, *diff)
+
+    def _pack_geometries(self, children: list) -> Any:
+        # The geometries of the children, in a compact form for the history
+        return np.array(
+            [child._get_geometry() for child in children], dtype=float
+        ).reshape(len(children), -1)
+
+    def _unpack_geometries(self, packed: Any) -> list[Any]:
+        return [tuple(row) for row in packed]
+
+    def _anchor(self, geometry: Any) -> tuple[float, float]:
+        # The position at which a child with the given geometry is spawned
+        fields = dict(zip(self._geometry.fields, geometry, strict=True))
+        return fields.get("x", fields.get("left", 0.0)), fields.get(
+            "y", fields.get("bottom", 0.0)
+        )
+
+    def _diff_geometries(self, before: Any, after: Any) -> tuple[Any, Any] | None:
+        # Return what is stored in the history for a change of geometry, or None if
+        # nothing changed
+        if np.array_equal(before, after):
+            return None
+        return before, after
+
+    def _patch_geometries(self, children: list, stored: Any) -> Any:
+        # Return the packed geometries of the children from what the history stored
+        return stored
+
+    def intersecting(
+        self, xmin: float, ymin: float, xmax: float, ymax: float
+    ) -> list[Any]:
+        """
+        Return the children whose bounding box intersects the given box, in the
+        order in which they were created.
+
+        :param xmin: The left edge of the box, in data coordinates.
+        :param ymin: The bottom edge of the box, in data coordinates.
+        :param xmax: The right edge of the box, in data coordinates.
+        :param ymax: The top edge of the box, in data coordinates.
+        """
+        rows = self._index.query_box(xmin, ymin, xmax, ymax)
+        return [self.children[row] for row in rows]
+
+    def containing(self, x: float, y: float, radius: float = 0.0) -> list[Any]:
+        """
+        Return the children that contain the point ``(x, y)``, in the order in which
+        they were created. For lines and points, the point has to lie on the line
+        or vertex.
+
+        :param x: The x coordinate of the point, in data coordinates.
+        :param y: The y coordinate of the point, in data coordinates.
+        :param radius: Tolerance in pixels around the edges of the children.
+        """
+        xtol, ytol = self._data_tolerance(*self._ax.transData.transform((x, y)), radius)
+        rows = self._index.query_point(x, y, xtol, ytol)
+        return [
+            self.children[row]
+            for row in rows
+            if self.children[row].contains_point(x, y, radius=radius)
+        ]
+
+    def nearest(self, x: float, y: float, k: int = 1) -> list[Any]:
+        """
+        Return the ``k`` children closest to the point ``(x, y)``, sorted by
+        increasing distance. The distance is measured in data coordinates, from the
+        point to the bounding box of each child.
+
+        :param x: The x coordinate of the point, in data coordinates.
+        :param y: The y coordinate of the point, in data coordinates.
+        :param k: The number of children to return.
+        """
+        return [self.children[row] for row in self._index.nearest(x, y, k)]
+
+    @property
+    def version(self) -> int:
+        """
+        A counter increased every time children are created, removed or changed,
+        including every step of a vertex move or a drag.
+        """
+        return self._version
+
+    def changed_since(self, version: int) -> list[str | int]:
+        """
+        Return the ids of the children created or changed after the given
+        :attr:`version` of the tool, in the order of ``tool.children``. Removed
+        children are not included.
+
+        :param version: A version previously read from :attr:`version`.
+        """
+        rows = np.flatnonzero(self._versions.values[:, 0] > version)
+        return [self.children[row].id for row in rows]
+
+    def snapshot(self) -> Snapshot:
+        """
+        Return an immutable view of the current children and their geometry, which
+        can be compared to other snapshots of the tool with :func:`diff`.
+
+        No data is copied when taking a snapshot. Instead, the storage of the tool
+        is copied before the next change to the geometry of existing children, and
+        adding children does not copy it at all.
+        """
+        store = self._snapshot_store()
+        if store is None:
+            keys, arrays = list(self._index.keys), {}
+        else:
+            keys, arrays = store.snapshot()
+        if not self._live_snapshots:
+            self._changes = []
+            self._changes_start = self._epoch
+        epoch = self._epoch
+        self._epoch += 1
+        self._live_snapshots.add(epoch)
+        self._changes.append({})
+        return Snapshot(self, epoch, keys, len(self.children), arrays)
+
+    def _snapshot_store(self) -> Any:
+        # The store sharing its arrays with snapshots
+        return self._geometry
+
+    def _release_snapshot(self, epoch: int):
+        self._live_snapshots.discard(epoch)
+        if not self._live_snapshots:
+            self._changes = []
+            self._removed_ids.clear()
+            return
+        # Forget the changes made before the oldest snapshot still alive
+        drop = min(self._live_snapshots) - self._changes_start
+        if drop <= 0:
+            return
+        for changes in self._changes[:drop]:
+            for key, (_, exists) in changes.items():
+                if not exists:
+                    self._removed_ids.pop(key, None)
+        del self._changes[:drop]
+        self._changes_start += drop
+
+    def _ids_of(self, keys: list) -> list[str | int]:
+        return [
+            self.children[self._index.row(key)].id
+            if key in self._index
+            else self._removed_ids[key]
+            for key in keys
+        ]
+
+    def _diff_snapshots(self, start: int, stop: int) -> tuple[list, list, list]:
+        swap = start > stop
+        if swap:
+            start, stop = stop, start
+        states = {}
+        for changes in self._changes[
+            start - self._changes_start : stop - self._changes_start
+        ]:
+            for key, (existed, exists) in changes.items():
+                states[key] = (states[key][0] if key in states else existed, exists)
+        added = [key for key, (before, after) in states.items() if after and not before]
+        removed = [
+            key for key, (before, after) in states.items() if before and not after
+        ]
+        modified = [key for key, (before, after) in states.items() if before and after]
+        if swap:
+            added, removed = removed, added
+        return self._ids_of(added), self._ids_of(removed), self._ids_of(modified)
+
+    def to_arrays(self) -> dict[str, np.ndarray]:
+        """
+        Return the geometry of all children as a dict of arrays, with one entry per
+        geometric parameter (e.g. ``x``, ``y``, ``width`` and ``height`` for
+        rectangles, ``left`` and ``right`` for vertical spans), in the order of
+        ``tool.children``.
+
+        The arrays are read-only views of the storage maintained by the tool, so no
+        data is copied. They follow later changes to the geometry of the children,
+        but ``to_arrays`` should be called again after children are added or
+        removed, and after a :meth:`snapshot` is taken: the storage shared with the
+        snapshot is copied on the next change, and the arrays exported earlier then
+        keep the geometry at the time of the snapshot.
+        """
+        if self._geometry is None:
+            raise TypeError("The children of this tool cannot be exported to arrays.")
+        return self._geometry.to_arrays()
+
+    def ids(self) -> np.ndarray:
+        """
+        Return the ids of all children, in the order of ``tool.children`` and of
+        the arrays returned by :meth:`to_arrays`. With ``child_ids='uuid'``, the
+        ids that were not generated yet are generated.
+        """
+        return np.array([child.id for child in self.children])
@@ -1,6 +1,52 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) Scipp contributors (https://github.com/scipp)
 
+import itertools
+import uuid
+import weakref
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+from matplotlib.lines import Line2D
+from matplotlib.patches import Patch
+from matplotlib.pyplot import Artist, Axes
+
+# Cheap keys identifying the children internally, unique across all tools
+child_keys = itertools.count()
+
+
+class Child:
+    """
+    The identity shared by the children of all the tools: an internal key, and an
+    id which is only generated when it is first read.
+
+    The children use slots to keep their records small. Subclasses list
+    ``__dict__`` in their slots, so that users can still attach their own
+    attributes to the children.
+    """
+
+    __slots__ = ("_id", "_key")
+
+    def _new_identity(self):
+        # Called when a child is made, adopted or recycled from a removed one
+        self._id = None
+        self._key = next(child_keys)
+
+    @property
+    def id(self) -> str | int:
+        """
+        The id of the child. Unless the tool uses integer ids, this is a uuid which
+        is only generated when the id is first read.
+        """
+        if self._id is None:
+            self._id = uuid.uuid1().hex
+        return self._id
+
+    @id.setter
+    def id(self, value: str | int):
+        self._id = value
+
 
 def parse_kwargs(kwargs: dict, number: int) -> dict:
     parsed = {}
@@ -12,3 +58,92 @@ def parse_kwargs(kwargs: dict, number: int) -> dict:
         else:
             parsed[key] = value
     return parsed
+
+
+def segment_distances(
+    start: np.ndarray, end: np.ndarray, point: tuple[float, float]
+) -> np.ndarray:
+    """
+    Return the distances from a point to the segments going from the ``(n, 2)``
+    array of positions ``start`` to the positions ``end``. Segments of zero length
+    are treated as single points.
+    """
+    seg = end - start
+    rel = np.asarray(point) - start
+    length2 = np.einsum("ij,ij->i", seg, seg)
+    t = np.clip(
+        np.einsum("ij,ij->i", rel, seg) / np.where(length2 > 0, length2, 1.0), 0, 1
+    )
+    diff = rel - t[:, None] * seg
+    return np.sqrt(np.einsum("ij,ij->i", diff, diff))
+
+
+def _detached(artist: Artist):
+    return
+
+
+def remove_artists(artists: list[Artist]):
+    """
+    Remove many artists from the figure at once.
+
+    ``Artist.remove`` takes the artist out of the list of children of its axes with
+    ``list.remove``, which is linear in the number of children. Here, the removal
+    bookkeeping of every artist is run without touching the lists, which are then
+    filtered in a single pass each.
+    """
+    owners = {}
+    for artist in artists:
+        method = artist._remove_method
+        owner = getattr(method, "__self__", None)
+        if isinstance(owner, list) and getattr(method, "__name__", "") == "remove":
+            owners.setdefault(id(owner), (owner, set()))[1].add(id(artist))
+            artist._remove_method = _detached
+        artist.remove()
+    for owner, removed in owners.values():
+        owner[:] = [artist for artist in owner if id(artist) not in removed]
+
+
+def add_artists(ax: Axes, artists: list[Artist]):
+    """
+    Add artists that were removed with :func:`remove_artists` back to an axes.
+    """
+    for artist in artists:
+        if isinstance(artist, Patch):
+            ax.add_patch(artist)
+        elif isinstance(artist, Line2D):
+            ax.add_line(artist)
+        else:
+            ax.add_artist(artist)
+
+
+def set_parent(artist: Artist, child: Any):
+    """
+    Link an artist to the child of a tool it belongs to. The link is weak, so that
+    the artists left on a figure do not keep the children alive.
+    """
+    artist._mpltoolbox_parent = weakref.ref(child)
+
+
+def get_parent(artist: Artist) -> Any:
+    """
+    Return the child of a tool an artist belongs to, or `None`.
+    """
+    ref = getattr(artist, "_mpltoolbox_parent", None)
+    return None if ref is None else ref()
+
+
+class WeakCallback:
+    """
+    A callable forwarding its arguments to a bound method, without keeping the
+    object of the method alive. Calls are ignored once the object is gone.
+    """
+
+    __slots__ = ("_method",)
+
+    def __init__(self, method: Callable):
+        self._method = weakref.WeakMethod(method)
+
+    def __call__(self, *args):
+        method = self._method()
+        if method is not None:
+            method(*args)
@@ -3,14 +3,19 @@
 
 from functools import partial
 
+import numpy as np
+from matplotlib import patches as mp
 from matplotlib.backend_bases import Event
-from matplotlib.pyplot import Axes
+from matplotlib.pyplot import Artist, Axes
 
 from .patch import Patch
-from .tool import Tool
+from .spans import SpanTool
 
 
 class Vspan(Patch):
+    __slots__ = ("_median", "_median_x")
+    _geometry_fields = ("left", "right")
+
     def __init__(
         self,
         x: float,
@@ -21,8 +26,6 @@ class Vspan(Patch):
         **kwargs,
     ):
         super().__init__(x=x, y=y, number=number, ax=ax, **kwargs)
-        self._median = self._ax.axvline(x, ls="dashed", color=self.edgecolor)
-        self._vertices.set_transform(self._median.get_transform())
         if hide_median:
             self._median.set_visible(False)
 
@@ -32,10 +35,42 @@ class Vspan(Patch):
             f"edgecolor={self.edgecolor}, facecolor={self.facecolor}"
         )
 
+    def _recycle(self, number: int, hide_median: bool = False, **kwargs):
+        super()._recycle(number, **kwargs)
+        if self._median is not None:
+            self._median.set(color=self.edgecolor, visible=not hide_median)
+
+    @classmethod
+    def _can_adopt(cls, artist: Artist, ax: Axes) -> bool:
+        # Spans are made by ax.axvspan, and span the axes along y
+        return isinstance(
+            artist, mp.Rectangle | mp.Polygon
+        ) and artist.get_data_transform() is ax.get_xaxis_transform(which="grid")
+
+    def _make_handles(self):
+        # The median is made along with the handles, using the same transform
+        super()._make_handles()
+        self._median_x = np.full(2, 0.5 * (self.left + self.right), dtype=float)
+        self._median = self._ax.axvline(
+            self._median_x[0], ls="dashed", color=self.edgecolor
+        )
+        self._vertices.set_transform(self._median.get_transform())
+
+    def _clear_handles(self):
+        super()._clear_handles()
+        self._median = None
+        self._median_x = None
+
     def _update_vertices(self):
-        super()._update_vertices()
-        mid = 0.5 * (self.left + self.right)
-        self._median.set_xdata([mid, mid])
+        if self._vertices is None:
+            self._geometry_changed()
+            return
+        # The handles and the median only move along x
+        self._write_vertices(self._handle_x, self._handle_y)
+        self._vertices.set_xdata(self._handle_x)
+        self._median_x[:] = 0.5 * (self._handle_x[0] + self._handle_x[1])
+        self._median.set_xdata(self._median_x)
+        self._geometry_changed()
 
     def _make_patch(self, x: float, y: float, **kwargs):
         self._patch = self._ax.axvspan(x, x, **kwargs)
@@ -43,6 +78,10 @@ class Vspan(Patch):
     def _make_vertices(self) -> tuple[tuple[float, float], tuple[float, float]]:
         return ([self.left, self.right], [0.5, 0.5])
 
+    def _write_vertices(self, x: np.ndarray, y: np.ndarray):
+        x[0] = self.left
+        x[1] = self.right
+
     def move_vertex(self, event: Event, ind: int, **ignored):
         x = event.xdata
         if ind == 0:
@@ -50,9 +89,10 @@ class Vspan(Patch):
         else:
             self.right = x
 
-    def remove(self):
-        super().remove()
-        self._median.remove()
+    def _get_artists(self) -> list[Artist]:
+        if self._median is None:
+            return super()._get_artists()
+        return [*super()._get_artists(), self._median]
 
     @property
     def left(self) -> float:
@@ -73,7 +113,8 @@ class Vspan(Patch):
                 xy += [x, xy[0, 1]]
             self._patch.set_xy(xy)
         else:
-            self._patch.set(width=xy[0] - x + self.width, xy=(x, 0))
+            self._patch.set_width(xy[0] - x + self._patch.get_width())
+            self._patch.set_x(x)
         self._update_vertices()
 
     @property
@@ -115,12 +156,36 @@ class Vspan(Patch):
         self._patch.set_xy(_xy)
         self._update_vertices()
 
+    def _get_geometry(self) -> tuple[float, float]:
+        return (self.left, self.right)
+
+    def _set_geometry(self, geometry: tuple[float, float]):
+        left, right = geometry
+        if len(self._patch.get_xy()) > 2:
+            self.left, self.right = left, right
+        else:
+            self._patch.set_x(left)
+            self._patch.set_width(right - left)
+            self._update_vertices()
+
+    @property
+    def bbox(self) -> tuple[float, float, float, float]:
+        start, end = self.interval
+        return (start, -np.inf, end, np.inf)
+
+    @property
+    def interval(self) -> tuple[float, float]:
+        left = self.left
+        right = self.right
+        return (min(left, right), max(left, right))
+
     def set(self, **kwargs):
         super().set(**kwargs)
-        self._median.set(**kwargs)
+        if self._median is not None:
+            self._median.set(**kwargs)
 
 
-Vspans = partial(Tool, spawner=Vspan)
+Vspans = partial(SpanTool, spawner=Vspan)
 Vspans.__doc__ = """
 Vspans: Add vertical spans to the supplied axes.
 
@@ -128,6 +193,8 @@ Controls:
   - Left-click and hold to make new spans
   - Right-click and hold to drag/move span
   - Middle-click to delete span
+  - Shift + left-click and drag to select several spans, which are then
+    dragged and deleted together (requires ``enable_select=True``)
 
 :param ax: The Matplotlib axes to which the Vspans tool will be attached.
 :param autostart: Automatically activate the tool upon creation if `True`.
@@ -0,0 +1,140 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) Scipp contributors (https://github.com/scipp)
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from matplotlib import patches as mp
+
+import mpltoolbox as tbx
+
+
+def add_rectangles(ax, n):
+    patches = [mp.Rectangle((i, 0), 0.5, 1.0) for i in range(n)]
+    for patch in patches:
+        ax.add_patch(patch)
+    return patches
+
+
+def test_adopt_reuses_patches_without_handles():
+    _, ax = plt.subplots()
+    patches = add_rectangles(ax, 1000)
+    created = []
+    rects = tbx.Rectangles(ax=ax, on_create_batch=lambda c, ids: created.append(len(c)))
+    children = rects.adopt()
+    assert len(children) == 1000
+    assert created == [1000]
+    assert [child._patch for child in children] == patches
+    # No handles were made
+    assert len(ax.lines) == 0
+    assert len(ax.patches) == 1000
+    arrays = rects.to_arrays()
+    assert np.array_equal(arrays["x"], np.arange(1000.0))
+    assert np.all(arrays["width"] == 0.5)
+    assert rects.containing(10.25, 0.5) == [children[10]]
+
+
+def test_adopt_only_matching_artists():
+    _, ax = plt.subplots()
+    add_rectangles(ax, 2)
+    ax.add_patch(mp.Ellipse((5, 5), 1, 1))
+    ax.axvspan(3, 4)
+    ax.add_patch(mp.Rectangle((7, 7), 1, 1, angle=30))
+    ax.plot([0, 1], [0, 1])
+    assert len(tbx.Rectangles(ax=ax).adopt()) == 2
+    assert len(tbx.Ellipses(ax=ax).adopt()) == 1
+    assert len(tbx.Vspans(ax=ax).adopt()) == 1
+    assert len(tbx.Lines(ax=ax).adopt()) == 1
+
+
+def test_adopt_skips_children_of_tools():
+    _, ax = plt.subplots()
+    add_rectangles(ax, 3)
+    rects = tbx.Rectangles(ax=ax)
+    rects.add_many(x=[10.0], y=0.0, width=1.0, height=1.0)
+    assert len(rects.adopt()) == 3
+    assert rects.adopt() == []
+    assert len(rects.children) == 4
+    # The handles of the rectangles made by the tool are not adopted as points
+    assert tbx.Points(ax=ax).adopt() == []
+
+
+def test_adopt_unsupported_artist_raises():
+    _, ax = plt.subplots()
+    ellipse = ax.add_patch(mp.Ellipse((5, 5), 1, 1))
+    rects = tbx.Rectangles(ax=ax)
+    with pytest.raises(TypeError, match="cannot be adopted"):
+        rects.adopt([ellipse])
+
+
+def test_click_makes_handles_of_adopted_rectangle(send, drag):
+    _, ax = plt.subplots()
+    ax.set(xlim=(0, 10), ylim=(0, 10))
+    ax.add_patch(mp.Rectangle((2, 2), 4, 4))
+    rects = tbx.Rectangles(ax=ax)
+    (child,) = rects.adopt()
+    send(ax, "button_press_event", 4, 4)
+    send(ax, "button_release_event", 4, 4)
+    # The click made the handles, and did not start a new rectangle
+    assert len(rects.children) == 1
+    assert len(ax.lines) == 1
+    assert np.array_equal(child.vertices[0], [2, 4, 6, 6, 6, 4, 2, 2])
+    drag(ax, [(6, 6), (7, 8)])
+    assert np.allclose((child.width, child.height), (5, 6))
+    assert np.allclose(rects.to_arrays()["height"], [6])
+
+
+def test_drag_adopted_vspan(drag):
+    _, ax = plt.subplots()
+    ax.set(xlim=(0, 10), ylim=(0, 10))
+    span = ax.axvspan(2, 4)
+    vspans = tbx.Vspans(ax=ax)
+    (child,) = vspans.adopt()
+    drag(ax, [(3, 5), (4, 5), (5, 5)], button=3)
+    assert np.allclose((child.left, child.right), (4, 6))
+    assert child._patch is span
+    assert vspans.containing(5, 5) == [child]
+    child.show_vertices()
+    assert np.allclose(child._median.get_xdata(), [5, 5])
+
+
+def test_adopt_polygons(drag):
+    _, ax = plt.subplots()
+    ax.set(xlim=(0, 10), ylim=(0, 10))
+    triangle = ax.add_patch(mp.Polygon([[1, 1], [5, 1], [3, 4]]))
+    polygons = tbx.Polygons(ax=ax)
+    (child,) = polygons.adopt()
+    assert np.array_equal(polygons.vertex_counts(), [4])
+    assert np.allclose(polygons.areas(), [6.0])
+    drag(ax, [(3, 2), (4, 3)], button=3)
+    assert np.allclose(triangle.get_xy()[0], (2, 2))
+    assert len(ax.lines) == 0
+    child.show_vertices()
+    assert np.allclose(child._vertices.get_xdata(), [2, 6, 4, 2])
+    polygons.remove(child)
+    assert len(ax.patches) == 0
+    assert len(ax.lines) == 0
+
+
+def test_adopt_lines_and_points():
+    _, ax = plt.subplots()
+    (line,) = ax.plot([0, 1, 2], [0, 1, 0])
+    (point,) = ax.plot([5], [5], "o")
+    points = tbx.Points(ax=ax)
+    assert points.adopt() == [points.children[0]]
+    assert points.children[0]._line is point
+    assert points.children[0].xy == (5, 5)
+    lines = tbx.Lines(ax=ax)
+    (child,) = lines.adopt()
+    assert child._line is line
+    assert np.array_equal(lines.to_arrays()["x"], [0, 1, 2])
+
+
+def test_adopt_with_retention_and_int_ids():
+    _, ax = plt.subplots()
+    add_rectangles(ax, 100)
+    rects = tbx.Rectangles(ax=ax, max_children=50, child_ids="int")
+    children = rects.adopt()
+    assert len(rects.children) <= 50
+    assert children == rects.children
+    assert rects.children[-1].id == 99
@@ -0,0 +1,177 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) Scipp contributors (https://github.com/scipp)
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+import mpltoolbox as tbx
+
+
+def test_rectangles_to_arrays():
+    _, ax = plt.subplots()
+    rects = tbx.Rectangles(ax=ax)
+    rects.click(10, 20)
+    rects.click(30, 50)
+    rects.click(60, 60)
+    rects.click(65, 90)
+    arrays = rects.to_arrays()
+    assert list(arrays) == ["x", "y", "width", "height"]
+    assert np.array_equal(arrays["x"], [10, 60])
+    assert np.array_equal(arrays["y"], [20, 60])
+    assert np.array_equal(arrays["width"], [20, 5])
+    assert np.array_equal(arrays["height"], [30, 30])
+
+
+def test_to_arrays_is_read_only_view():
+    _, ax = plt.subplots()
+    rects = tbx.Rectangles(ax=ax)
+    rects.click(10, 20)
+    rects.click(30, 50)
+    arrays = rects.to_arrays()
+    with pytest.raises(ValueError, match="read-only"):
+        arrays["x"][0] = 0.0
+    assert not arrays["x"].flags.owndata
+    rects.children[0].xy = (1, 2)
+    assert arrays["x"][0] == 1
+    assert arrays["y"][0] == 2
+
+
+def test_snapshot_detaches_exported_arrays():
+    _, ax = plt.subplots()
+    rects = tbx.Rectangles(ax=ax)
+    rects.add_many(x=[6.0, 7.0], y=0.0, width=1.0, height=1.0)
+    arrays = rects.to_arrays()
+    snapshot = rects.snapshot()
+    rects.set_geometry(x=[50.0, 60.0], y=0.0, width=1.0, height=1.0)
+    # The arrays exported before the snapshot keep the geometry it holds
+    assert np.array_equal(arrays["x"], [6, 7])
+    assert np.array_equal(snapshot.to_arrays()["x"], [6, 7])
+    assert np.array_equal(rects.to_arrays()["x"], [50, 60])
+
+
+def test_ellipses_to_arrays():
+    _, ax = plt.subplots()
+    ellipses = tbx.Ellipses(ax=ax)
+    ellipses.click(10, 20)
+    ellipses.click(30, 50)
+    arrays = ellipses.to_arrays()
+    assert np.array_equal(arrays["x"], [20])
+    assert np.array_equal(arrays["y"], [35])
+    assert np.array_equal(arrays["width"], [20])
+    assert np.array_equal(arrays["height"], [30])
+
+
+def test_spans_to_arrays():
+    _, ax = plt.subplots()
+    vspans = tbx.Vspans(ax=ax)
+    vspans.click(10, 20)
+    vspans.click(30, 50)
+    assert np.array_equal(vspans.to_arrays()["left"], [10])
+    assert np.array_equal(vspans.to_arrays()["right"], [30])
+    vspans.children[0].right = 40
+    assert np.array_equal(vspans.to_arrays()["right"], [40])
+    hspans = tbx.Hspans(ax=ax)
+    hspans.click(10, 20)
+    hspans.click(30, 50)
+    assert np.array_equal(hspans.to_arrays()["bottom"], [20])
+    assert np.array_equal(hspans.to_arrays()["top"], [50])
+
+
+def test_points_to_arrays_follow_removal():
+    _, ax = plt.subplots()
+    points = tbx.Points(ax=ax)
+    for x in range(5):
+        points.click(x, 2 * x)
+    points.remove(1)
+    points.remove(3)
+    arrays = points.to_arrays()
+    assert np.array_equal(arrays["x"], [0, 2, 3])
+    assert np.array_equal(arrays["y"], [0, 4, 6])
+    points.clear()
+    assert len(points.to_arrays()["x"]) == 0
+
+
+def make_polygons(ax):
+    polys = tbx.Polygons(ax=ax)
+    for x, y in [(0, 0), (10, 0), (10, 10), (0, 10), (0, 0)]:
+        polys.click(x, y)
+    for x, y in [(20, 20), (26, 20), (20, 24), (20, 20)]:
+        polys.click(x, y)
+    return polys
+
+
+def test_polygons_to_arrays():
+    _, ax = plt.subplots()
+    polys = make_polygons(ax)
+    arrays = polys.to_arrays()
+    assert np.array_equal(arrays["offsets"], [0, 5, 9])
+    assert np.array_equal(arrays["x"], [0, 10, 10, 0, 0, 20, 26, 20, 20])
+    assert np.array_equal(arrays["y"], [0, 0, 10, 10, 0, 20, 20, 24, 20])
+    assert set(arrays) == {"x", "y", "offsets"}
+    assert list(polys.ids()) == [p.id for p in polys.children]
+    assert not arrays["x"].flags.writeable
+
+
+def test_polygons_round_trip():
+    _, ax = plt.subplots()
+    polys = make_polygons(ax)
+    other = tbx.Polygons(ax=ax)
+    other.add_many(**polys.to_arrays())
+    for key, array in polys.to_arrays().items():
+        assert np.array_equal(other.to_arrays()[key], array)
+    assert np.allclose(other.areas(), polys.areas())
+
+
+def test_lines_round_trip():
+    _, ax = plt.subplots()
+    lines = tbx.Lines(ax=ax)
+    lines.add_many(
+        x=[0.0, 1.0, 2.0, 5.0, 6.0], y=[0.0, 1.0, 0.0, 5.0, 5.0], offsets=[0, 3, 5]
+    )
+    other = tbx.Lines(ax=ax)
+    other.add_many(**lines.to_arrays())
+    for key, array in lines.to_arrays().items():
+        assert np.array_equal(other.to_arrays()[key], array)
+    other.set_geometry(**lines.to_arrays())
+    assert np.allclose(other.lengths(), lines.lengths())
+
+
+def test_polygons_aggregates():
+    _, ax = plt.subplots()
+    polys = make_polygons(ax)
+    assert np.array_equal(polys.vertex_counts(), [5, 4])
+    assert np.allclose(polys.areas(), [100, 12])
+    assert np.allclose(polys.lengths(), [40, 6 + 4 + np.hypot(6, 4)])
+    assert np.array_equal(polys.bounding_boxes(), [[0, 0, 10, 10], [20, 20, 26, 24]])
+
+
+def test_lines_ragged_arrays_follow_changes():
+    _, ax = plt.subplots()
+    lines = tbx.Lines(ax=ax, n=3)
+    for x in (0, 1, 2, 10, 11, 12, 20, 21, 22):
+        lines.click(x, x)
+    lines.children[1].xy = ([5, 6], [7, 8])
+    arrays = lines.to_arrays()
+    assert np.array_equal(arrays["offsets"], [0, 3, 5, 8])
+    assert np.array_equal(arrays["x"], [0, 1, 2, 5, 6, 20, 21, 22])
+    assert np.array_equal(arrays["y"], [0, 1, 2, 7, 8, 20, 21, 22])
+    lines.remove(0)
+    arrays = lines.to_arrays()
+    assert np.array_equal(arrays["offsets"], [0, 2, 5])
+    assert np.array_equal(arrays["x"], [5, 6, 20, 21, 22])
+    assert np.array_equal(lines.vertex_counts(), [2, 3])
+    lines.clear()
+    assert len(lines.to_arrays()["x"]) == 0
+    assert len(lines.areas()) == 0
+
+
+def test_snapshot_detaches_exported_ragged_arrays():
+    _, ax = plt.subplots()
+    lines = tbx.Lines(ax=ax)
+    lines.add_many(x=[0.0, 1.0], y=[0.0, 1.0], offsets=[0, 2])
+    arrays = lines.to_arrays()
+    lines.snapshot()
+    lines.children[0].xy = ([5.0, 6.0], [7.0, 8.0])
+    assert np.array_equal(arrays["x"], [0, 1])
+    assert np.array_equal(lines.to_arrays()["x"], [5, 6])
@@ -0,0 +1,184 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) Scipp contributors (https://github.com/scipp)
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import matplotlib.pyplot as plt
+import pytest
+
+import mpltoolbox as tbx
+
+
+class ManualExecutor:
+    """
+    An executor whose calls are only run when asked to.
+    """
+
+    def __init__(self):
+        self.calls = []
+
+    def submit(self, func, *args):
+        future = Future()
+        self.calls.append((future, func, args))
+        return future
+
+    def run(self):
+        calls, self.calls = self.calls, []
+        for future, func, args in calls:
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(func(*args))
+                except Exception as error:
+                    future.set_exception(error)
+
+
+def test_latest_event_supersedes_pending_work(send, manual_timers, make_rectangles):
+    fig, ax = plt.subplots()
+    timers = manual_timers(fig)
+    rects = make_rectangles(ax)
+    executor = ManualExecutor()
+    results = []
+    rects.on_change(
+        lambda width: width * 2,
+        delivery=tbx.background(
+            executor,
+            on_result=lambda child, result: results.append(result),
+            prepare=lambda child: round(child.width),
+        ),
+    )
+    (timer,) = timers
+    send(ax, "button_press_event", 20, 20)
+    for x in range(21, 30):
+        send(ax, "motion_notify_event", x, 20)
+    # A single call in flight, for the first event
+    assert len(executor.calls) == 1
+    assert timer.running
+    executor.run()
+    timer.fire()
+    # The result is out of date, and the latest event is submitted instead
+    assert results == []
+    assert len(executor.calls) == 1
+    executor.run()
+    timer.fire()
+    assert results == [38]
+    assert not timer.running
+    send(ax, "button_release_event", 29, 20)
+
+
+def test_one_call_in_flight_per_child(send, manual_timers, make_rectangles):
+    fig, ax = plt.subplots()
+    manual_timers(fig)
+    rects = make_rectangles(ax)
+    executor = ManualExecutor()
+    results = []
+    rects.on_drag_move(
+        lambda child: child.xy,
+        delivery=tbx.background(
+            executor, on_result=lambda child, xy: results.append((child, xy))
+        ),
+    )
+    rects.select(rects.children)
+    send(ax, "button_press_event", 15, 15, button=3)
+    for x in range(16, 20):
+        send(ax, "motion_notify_event", x, 15, button=3)
+    assert len(executor.calls) == 2
+
+
+def test_results_of_removed_children_are_dropped(send, manual_timers, make_rectangles):
+    fig, ax = plt.subplots()
+    timers = manual_timers(fig)
+    rects = make_rectangles(ax)
+    executor = ManualExecutor()
+    results = []
+    rects.on_change(
+        lambda child: 1,
+        delivery=tbx.background(executor, on_result=lambda *args: results.append(1)),
+    )
+    send(ax, "button_press_event", 20, 20)
+    send(ax, "motion_notify_event", 25, 20)
+    send(ax, "button_release_event", 25, 20)
+    rects.remove(0)
+    executor.run()
+    timers[0].fire()
+    assert results == []
+    assert not timers[0].running
+
+
+def test_thread_pool(manual_timers, make_rectangles):
+    fig, ax = plt.subplots()
+    timers = manual_timers(fig)
+    rects = make_rectangles(ax)
+    results = []
+    main = threading.get_ident()
+    threads = []
+
+    def area(xy_width_height):
+        threads.append(threading.get_ident())
+        _, width, height = xy_width_height
+        return width * height
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        rects.on_change(
+            area,
+            delivery=tbx.background(
+                executor,
+                on_result=lambda child, result: results.append(
+                    (threading.get_ident(), result)
+                ),
+                prepare=lambda c: (c.xy, c.width, c.height),
+            ),
+        )
+        rects.set_geometry(x=[0.0, 5.0], y=0.0, width=[2.0, 3.0], height=4.0)
+    timers[0].fire()
+    assert sorted(results) == [(main, 8.0), (main, 12.0)]
+    assert main not in threads
+
+
+def test_error_in_callback_is_reported_and_others_are_collected(
+    manual_timers, make_rectangles
+):
+    fig, ax = plt.subplots()
+    timers = manual_timers(fig)
+    rects = make_rectangles(ax)
+    executor = ManualExecutor()
+    results = []
+
+    def width(child):
+        if child is rects.children[0]:
+            raise ZeroDivisionError
+        return child.width
+
+    rects.on_change(
+        width,
+        delivery=tbx.background(
+            executor, on_result=lambda child, result: results.append(result)
+        ),
+    )
+    rects.set_geometry(x=[0.0, 5.0], y=0.0, width=[2.0, 3.0], height=1.0)
+    executor.run()
+    with pytest.warns(RuntimeWarning, match="ZeroDivisionError"):
+        timers[0].fire()
+    assert results == [3.0]
+    assert not timers[0].running
+
+
+def test_close_cancels_background_work(manual_timers, make_rectangles):
+    fig, ax = plt.subplots()
+    timers = manual_timers(fig)
+    rects = make_rectangles(ax)
+    executor = ManualExecutor()
+    results = []
+    rects.on_change(
+        lambda child: 1,
+        delivery=tbx.background(executor, on_result=lambda *args: results.append(1)),
+    )
+    rects.set_geometry(x=[0.0, 5.0], y=0.0, width=1.0, height=1.0)
+    rects.close()
+    assert all(future.cancelled() for future, _, _ in executor.calls)
+    assert not timers[0].running
+
+
+def test_invalid_background_interval():
+    with pytest.raises(ValueError, match="positive"):
+        tbx.background(ManualExecutor(), interval=0)
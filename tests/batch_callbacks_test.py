@@ -0,0 +1,95 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) Scipp contributors (https://github.com/scipp)
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+import mpltoolbox as tbx
+
+
+def test_create_batch_receives_children_and_ids():
+    _, ax = plt.subplots()
+    calls = []
+    points = tbx.Points(
+        ax=ax, child_ids="int", on_create_batch=lambda *args: calls.append(args)
+    )
+    points.add_many(x=np.arange(1000.0), y=0.0)
+    points.click(5, 5)
+    assert len(calls) == 2
+    children, ids = calls[0]
+    assert children == points.children[:1000]
+    assert np.array_equal(ids, np.arange(1000))
+    assert calls[1][0] == [points.children[-1]]
+    assert np.array_equal(calls[1][1], [1000])
+
+
+def test_change_batch_once_per_drag_event(drag):
+    _, ax = plt.subplots()
+    ax.set(xlim=(0, 100), ylim=(0, 100))
+    changed = []
+    batches = []
+    rects = tbx.Rectangles(
+        ax=ax,
+        on_change=changed.append,
+        on_change_batch=lambda children, ids: batches.append(ids),
+    )
+    rects.add_many(x=[10.0, 30.0, 50.0], y=10.0, width=10.0, height=10.0)
+    rects.select(rects.children)
+    drag(ax, [(15, 15), (20, 20), (25, 25)], button=3)
+    # Every motion event calls on_change once per child, and on_change_batch once
+    assert len(changed) == 6
+    assert len(batches) == 2
+    ids = [child.id for child in rects.children]
+    assert all(np.array_equal(batch, ids) for batch in batches)
+
+
+def test_change_batch_of_set_geometry():
+    _, ax = plt.subplots()
+    batches = []
+    vspans = tbx.Vspans(ax=ax, on_change_batch=lambda *args: batches.append(args))
+    vspans.add_many(left=[1.0, 5.0, 9.0], right=[2.0, 6.0, 10.0])
+    ids = [vspans.children[0].id, vspans.children[2].id]
+    vspans.set_geometry(ids=ids, left=[0.0, 8.0], right=[3.0, 11.0])
+    ((children, changed),) = batches
+    assert children == [vspans.children[0], vspans.children[2]]
+    assert list(changed) == ids
+
+
+def test_remove_batch():
+    _, ax = plt.subplots()
+    removed = []
+    batches = []
+    points = tbx.Points(
+        ax=ax, on_remove=removed.append, on_remove_batch=lambda c, i: batches.append(c)
+    )
+    points.add_many(x=np.arange(5.0), y=0.0)
+    first, second, third = points.children[:3]
+    points.remove(first)
+    points.remove_many([0, 1])
+    assert batches == [[first], [second, third]]
+    assert removed == [first, second, third]
+
+
+def test_batched_callbacks_inside_batch():
+    _, ax = plt.subplots()
+    created = []
+    changed = []
+    rects = tbx.Rectangles(
+        ax=ax,
+        on_create_batch=lambda c, i: created.append(c),
+        on_change_batch=lambda c, i: changed.append(c),
+    )
+    rects.add_many(x=[0.0, 10.0], y=0.0, width=1.0, height=1.0)
+    created.clear()
+    with rects.batch():
+        for x in range(20, 70, 10):
+            rects.add_many(x=[float(x)], y=0.0, width=1.0, height=1.0)
+        rects.set_geometry(
+            ids=[c.id for c in rects.children[:2]],
+            x=[0.0, 10.0],
+            y=5.0,
+            width=1.0,
+            height=1.0,
+        )
+    assert created == [rects.children[2:]]
+    assert changed == [rects.children[:2]]
@@ -0,0 +1,133 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) Scipp contributors (https://github.com/scipp)
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+import mpltoolbox as tbx
+
+
+def count_draws(fig):
+    draws = []
+    fig.canvas.draw_idle = lambda: draws.append(True)
+    return draws
+
+
+def test_batch_draws_once():
+    fig, ax = plt.subplots()
+    ax.set(xlim=(0, 100), ylim=(0, 100))
+    rects = tbx.Rectangles(ax=ax)
+    draws = count_draws(fig)
+    with rects.batch():
+        for x in range(0, 50, 10):
+            rects.click(x, x)
+            rects.click(x + 5, x + 5)
+        rects.remove(0)
+        rects.children[0].width = 3.0
+        assert draws == []
+    assert len(draws) == 1
+    assert len(rects.children) == 4
+
+
+def test_batch_coalesces_callbacks():
+    _, ax = plt.subplots()
+    created = []
+    changed = []
+    removed = []
+    rects = tbx.Rectangles(
+        ax=ax,
+        on_create=created.append,
+        on_change=changed.append,
+        on_remove=removed.append,
+    )
+    rects.add_many(x=[0.0, 10.0, 20.0], y=0.0, width=1.0, height=1.0)
+    a, b, c = rects.children
+    created.clear()
+    with rects.batch():
+        (d,) = rects.add_many(x=[30.0], y=0.0, width=1.0, height=1.0)
+        (e,) = rects.add_many(x=[40.0], y=0.0, width=1.0, height=1.0)
+        rects.set_geometry(
+            ids=[a.id, b.id, d.id], x=[0.0, 10.0, 30.0], y=0.0, width=2.0, height=1.0
+        )
+        rects.set_geometry(ids=[a.id], x=[0.0], y=0.0, width=3.0, height=1.0)
+        rects.remove(b)
+        rects.remove(e)
+        assert created == changed == removed == []
+    # Created and then changed: only created. Created and removed: not reported.
+    assert created == [d]
+    assert changed == [a]
+    assert removed == [b]
+    assert c not in changed
+
+
+def test_batch_of_clicks_calls_per_child_callbacks():
+    _, ax = plt.subplots()
+    ax.set(xlim=(0, 100), ylim=(0, 100))
+    corners = []
+    batches = []
+    rects = tbx.Rectangles(
+        ax=ax,
+        on_create=lambda c: corners.append(c.xy),
+        on_create_batch=lambda c, ids: batches.append(len(c)),
+    )
+    with rects.batch():
+        rects.click(10, 10)
+        rects.click(20, 20)
+        rects.click(30, 30)
+        rects.click(40, 40)
+    assert corners == [(10, 10), (30, 30)]
+    assert batches == [2]
+
+
+def test_batch_nested_across_tools():
+    fig, ax = plt.subplots()
+    ax.set(xlim=(0, 100), ylim=(0, 100))
+    created = []
+    rects = tbx.Rectangles(ax=ax, on_create=created.append)
+    points = tbx.Points(ax=ax, on_create=created.append)
+    draws = count_draws(fig)
+    with rects.batch():
+        rects.add_many(x=[0.0], y=0.0, width=1.0, height=1.0)
+        with points.batch():
+            points.click(50, 50)
+        # Closing the inner batch does not flush
+        assert created == []
+        points.click(60, 60)
+    assert len(draws) == 1
+    assert created == [*rects.children, *points.children]
+
+
+def test_batch_flushes_on_error():
+    fig, ax = plt.subplots()
+    created = []
+    points = tbx.Points(ax=ax, on_create=created.append)
+    draws = count_draws(fig)
+
+    def fail():
+        with points.batch():
+            points.add_many(x=[1.0], y=[1.0])
+            raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        fail()
+    assert len(draws) == 1
+    assert created == points.children
+    # The batch is closed
+    points.add_many(x=[2.0], y=[2.0])
+    assert len(created) == 2
+
+
+def test_batch_skips_evicted_children():
+    _, ax = plt.subplots()
+    created = []
+    evicted = []
+    points = tbx.Points(
+        ax=ax, max_children=4, on_create=created.append, on_evict=evicted.extend
+    )
+    with points.batch():
+        for i in range(6):
+            points.add_many(x=[float(i)], y=[0.0])
+    assert len(evicted) > 0
+    assert created == points.children
+    assert np.array_equal(points.to_arrays()["x"][-1:], [5.0])
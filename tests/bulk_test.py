@@ -0,0 +1,185 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) Scipp contributors (https://github.com/scipp)
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+import mpltoolbox as tbx
+
+
+def test_add_many_rectangles():
+    _, ax = plt.subplots()
+    created = []
+    batches = []
+    rects = tbx.Rectangles(
+        ax=ax,
+        on_create=created.append,
+        on_create_batch=lambda c, ids: batches.append(c),
+    )
+    children = rects.add_many(x=[0, 10, 20], y=[5, 6, 7], width=2, height=[1, 2, 3])
+    assert rects.children == children
+    assert created == children
+    assert batches == [children]
+    assert children[1].xy == (10, 6)
+    assert children[1].width == 2
+    assert children[2].height == 3
+    assert np.array_equal(rects.to_arrays()["x"], [0, 10, 20])
+    assert rects.containing(11, 7) == [children[1]]
+    # The axes limits cover all the new rectangles
+    xmin, xmax = ax.get_xlim()
+    assert xmin <= 0
+    assert xmax >= 22
+
+
+def test_add_many_continues_after_clicks():
+    _, ax = plt.subplots()
+    ellipses = tbx.Ellipses(ax=ax)
+    ellipses.click(0, 0)
+    ellipses.click(10, 10)
+    ellipses.add_many(x=[1, 2], y=[3, 4], width=[5, 6], height=[7, 8])
+    assert len(ellipses.children) == 3
+    assert ellipses.children[2].center == (2, 4)
+    assert np.array_equal(ellipses.to_arrays()["width"], [10, 5, 6])
+
+
+def test_add_many_spans_and_points():
+    _, ax = plt.subplots()
+    vspans = tbx.Vspans(ax=ax)
+    vspans.add_many(left=[1, 5], right=[3, 9])
+    assert vspans.children[1].left == 5
+    assert vspans.children[1].right == 9
+    assert vspans.count_containing(2) == 1
+    hspans = tbx.Hspans(ax=ax)
+    hspans.add_many(bottom=[1], top=[40])
+    assert hspans.children[0].top == 40
+    assert ax.get_ylim()[1] >= 40
+    points = tbx.Points(ax=ax)
+    points.add_many(x=np.arange(100.0), y=np.arange(100.0) ** 2)
+    assert len(points.children) == 100
+    assert points.children[7].xy == (7, 49)
+
+
+def test_add_many_lines_from_arrays():
+    _, ax = plt.subplots()
+    lines = tbx.Lines(ax=ax)
+    lines.click(0, 0)
+    lines.click(1, 1)
+    arrays = lines.to_arrays()
+    other = tbx.Lines(ax=ax)
+    other.add_many(x=arrays["x"], y=arrays["y"], offsets=arrays["offsets"])
+    other.add_many(x=[0, 1, 2, 5, 6], y=[0, 1, 0, 5, 5], offsets=[0, 3, 5])
+    assert np.array_equal(other.vertex_counts(), [2, 3, 2])
+    assert np.array_equal(other.children[1].y, [0, 1, 0])
+
+
+def test_add_many_closes_polygons():
+    _, ax = plt.subplots()
+    polygons = tbx.Polygons(ax=ax)
+    polygons.add_many(x=[0, 1, 1, 0], y=[0, 0, 1, 1], offsets=[0, 4])
+    assert np.array_equal(polygons.children[0].x, [0, 1, 1, 0, 0])
+    assert np.allclose(polygons.areas(), [1])
+
+
+def test_add_many_bad_arrays_raises():
+    _, ax = plt.subplots()
+    rects = tbx.Rectangles(ax=ax)
+    with pytest.raises(ValueError, match="width, height"):
+        rects.add_many(x=[1], y=[2])
+    lines = tbx.Lines(ax=ax)
+    with pytest.raises(ValueError, match="offsets"):
+        lines.add_many(x=[1, 2], y=[1, 2], offsets=[0, 3])
+    assert not rects.children
+    assert not lines.children
+
+
+def test_set_geometry_updates_children_and_indices():
+    _, ax = plt.subplots()
+    changed = []
+    rects = tbx.Rectangles(ax=ax, on_change=changed.append)
+    children = rects.add_many(x=[0, 10, 20], y=0, width=1, height=1)
+    rects.set_geometry(
+        [children[2].id, children[0].id], x=[5, 6], y=[7, 8], width=2, height=3
+    )
+    assert children[2].xy == (5, 7)
+    assert children[0].xy == (6, 8)
+    assert children[1].xy == (10, 0)
+    assert np.array_equal(rects.to_arrays()["x"], [6, 10, 5])
+    assert np.array_equal(rects.to_arrays()["height"], [3, 1, 3])
+    assert rects.containing(6.5, 7.5) == [children[2]]
+    assert changed == [children[2], children[0]]
+
+
+def test_set_geometry_all_children():
+    _, ax = plt.subplots()
+    vspans = tbx.Vspans(ax=ax)
+    vspans.add_many(left=[0, 10], right=[1, 11])
+    vspans.set_geometry(left=[2, 3], right=[4, 5])
+    assert vspans.children[1].left == 3
+    assert vspans.children[1].right == 5
+    assert vspans.count_containing(3.5) == 2
+    assert np.array_equal(vspans.children[0].vertices[0], [2, 4])
+    lines = tbx.Lines(ax=ax)
+    lines.add_many(x=[0, 1, 2, 3], y=[0, 1, 2, 3], offsets=[0, 2, 4])
+    lines.set_geometry(x=[0, 1, 2, 5, 6], y=[0, 1, 2, 5, 6], offsets=[0, 3, 5])
+    assert np.array_equal(lines.vertex_counts(), [3, 2])
+    assert np.array_equal(lines.children[1].x, [5, 6])
+
+
+def test_set_geometry_wrong_length_raises():
+    _, ax = plt.subplots()
+    points = tbx.Points(ax=ax)
+    points.add_many(x=[0, 1], y=[0, 1])
+    with pytest.raises(ValueError, match="2 children to update"):
+        points.set_geometry(x=[0, 1, 2], y=[0, 1, 2])
+
+
+def test_remove_many_with_ids_indices_and_mask():
+    _, ax = plt.subplots()
+    removed = []
+    each = []
+    rects = tbx.Rectangles(
+        ax=ax,
+        on_remove=each.append,
+        on_remove_batch=lambda c, ids: removed.append(c),
+    )
+    children = rects.add_many(x=np.arange(6.0), y=0, width=0.5, height=1)
+    nartists = len(ax.get_children())
+    rects.remove_many([children[1].id, children[4].id])
+    assert removed == [[children[1], children[4]]]
+    assert each == [children[1], children[4]]
+    rects.remove_many([0, 0])
+    assert removed[-1] == [children[0]]
+    rects.remove_many(np.array([False, True, False]))
+    assert removed[-1] == [children[3]]
+    assert rects.children == [children[2], children[5]]
+    assert len(ax.get_children()) == nartists - 8
+    assert children[1]._patch.axes is None
+    assert np.array_equal(rects.to_arrays()["x"], [2, 5])
+    assert rects.containing(2.2, 0.5) == [children[2]]
+    # The remaining artists can still be removed one by one
+    rects.remove(children[2])
+    assert rects.children == [children[5]]
+    assert len(ax.get_children()) == nartists - 10
+
+
+def test_remove_many_bad_mask_raises():
+    _, ax = plt.subplots()
+    points = tbx.Points(ax=ax)
+    points.add_many(x=[0, 1], y=[0, 1])
+    with pytest.raises(ValueError, match="mask has 3 entries"):
+        points.remove_many([True, False, True])
+
+
+def test_clear_removes_all_artists():
+    _, ax = plt.subplots()
+    before = len(ax.get_children())
+    vspans = tbx.Vspans(ax=ax)
+    vspans.add_many(left=np.arange(50.0), right=np.arange(50.0) + 0.5)
+    polygons = tbx.Polygons(ax=ax)
+    polygons.add_many(x=[0, 1, 1], y=[0, 0, 1], offsets=[0, 3])
+    vspans.clear()
+    assert len(ax.get_children()) == before + 2
+    assert vspans.count_containing(1.2) == 0
+    polygons.clear()
+    assert len(ax.get_children()) == before
@@ -4,6 +4,9 @@
 import matplotlib
 import matplotlib.pyplot as plt
 import pytest
+from matplotlib.backend_bases import MouseEvent, TimerBase
+
+import mpltoolbox as tbx
 
 
 @pytest.fixture(autouse=True)
@@ -21,3 +24,94 @@ def close_figures():
     yield
     for fig in map(plt.figure, plt.get_fignums()):
         plt.close(fig)
+
+
+def _send(ax, name, x, y, button=1, modifiers=None):
+    xdisp, ydisp = ax.transData.transform((x, y))
+    event = MouseEvent(
+        name, ax.figure.canvas, xdisp, ydisp, button=button, modifiers=modifiers
+    )
+    ax.figure.canvas.callbacks.process(name, event)
+
+
+def _drag(ax, path, button=1, modifiers=None):
+    _send(ax, "button_press_event", *path[0], button=button, modifiers=modifiers)
+    for x, y in path[1:]:
+        _send(ax, "motion_notify_event", x, y, button=button, modifiers=modifiers)
+    _send(ax, "button_release_event", *path[-1], button=button, modifiers=modifiers)
+
+
+@pytest.fixture
+def send():
+    """
+    Send a mouse event at the data coordinates ``x`` and ``y`` of an axes.
+    """
+    return _send
+
+
+@pytest.fixture
+def drag():
+    """
+    Press the mouse at the first position of ``path``, move it through the other
+    positions and release it at the last one.
+    """
+    return _drag
+
+
+class Timer(TimerBase):
+    """
+    A timer that only fires when asked to, standing in for the event loop.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.running = False
+        super().__init__(*args, **kwargs)
+
+    def _timer_start(self):
+        self.running = True
+
+    def _timer_stop(self):
+        self.running = False
+
+    def fire(self):
+        if self.running:
+            if self.single_shot:
+                self.running = False
+            self._on_timer()
+
+
+@pytest.fixture
+def manual_timers():
+    """
+    Make the canvas of a figure create :class:`Timer` instances, and return the
+    list of the timers it creates.
+    """
+
+    def install(fig):
+        timers = []
+
+        def new_timer(*args, **kwargs):
+            timers.append(Timer(*args, **kwargs))
+            return timers[-1]
+
+        fig.canvas.new_timer = new_timer
+        return timers
+
+    return install
+
+
+@pytest.fixture
+def make_rectangles():
+    """
+    Add rectangles to an axes with ``add_many``, by default two rectangles of size
+    10 at ``x=10`` and ``x=50``, in axes limited to ``(0, 100)``. The other
+    keyword arguments are passed to the tool.
+    """
+
+    def make(ax, x=(10.0, 50.0), y=10.0, width=10.0, height=10.0, **kwargs):
+        ax.set(xlim=(0, 100), ylim=(0, 100))
+        rects = tbx.Rectangles(ax=ax, **kwargs)
+        rects.add_many(x=x, y=y, width=width, height=height)
+        return rects
+
+    return make
@@ -0,0 +1,127 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) Scipp contributors (https://github.com/scipp)
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+import mpltoolbox as tbx
+
+
+def test_throttle_delivers_first_and_latest_event(send, manual_timers, make_rectangles):
+    fig, ax = plt.subplots()
+    timers = manual_timers(fig)
+    rects = make_rectangles(ax)
+    widths = []
+    rects.on_change(lambda c: widths.append(c.width), delivery=tbx.throttle(0.1))
+    (timer,) = timers
+    assert timer.interval == 100
+    send(ax, "button_press_event", 20, 20)
+    for x in range(21, 30):
+        send(ax, "motion_notify_event", x, 20)
+    assert np.allclose(widths, [11])
+    timer.fire()
+    assert np.allclose(widths, [11, 19])
+    send(ax, "motion_notify_event", 30, 20)
+    send(ax, "motion_notify_event", 31, 20)
+    # The release delivers the pending change
+    send(ax, "button_release_event", 31, 20)
+    assert np.allclose(widths, [11, 19, 21])
+    # The timer stops once there is nothing left to deliver
+    timer.fire()
+    timer.fire()
+    assert not timer.running
+    assert len(widths) == 3
+
+
+def test_debounce_delivers_after_motion_stops(send, manual_timers, make_rectangles):
+    fig, ax = plt.subplots()
+    timers = manual_timers(fig)
+    rects = make_rectangles(ax)
+    changed = []
+    rects.on_change(changed.append, delivery=tbx.debounce(0.2))
+    (timer,) = timers
+    assert timer.single_shot
+    send(ax, "button_press_event", 20, 20)
+    for x in range(21, 30):
+        send(ax, "motion_notify_event", x, 20)
+    assert changed == []
+    timer.fire()
+    assert changed == [rects.children[0]]
+    assert np.isclose(rects.children[0].width, 19)
+    send(ax, "motion_notify_event", 35, 20)
+    send(ax, "button_release_event", 35, 20)
+    assert len(changed) == 2
+    assert not timer.running
+
+
+def test_latest_event_of_every_child_is_kept(send, manual_timers, make_rectangles):
+    fig, ax = plt.subplots()
+    timers = manual_timers(fig)
+    rects = make_rectangles(ax)
+    moved = []
+    rects.on_drag_move(moved.append, delivery=tbx.debounce(0.1))
+    rects.select(rects.children)
+    send(ax, "button_press_event", 15, 15, button=3)
+    for x in range(16, 25):
+        send(ax, "motion_notify_event", x, 15, button=3)
+    timers[0].fire()
+    assert moved == rects.children
+
+
+def test_debounced_batches_are_merged(manual_timers):
+    fig, ax = plt.subplots()
+    timers = manual_timers(fig)
+    rects = tbx.Rectangles(ax=ax, child_ids="int")
+    rects.add_many(x=[0.0, 10.0, 20.0], y=0.0, width=1.0, height=1.0)
+    batches = []
+    rects.on_change_batch(
+        lambda children, ids: batches.append((children, ids)),
+        delivery=tbx.debounce(0.1),
+    )
+    a, b, c = rects.children
+    rects.set_geometry(ids=[0, 1], x=[1.0, 11.0], y=0.0, width=1.0, height=1.0)
+    rects.set_geometry(ids=[2], x=[21.0], y=0.0, width=1.0, height=1.0)
+    rects.set_geometry(ids=[0], x=[2.0], y=0.0, width=1.0, height=1.0)
+    timers[0].fire()
+    ((children, ids),) = batches
+    assert children == [b, c, a]
+    assert list(ids) == [1, 2, 0]
+
+
+def test_immediate_callbacks_are_unchanged(send, manual_timers, make_rectangles):
+    fig, ax = plt.subplots()
+    manual_timers(fig)
+    rects = make_rectangles(ax)
+    changed = []
+    throttled = []
+    rects.on_change(changed.append)
+    rects.on_change(throttled.append, delivery=tbx.throttle(1.0))
+    send(ax, "button_press_event", 20, 20)
+    for x in range(21, 26):
+        send(ax, "motion_notify_event", x, 20)
+    send(ax, "button_release_event", 25, 20)
+    assert len(changed) == 5
+    assert len(throttled) == 2
+
+
+def test_close_cancels_pending_calls(send, manual_timers, make_rectangles):
+    fig, ax = plt.subplots()
+    timers = manual_timers(fig)
+    rects = make_rectangles(ax)
+    changed = []
+    rects.on_change(changed.append, delivery=tbx.debounce(0.1))
+    send(ax, "button_press_event", 20, 20)
+    send(ax, "motion_notify_event", 25, 20)
+    rects.close()
+    timers[0].fire()
+    assert changed == []
+
+
+def test_invalid_delivery():
+    _, ax = plt.subplots()
+    rects = tbx.Rectangles(ax=ax)
+    with pytest.raises(ValueError, match="Unknown delivery"):
+        rects.on_change(print, delivery="later")
+    with pytest.raises(ValueError, match="positive"):
+        tbx.throttle(0)
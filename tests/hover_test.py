@@ -0,0 +1,107 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) Scipp contributors (https://github.com/scipp)
+
+import matplotlib.pyplot as plt
+from matplotlib.backend_bases import MouseEvent
+from matplotlib.backend_tools import Cursors
+
+import mpltoolbox as tbx
+
+
+def hover(ax, x, y):
+    xdisp, ydisp = ax.transData.transform((x, y))
+    event = MouseEvent("motion_notify_event", ax.figure.canvas, xdisp, ydisp)
+    ax.figure.canvas.callbacks.process("motion_notify_event", event)
+
+
+def test_hover_highlights_child_under_cursor():
+    _, ax = plt.subplots()
+    ax.set(xlim=(0, 100), ylim=(0, 100))
+    rects = tbx.Rectangles(ax=ax, enable_hover=True)
+    rects.click(10, 10)
+    rects.click(30, 30)
+    rects.click(60, 60)
+    rects.click(90, 90)
+    lw = ax.patches[0].get_linewidth()
+    hover(ax, 20, 20)
+    assert rects._hovered is rects.children[0]
+    assert ax.patches[0].get_linewidth() == 2 * lw
+    assert ax.patches[1].get_linewidth() == lw
+    hover(ax, 75, 75)
+    assert rects._hovered is rects.children[1]
+    assert ax.patches[0].get_linewidth() == lw
+    assert ax.patches[1].get_linewidth() == 2 * lw
+    hover(ax, 45, 45)
+    assert rects._hovered is None
+    assert ax.patches[1].get_linewidth() == lw
+
+
+def test_hover_disabled_by_default():
+    _, ax = plt.subplots()
+    ax.set(xlim=(0, 100), ylim=(0, 100))
+    rects = tbx.Rectangles(ax=ax)
+    rects.click(10, 10)
+    rects.click(30, 30)
+    hover(ax, 20, 20)
+    assert rects._hovered is None
+
+
+def test_hover_sets_cursor_over_vertices_and_body():
+    _, ax = plt.subplots()
+    ax.set(xlim=(0, 100), ylim=(0, 100))
+    rects = tbx.Rectangles(ax=ax, enable_hover=True)
+    rects.click(10, 10)
+    rects.click(50, 50)
+    hover(ax, 10, 10)
+    assert rects._cursor == Cursors.HAND
+    hover(ax, 30, 30)
+    assert rects._cursor == Cursors.MOVE
+    hover(ax, 80, 80)
+    assert rects._cursor == Cursors.POINTER
+
+
+def test_hover_follows_dragged_child():
+    _, ax = plt.subplots()
+    ax.set(xlim=(0, 100), ylim=(0, 100))
+    points = tbx.Points(ax=ax, enable_hover=True)
+    points.click(20, 20)
+    points.children[0].xy = (70, 70)
+    hover(ax, 20, 20)
+    assert points._hovered is None
+    hover(ax, 70, 70)
+    assert points._hovered is points.children[0]
+
+
+def test_hover_forgets_removed_child():
+    _, ax = plt.subplots()
+    ax.set(xlim=(0, 100), ylim=(0, 100))
+    vspans = tbx.Vspans(ax=ax, enable_hover=True)
+    vspans.click(20, 20)
+    vspans.click(40, 20)
+    hover(ax, 30, 80)
+    assert vspans._hovered is vspans.children[0]
+    vspans.remove(0)
+    assert vspans._hovered is None
+    hover(ax, 30, 80)
+    assert vspans._hovered is None
+
+
+def test_hover_is_suspended_while_zooming():
+    _, ax = plt.subplots()
+    ax.set(xlim=(0, 100), ylim=(0, 100))
+    rects = tbx.Rectangles(ax=ax, enable_hover=True)
+    rects.click(10, 10)
+    rects.click(50, 50)
+    lw = ax.patches[0].get_linewidth()
+    hover(ax, 30, 30)
+    assert rects._hovered is rects.children[0]
+    toolbar = ax.figure.canvas.toolbar
+    toolbar.zoom()
+    hover(ax, 10, 10)
+    assert rects._hovered is None
+    assert ax.patches[0].get_linewidth() == lw
+    assert rects._cursor is None
+    toolbar.zoom()
+    hover(ax, 30, 30)
+    assert rects._hovered is rects.children[0]
+    assert rects._cursor == Cursors.MOVE
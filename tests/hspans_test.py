@@ -192,3 +192,18 @@ def test_hspans_shutdown():
     hspans.click(x=0, y=60)
     hspans.click(x=0, y=80)
     assert len(ax.patches) == 0
+
+
+def test_hspans_interval_queries():
+    _, ax = plt.subplots()
+    spans = tbx.Hspans(ax=ax)
+    for bottom, top in [(10, 20), (15, 30), (50, 40)]:
+        spans.click(x=5, y=bottom)
+        spans.click(x=5, y=top)
+    assert spans.spans_containing(17) == spans.children[:2]
+    assert spans.spans_overlapping(25, 42) == spans.children[1:]
+    assert list(spans.count_containing([5, 12, 17, 45])) == [0, 1, 2, 1]
+    spans.children[2].top = 60
+    assert spans.spans_containing(55) == [spans.children[2]]
+    spans.remove(2)
+    assert not spans.overlaps(35, 100)
@@ -0,0 +1,82 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) Scipp contributors (https://github.com/scipp)
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+import mpltoolbox as tbx
+
+
+def test_uuid_ids_are_generated_lazily():
+    _, ax = plt.subplots()
+    rects = tbx.Rectangles(ax=ax)
+    children = rects.add_many(x=[0, 10, 20], y=0, width=1, height=1)
+    assert all(child._id is None for child in children)
+    child_id = children[1].id
+    assert isinstance(child_id, str)
+    assert len(child_id) == 32
+    assert children[1].id == child_id
+    assert children[0]._id is None
+
+
+def test_remove_with_uuid():
+    _, ax = plt.subplots()
+    points = tbx.Points(ax=ax)
+    children = points.add_many(x=[0, 1, 2], y=0)
+    points.remove(children[1].id)
+    assert points.children == [children[0], children[2]]
+    # Unknown ids are ignored
+    points.remove("not-an-id")
+    assert len(points.children) == 2
+
+
+def test_remove_with_assigned_id():
+    _, ax = plt.subplots()
+    points = tbx.Points(ax=ax)
+    children = points.add_many(x=[0, 1, 2], y=0)
+    children[2].id = "restored"
+    points.remove("restored")
+    assert points.children == children[:2]
+
+
+def test_int_ids_are_monotonic_and_never_reused():
+    _, ax = plt.subplots()
+    rects = tbx.Rectangles(ax=ax, child_ids="int")
+    children = rects.add_many(x=[0, 10, 20], y=0, width=1, height=1)
+    assert [child.id for child in children] == [0, 1, 2]
+    rects.remove_many([children[2]])
+    rects.click(30, 30)
+    rects.click(31, 32)
+    assert rects.children[-1].id == 3
+    rects.clear()
+    rects.click(30, 30)
+    rects.click(31, 32)
+    assert rects.children[-1].id == 4
+
+
+def test_int_ids_lookup():
+    _, ax = plt.subplots()
+    rects = tbx.Rectangles(ax=ax, child_ids="int")
+    children = rects.add_many(x=[0, 10, 20], y=0, width=1, height=1)
+    assert rects.get_child(2) is children[2]
+    rects.set_geometry([2, 0], x=[5, 6], y=0, width=1, height=1)
+    assert np.array_equal(rects.to_arrays()["x"], [6, 10, 5])
+    # Integers passed to remove are positions
+    rects.remove(0)
+    assert rects.children == children[1:]
+    with pytest.raises(KeyError):
+        rects.get_child(0)
+
+
+def test_polygons_int_ids_in_arrays():
+    _, ax = plt.subplots()
+    polys = tbx.Polygons(ax=ax, child_ids="int")
+    polys.add_many(x=[0, 1, 1, 2, 3, 3], y=[0, 0, 1, 0, 0, 1], offsets=[0, 3, 6])
+    assert list(polys.ids()) == [0, 1]
+
+
+def test_unknown_child_ids_raises():
+    _, ax = plt.subplots()
+    with pytest.raises(ValueError, match="child_ids"):
+        tbx.Points(ax=ax, child_ids="random")
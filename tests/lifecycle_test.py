@@ -0,0 +1,113 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) Scipp contributors (https://github.com/scipp)
+
+import gc
+import tracemalloc
+import weakref
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+import mpltoolbox as tbx
+
+TOOLS = ["Rectangles", "Ellipses", "Points", "Vspans", "Hspans", "Lines", "Polygons"]
+
+
+def make_tool(name, ax, **kwargs):
+    tool = getattr(tbx, name)(ax=ax, **kwargs)
+    if name in ("Lines", "Polygons"):
+        tool.add_many(x=[1, 2, 3], y=[1, 4, 2], offsets=[0, 3])
+    elif name == "Vspans":
+        tool.add_many(left=[1], right=[2])
+    elif name == "Hspans":
+        tool.add_many(bottom=[1], top=[2])
+    elif name == "Points":
+        tool.add_many(x=[1], y=[1])
+    else:
+        tool.add_many(x=[1], y=[1], width=1, height=1)
+    return tool
+
+
+@pytest.mark.parametrize("name", TOOLS)
+def test_dropped_tool_is_freed(name):
+    _, ax = plt.subplots()
+    ax.set(xlim=(0, 10), ylim=(0, 10))
+    tool = make_tool(name, ax)
+    # Interact with the children, to connect and disconnect the event handlers
+    tool.click(1.5, 1.5, button=3)
+    tool_ref = weakref.ref(tool)
+    child_ref = weakref.ref(tool.children[0])
+    del tool
+    # The tool and its children are freed without waiting for the garbage collector
+    assert tool_ref() is None
+    assert child_ref() is None
+    assert not ax.patches
+    assert not ax.lines
+
+
+def test_del_does_not_draw(monkeypatch):
+    fig, ax = plt.subplots()
+    tool = make_tool("Rectangles", ax)
+    draws = []
+    monkeypatch.setattr(fig.canvas, "draw_idle", lambda: draws.append(1))
+    del tool
+    assert not draws
+
+
+def test_close_releases_callbacks():
+    _, ax = plt.subplots()
+    data = np.zeros(10)
+    data_ref = weakref.ref(data)
+
+    class Handler:
+        def __init__(self, data):
+            self.data = data
+
+        def __call__(self, child):
+            return
+
+    tool = make_tool("Points", ax, on_change=Handler(data))
+    del data
+    tool.close()
+    assert data_ref() is None
+    assert not tool.children
+    assert not ax.lines
+    with pytest.raises(RuntimeError, match="closed"):
+        tool.start()
+    # Closing twice is harmless
+    tool.close()
+
+
+def test_context_manager():
+    _, ax = plt.subplots()
+    with tbx.Rectangles(ax=ax) as rects:
+        rects.add_many(x=[0, 5], y=0, width=1, height=1)
+        assert len(ax.patches) == 2
+    assert not ax.patches
+    assert not rects.children
+
+
+def test_repeated_tool_creation_does_not_leak():
+    _, ax = plt.subplots()
+    ax.set(xlim=(0, 10), ylim=(0, 10))
+
+    def cycle():
+        for name in TOOLS:
+            tool = make_tool(name, ax, on_create=lambda child: None)
+            tool.click(5, 5)
+            tool.click(6, 6)
+            del tool
+
+    # Warm up the caches of matplotlib
+    cycle()
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for _ in range(10):
+        cycle()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Each cycle creates 7 tools, whose children alone take more than 100 KiB
+    assert after - before < 100 * 1024
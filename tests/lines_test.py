@@ -3,9 +3,11 @@
 
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.backend_bases import MouseEvent
 from matplotlib.colors import to_hex
 
 import mpltoolbox as tbx
+from mpltoolbox import DummyEvent
 
 
 def test_lines_creation():
@@ -198,3 +200,75 @@ def test_lines_shutdown():
     lines.click(x=30, y=60)
     lines.click(x=40, y=80)
     assert len(ax.lines) == 0
+
+
+def test_lines_pick_long_line():
+    fig, ax = plt.subplots()
+    lines = tbx.Lines(n=2, ax=ax)
+    lines.click(x=0, y=0)
+    lines.click(x=1, y=1)
+    x = np.linspace(0, 100, 100_001)
+    lines.children[0].xy = (x, np.sin(x))
+    ax.set(xlim=(0, 100), ylim=(-2, 2))
+
+    picked = []
+    fig.canvas.mpl_connect("pick_event", lambda event: picked.append(event.ind))
+    xdisp, ydisp = ax.transData.transform((50.0, np.sin(50.0)))
+    fig.pick(MouseEvent("button_press_event", fig.canvas, xdisp, ydisp, button=3))
+    assert len(picked) == 1
+    line = ax.lines[0]
+    expected = line.contains(
+        MouseEvent("button_press_event", fig.canvas, xdisp, ydisp, button=3)
+    )[1]["ind"]
+    # Matplotlib ignores segments whose closest point is one of their ends
+    assert set(expected) <= set(picked[0])
+    assert picked[0][0] in expected
+
+    xdisp, ydisp = ax.transData.transform((50.0, 1.9))
+    fig.pick(MouseEvent("button_press_event", fig.canvas, xdisp, ydisp, button=3))
+    assert len(picked) == 1
+
+
+def test_lines_pick_after_move_vertex():
+    _, ax = plt.subplots()
+    ax.set(xlim=(0, 100), ylim=(0, 100))
+    lines = tbx.Lines(n=3, ax=ax)
+    lines.click(x=10, y=10)
+    lines.click(x=50, y=50)
+    lines.click(x=90, y=10)
+    line = lines.children[0]
+    assert line.contains_point(50, 50, radius=2)
+    line.move_vertex(DummyEvent(50, 90, ax, 1, None), ind=1)
+    assert not line.contains_point(50, 50, radius=2)
+    assert line.contains_point(50, 90, radius=2)
+    assert line.contains_point(30, 50, radius=2)
+
+
+def test_lines_move_vertex_updates_only_its_rows():
+    _, ax = plt.subplots()
+    ax.set(xlim=(0, 100), ylim=(0, 100))
+    lines = tbx.Lines(n=3, ax=ax)
+    lines.add_many(
+        x=[10.0, 50.0, 90.0, 0.0, 5.0, 9.0],
+        y=[10.0, 50.0, 10.0, 0.0, 5.0, 9.0],
+        offsets=[0, 3, 6],
+    )
+    line = lines.children[0]
+    assert line.bbox == (10, 10, 90, 50)
+
+    def update(*args):
+        raise AssertionError("All the vertices of the line were rewritten.")
+
+    lines._ragged.update = update
+    # An inner vertex moving out of the bounds grows the bounding box
+    line.move_vertex(DummyEvent(50, 90, ax, 1, None), ind=1)
+    assert line.bbox == (10, 10, 90, 90)
+    # A vertex on the bounds moving inwards shrinks it
+    line.move_vertex(DummyEvent(50, 20, ax, 1, None), ind=1)
+    assert line.bbox == (10, 10, 90, 20)
+    line.move_vertex(DummyEvent(30, 15, ax, 1, None), ind=0)
+    assert line.bbox == (30, 10, 90, 20)
+    assert np.array_equal(lines.to_arrays()["x"], [30, 50, 90, 0, 5, 9])
+    assert np.array_equal(lines.to_arrays()["y"], [15, 20, 10, 0, 5, 9])
+    assert lines.intersecting(85, 0, 100, 12) == [line]
+    assert lines.intersecting(0, 30, 100, 100) == []
@@ -0,0 +1,80 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) Scipp contributors (https://github.com/scipp)
+
+import gc
+import sys
+import tracemalloc
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+import mpltoolbox as tbx
+
+N = 200
+
+# Upper bounds of the memory used per child, in KiB, documented in docs/memory.md
+FOOTPRINTS = {
+    "Rectangles": ({"x": np.arange(N), "y": 0, "width": 1, "height": 1}, 32),
+    "Ellipses": ({"x": np.arange(N), "y": 0, "width": 1, "height": 1}, 32),
+    "Points": ({"x": np.arange(N), "y": 0}, 20),
+    "Vspans": ({"left": np.arange(N), "right": np.arange(N) + 0.5}, 48),
+    "Hspans": ({"bottom": np.arange(N), "top": np.arange(N) + 0.5}, 48),
+    "Lines": (
+        {
+            "x": np.arange(2 * N),
+            "y": np.arange(2 * N),
+            "offsets": np.arange(N + 1) * 2,
+        },
+        20,
+    ),
+    "Polygons": (
+        {
+            "x": np.tile([0, 1, 1], N),
+            "y": np.tile([0, 0, 1], N),
+            "offsets": np.arange(N + 1) * 3,
+        },
+        32,
+    ),
+}
+
+
+@pytest.mark.parametrize("name", list(FOOTPRINTS))
+def test_memory_per_child(name):
+    arrays, limit = FOOTPRINTS[name]
+    _, ax = plt.subplots()
+    tool = getattr(tbx, name)(ax=ax)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    children = tool.add_many(**arrays)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert (after - before) / N < limit * 1024
+    # The attributes of the children are stored in slots, not in a dict
+    child = children[0]
+    assert sys.getsizeof(child) <= 200
+    assert not any(isinstance(ref, dict) for ref in gc.get_referents(child))
+
+
+def test_children_accept_extra_attributes():
+    _, ax = plt.subplots()
+    points = tbx.Points(ax=ax)
+    points.click(1, 2)
+    points.children[0].associated = "label"
+    assert points.children[0].associated == "label"
+
+
+def test_float32_geometry():
+    _, ax = plt.subplots()
+    rects = tbx.Rectangles(ax=ax, geometry_dtype="float32")
+    rects.add_many(x=[0.1, 2], y=0, width=1, height=[1, 3])
+    arrays = rects.to_arrays()
+    assert arrays["x"].dtype == np.float32
+    assert np.allclose(arrays["x"], [0.1, 2])
+    # The artists keep double precision
+    assert rects.children[0].xy[0] == 0.1
+    polygons = tbx.Polygons(ax=ax, geometry_dtype="float32")
+    polygons.add_many(x=[0, 1, 1], y=[0, 0, 1], offsets=[0, 3])
+    assert polygons.to_arrays()["x"].dtype == np.float32
+    assert np.allclose(polygons.areas(), [0.5])
+    assert polygons.areas().dtype == np.float64
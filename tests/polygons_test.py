@@ -6,6 +6,7 @@ import numpy as np
 from matplotlib.colors import to_hex
 
 import mpltoolbox as tbx
+from mpltoolbox import DummyEvent
 
 
 def test_polygons_creation():
@@ -204,3 +205,59 @@ def test_polygons_shutdown():
     for xi, yi in zip(np.array(x) + 1, np.array(y) + 1, strict=True):
         polys.click(x=xi, y=yi)
     assert len(ax.patches) == 0
+
+
+def test_polygons_many_vertices():
+    _, ax = plt.subplots()
+    ax.set(xlim=(0, 100), ylim=(0, 100))
+    poly = tbx.Polygons(ax=ax)
+    angles = np.linspace(0, 2 * np.pi, 50, endpoint=False)
+    x = 50 + 40 * np.cos(angles)
+    y = 50 + 40 * np.sin(angles)
+    for xi, yi in zip(x, y, strict=True):
+        poly.click(xi, yi)
+    poly.click(x[0], y[0])
+    assert len(poly.children) == 1
+    assert np.allclose(poly.children[0].x, [*x, x[0]])
+    assert np.allclose(poly.children[0].y, [*y, y[0]])
+    fill = poly.children[0]._fill.get_xy()
+    assert np.allclose(fill, np.column_stack([[*x, x[0]], [*y, y[0]]]))
+
+
+def test_polygons_move_vertex_updates_fill_in_place():
+    _, ax = plt.subplots()
+    ax.set(xlim=(0, 100), ylim=(0, 100))
+    polys = tbx.Polygons(ax=ax)
+    for xi, yi in [(20, 40), (80, 70), (50, 90), (20, 40)]:
+        polys.click(x=xi, y=yi)
+    poly = polys.children[0]
+    path = poly._fill.get_path()
+    poly.move_vertex(DummyEvent(60, 95, ax, 1, None), ind=2)
+    assert poly._fill.get_path() is path
+    assert np.allclose(path.vertices[2], [60, 95])
+    # Moving the first vertex also moves the closing vertex
+    poly.move_vertex(DummyEvent(10, 30, ax, 1, None), ind=0)
+    assert np.allclose(poly.x, [10, 80, 60, 10])
+    assert np.allclose(path.vertices[[0, -1]], [[10, 30], [10, 30]])
+    # Editing a finished polygon does not snap vertices to the first one
+    poly.move_vertex(DummyEvent(11, 31, ax, 1, None), ind=1)
+    assert np.allclose(poly.xy[0][1], 11)
+    assert np.allclose(polys.to_arrays()["x"], [10, 11, 60, 10])
+    assert np.allclose(poly.bbox, (10, 30, 60, 95))
+
+
+def test_polygons_close_after_zoom():
+    _, ax = plt.subplots()
+    ax.set(xlim=(0, 100), ylim=(0, 100))
+    polys = tbx.Polygons(ax=ax)
+    polys.click(x=20, y=40)
+    polys.click(x=80, y=70)
+    polys.click(x=50, y=90)
+    # After zooming in, a click 3 data units away from the first point is far from
+    # it on screen, and should not close the polygon
+    ax.set(xlim=(10, 30), ylim=(30, 50))
+    polys.click(x=23, y=40)
+    assert polys._motion_connected()
+    polys.click(x=20.1, y=40.1)
+    assert not polys._motion_connected()
+    assert np.allclose(polys.children[0].x, [20, 80, 50, 23, 20])
@@ -0,0 +1,77 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) Scipp contributors (https://github.com/scipp)
+
+import matplotlib.pyplot as plt
+
+import mpltoolbox as tbx
+
+# Two overlapping rectangles, and a third one apart
+OVERLAPPING = {
+    "x": [10.0, 20.0, 70.0],
+    "y": [10.0, 20.0, 10.0],
+    "width": [20.0, 30.0, 20.0],
+    "height": [20.0, 30.0, 10.0],
+}
+
+
+def test_intersecting(make_rectangles):
+    _, ax = plt.subplots()
+    rects = make_rectangles(ax, **OVERLAPPING)
+    assert rects.intersecting(25, 25, 26, 26) == rects.children[:2]
+    assert rects.intersecting(60, 0, 100, 100) == rects.children[2:]
+    assert rects.intersecting(55, 55, 65, 65) == []
+
+
+def test_containing(make_rectangles):
+    _, ax = plt.subplots()
+    rects = make_rectangles(ax, **OVERLAPPING)
+    assert rects.containing(25, 25) == rects.children[:2]
+    assert rects.containing(40, 40) == [rects.children[1]]
+    assert rects.containing(60, 60) == []
+
+
+def test_containing_ellipse_uses_exact_shape():
+    _, ax = plt.subplots()
+    ellipses = tbx.Ellipses(ax=ax)
+    ellipses.click(0, 0)
+    ellipses.click(20, 20)
+    assert ellipses.containing(10, 10) == ellipses.children
+    # Inside the bounding box but outside the ellipse
+    assert ellipses.containing(1, 1) == []
+
+
+def test_containing_lines_with_radius():
+    _, ax = plt.subplots()
+    ax.set(xlim=(0, 100), ylim=(0, 100))
+    lines = tbx.Lines(ax=ax, n=2)
+    lines.click(0, 0)
+    lines.click(100, 100)
+    assert lines.containing(50, 52) == []
+    assert lines.containing(50, 52, radius=10) == lines.children
+    assert lines.containing(50, 70, radius=10) == []
+
+
+def test_nearest():
+    _, ax = plt.subplots()
+    points = tbx.Points(ax=ax)
+    for x in (10, 50, 30, 90):
+        points.click(x, 0)
+    assert points.nearest(48, 0) == [points.children[1]]
+    assert points.nearest(48, 0, k=3) == [
+        points.children[1],
+        points.children[2],
+        points.children[0],
+    ]
+
+
+def test_queries_follow_changes(make_rectangles):
+    _, ax = plt.subplots()
+    rects = make_rectangles(ax, **OVERLAPPING)
+    rects.children[0].xy = (200, 200)
+    assert rects.containing(15, 15) == []
+    assert rects.containing(210, 210) == [rects.children[0]]
+    rects.remove(1)
+    assert rects.containing(40, 40) == []
+    assert rects.intersecting(0, 0, 300, 300) == rects.children
+    rects.clear()
+    assert rects.nearest(0, 0) == []
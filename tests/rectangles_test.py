@@ -2,9 +2,11 @@
 # Copyright (c) Scipp contributors (https://github.com/scipp)
 
 import matplotlib.pyplot as plt
+import numpy as np
 from matplotlib.colors import to_hex
 
 import mpltoolbox as tbx
+from mpltoolbox import DummyEvent
 
 
 def test_rectangles_creation():
@@ -191,3 +193,43 @@ def test_rectangles_shutdown():
     rects.click(x=30, y=60)
     rects.click(x=40, y=80)
     assert len(ax.patches) == 0
+
+
+def test_rectangles_move_every_handle():
+    _, ax = plt.subplots()
+    rects = tbx.Rectangles(ax=ax)
+    rects.click(10, 20)
+    rects.click(30, 50)
+    r = rects.children[0]
+    expected = {
+        0: ((5, 15), 25, 35),
+        1: ((10, 15), 20, 35),
+        2: ((10, 15), -5, 35),
+        3: ((10, 20), -5, 30),
+        4: ((10, 20), -5, -5),
+        5: ((10, 20), 20, -5),
+        6: ((5, 20), 25, -5),
+        7: ((5, 20), 25, 30),
+    }
+    for ind, (xy, width, height) in expected.items():
+        r.set_bounds(10, 20, 20, 30)
+        r.move_vertex(DummyEvent(5, 15, ax, 1, None), ind=ind)
+        assert r.xy == xy
+        assert r.width == width
+        assert r.height == height
+        assert np.array_equal(r.vertices[0], r._make_vertices()[0])
+        assert np.array_equal(r.vertices[1], r._make_vertices()[1])
+
+
+def test_rectangles_new_patch_props_match_move_vertex():
+    _, ax = plt.subplots()
+    rects = tbx.Rectangles(ax=ax)
+    for ind in [None, *range(8)]:
+        rects.add_many(x=[10.0], y=[20.0], width=[30.0], height=[15.0])
+        r = rects.children[-1]
+        event = DummyEvent(7.0, 50.0, ax, 1, None)
+        props = r.get_new_patch_props(event, ind)
+        r.move_vertex(event, ind)
+        assert props["corner"] == list(r.xy)
+        assert props.get("width", r.width) == r.width
+        assert props.get("height", r.height) == r.height
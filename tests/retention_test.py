@@ -0,0 +1,166 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) Scipp contributors (https://github.com/scipp)
+
+import gc
+import tracemalloc
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+from matplotlib.colors import to_rgba
+
+import mpltoolbox as tbx
+
+
+def test_max_children_evicts_oldest_in_batches():
+    _, ax = plt.subplots()
+    evicted = []
+    points = tbx.Points(ax=ax, max_children=32, on_evict=evicted.append)
+    for i in range(100):
+        points.add_many(x=[i], y=[0])
+    assert len(points.children) <= 32
+    assert points.children[-1].x == 99
+    assert np.array_equal(points.to_arrays()["x"], [c.x for c in points.children])
+    # Every eviction removes several children
+    assert sum(len(batch) for batch in evicted) == 100 - len(points.children)
+    assert len(evicted) < 100 - len(points.children)
+    assert len(ax.lines) == len(points.children)
+
+
+def test_evicted_artists_are_recycled():
+    _, ax = plt.subplots()
+    evicted = []
+    rects = tbx.Rectangles(ax=ax, max_children=16, on_evict=evicted.extend)
+    for i in range(17):
+        rects.add_many(x=[i], y=[0], width=1, height=1)
+    artists = {id(child._patch) for child in evicted}
+    ids = [child.id for child in evicted]
+    assert artists
+    children = rects.add_many(x=[20], y=[0], width=2, height=3)
+    assert id(children[0]._patch) in artists
+    assert children[0].xy == (20, 0)
+    assert children[0].width == 2
+    # The recycled child is a new child, with the style of its number
+    assert children[0].id not in ids
+    assert children[0]._patch.get_edgecolor() == to_rgba("C7")
+    assert children[0]._patch.axes is ax
+    assert rects.containing(21, 1) == children
+
+
+def test_add_many_beyond_max_children():
+    _, ax = plt.subplots()
+    points = tbx.Points(ax=ax, max_children=10)
+    children = points.add_many(x=np.arange(25), y=0)
+    assert children == points.children
+    assert [child.x for child in children][-1] == 24
+    assert len(ax.lines) == len(children)
+
+
+def test_window_evicts_children_outside():
+    _, ax = plt.subplots()
+    spans = tbx.Vspans(ax=ax, window=10)
+    for i in range(30):
+        spans.add_many(left=[i], right=[i + 0.5])
+    arrays = spans.to_arrays()
+    assert arrays["right"].min() >= 29.5 - 10
+    assert arrays["left"].max() == 29
+    assert len(ax.patches) == len(spans.children)
+
+
+def test_window_evicts_once_per_add_many():
+    _, ax = plt.subplots()
+    evicted = []
+    points = tbx.Points(ax=ax, window=10, on_evict=evicted.append)
+    points.add_many(x=np.arange(100.0), y=0.0)
+    assert len(evicted) == 1
+    assert len(evicted[0]) == 89
+    assert np.array_equal(points.to_arrays()["x"], np.arange(89.0, 100.0))
+
+
+def test_window_of_hspans_runs_along_y():
+    _, ax = plt.subplots()
+    spans = tbx.Hspans(ax=ax, window=10)
+    for i in range(30):
+        spans.add_many(bottom=[i], top=[i + 0.5])
+    arrays = spans.to_arrays()
+    assert arrays["top"].min() >= 29.5 - 10
+    assert arrays["bottom"].max() == 29
+    assert len(spans.children) < 30
+
+
+def test_retention_with_empty_add_many():
+    _, ax = plt.subplots()
+    spans = tbx.Vspans(ax=ax, window=10)
+    spans.add_many(left=[], right=[])
+    assert spans.children == []
+    lines = tbx.Lines(ax=ax, max_children=5)
+    lines.add_many(x=[], y=[], offsets=[0])
+    assert lines.children == []
+
+
+def test_retention_with_adopt_on_empty_axes():
+    _, ax = plt.subplots()
+    rects = tbx.Rectangles(ax=ax, max_children=5)
+    assert rects.adopt() == []
+    spans = tbx.Hspans(ax=ax, window=10)
+    assert spans.adopt() == []
+
+
+def test_retention_with_undo_redo():
+    _, ax = plt.subplots()
+    points = tbx.Points(ax=ax, max_children=5, window=10, undo_memory=2**20)
+    points.add_many(x=[1.0], y=[0.0])
+    assert points.undo()
+    assert points.children == []
+    assert points.redo()
+    assert len(points.children) == 1
+
+
+def test_max_children_with_clicks():
+    _, ax = plt.subplots()
+    ax.set(xlim=(0, 100), ylim=(0, 100))
+    rects = tbx.Rectangles(ax=ax, max_children=2)
+    for x in (10, 30, 50):
+        rects.click(x, 10)
+        rects.click(x + 10, 20)
+    assert [child.xy for child in rects.children] == [(30, 10), (50, 10)]
+
+
+def test_max_children_polygons():
+    _, ax = plt.subplots()
+    evicted = []
+    polygons = tbx.Polygons(ax=ax, max_children=2, on_evict=evicted.extend)
+    for i in range(3):
+        polygons.add_many(x=[i, i + 1, i], y=[0, 0, 1], offsets=[0, 3])
+    assert len(polygons.children) == 2
+    assert len(evicted) == 1
+    assert np.array_equal(polygons.vertex_counts(), [4, 4])
+
+
+def test_streaming_memory_is_bounded():
+    _, ax = plt.subplots()
+    points = tbx.Points(ax=ax, max_children=50)
+    for i in range(300):
+        points.add_many(x=[i], y=[0])
+    # Only objects allocated after tracing starts are counted: the memory traced
+    # grows until all the live objects have been replaced, and should then stay flat
+    tracemalloc.start()
+    for i in range(300, 1000):
+        points.add_many(x=[i], y=[0])
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(1000, 1500):
+        points.add_many(x=[i], y=[0])
+    gc.collect()
+    growth = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    # A single new point uses about 12 KiB
+    assert growth < 64 * 1024
+
+
+def test_bad_retention_raises():
+    _, ax = plt.subplots()
+    with pytest.raises(ValueError, match="max_children"):
+        tbx.Points(ax=ax, max_children=0)
+    with pytest.raises(ValueError, match="window"):
+        tbx.Points(ax=ax, window=-1)
@@ -0,0 +1,111 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) Scipp contributors (https://github.com/scipp)
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+import mpltoolbox as tbx
+
+
+def make_points(ax):
+    points = tbx.Points(ax=ax, enable_select=True)
+    for x, y in [(10, 10), (20, 20), (30, 30), (80, 80)]:
+        points.click(x, y)
+    return points
+
+
+def test_box_selection(drag):
+    _, ax = plt.subplots()
+    ax.set(xlim=(0, 100), ylim=(0, 100))
+    points = make_points(ax)
+    drag(ax, [(5, 5), (15, 15), (25, 25)], modifiers=["shift"])
+    assert points.selected == points.children[:2]
+    assert len(ax.lines) == 4  # the rubber band was removed
+    assert len(ax.patches) == 0
+    # A new selection replaces the previous one
+    drag(ax, [(75, 75), (90, 90)], modifiers=["shift"])
+    assert points.selected == points.children[3:]
+
+
+def test_lasso_selection(drag):
+    _, ax = plt.subplots()
+    ax.set(xlim=(0, 100), ylim=(0, 100))
+    points = tbx.Points(ax=ax, enable_select="lasso")
+    for x, y in [(10, 10), (20, 20), (30, 30), (80, 80)]:
+        points.click(x, y)
+    drag(ax, [(5, 5), (25, 5), (25, 25), (15, 30), (5, 25)], modifiers=["shift"])
+    assert points.selected == points.children[:2]
+
+
+def test_selection_disabled(drag):
+    _, ax = plt.subplots()
+    ax.set(xlim=(0, 100), ylim=(0, 100))
+    points = tbx.Points(ax=ax, enable_select=False)
+    points.click(10, 10)
+    drag(ax, [(5, 5), (15, 15)], modifiers=["shift"])
+    assert points.selected == []
+    assert len(points.children) == 1
+
+
+def test_shift_click_grabs_vertex_by_default(drag):
+    _, ax = plt.subplots()
+    ax.set(xlim=(0, 100), ylim=(0, 100))
+    rects = tbx.Rectangles(ax=ax)
+    rects.click(10, 10)
+    rects.click(20, 20)
+    drag(ax, [(20, 20), (30, 40)], modifiers=["shift"])
+    assert rects.selected == []
+    assert rects._rubber_band is None
+    assert np.allclose((rects.children[0].width, rects.children[0].height), (20, 30))
+
+
+def test_drag_selected_moves_group(drag):
+    _, ax = plt.subplots()
+    ax.set(xlim=(0, 100), ylim=(0, 100))
+    rects = tbx.Rectangles(ax=ax)
+    for x0, y0, x1, y1 in [(10, 10, 20, 20), (30, 10, 40, 20), (60, 60, 70, 70)]:
+        rects.click(x0, y0)
+        rects.click(x1, y1)
+    moved = []
+    rects.on_drag_move(moved.append)
+    rects.select(rects.children[:2])
+    drag(ax, [(15, 15), (20, 25), (25, 35)], button=3)
+    assert np.allclose(rects.children[0].xy, (20, 30))
+    assert np.allclose(rects.children[1].xy, (40, 30))
+    assert np.allclose(rects.children[2].xy, (60, 60))
+    assert len(moved) == 4  # two children, two motion events
+    # The index follows the group drag
+    assert rects.containing(45, 35) == [rects.children[1]]
+
+
+def test_drag_selected_lines(drag):
+    _, ax = plt.subplots()
+    ax.set(xlim=(0, 100), ylim=(0, 100))
+    lines = tbx.Lines(ax=ax, n=3)
+    for xs in ([10, 20, 30], [50, 60, 70]):
+        for x in xs:
+            lines.click(x, x)
+    lines.select(lines.children)
+    drag(ax, [(20, 20), (25, 30)], button=3)
+    assert np.allclose(lines.children[0].x, [15, 25, 35])
+    assert np.allclose(lines.children[0].y, [20, 30, 40])
+    assert np.allclose(lines.children[1].y, [60, 70, 80])
+
+
+def test_middle_click_removes_selection(send):
+    _, ax = plt.subplots()
+    ax.set(xlim=(0, 100), ylim=(0, 100))
+    rects = tbx.Rectangles(ax=ax)
+    for x0, y0, x1, y1 in [(10, 10, 20, 20), (30, 10, 40, 20), (60, 60, 70, 70)]:
+        rects.click(x0, y0)
+        rects.click(x1, y1)
+    removed = []
+    rects.on_remove(removed.append)
+    first, second, third = rects.children
+    rects.select([first, third])
+    send(ax, "button_press_event", 15, 15, button=2)
+    assert rects.children == [second]
+    assert removed == [first, third]
+    assert rects.selected == []
+    assert len(ax.patches) == 1
+    assert rects.containing(65, 65) == []
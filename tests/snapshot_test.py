@@ -0,0 +1,110 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) Scipp contributors (https://github.com/scipp)
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+import mpltoolbox as tbx
+
+
+def test_snapshot_shares_storage_until_changed(make_rectangles):
+    _, ax = plt.subplots()
+    rects = make_rectangles(ax, x=np.arange(5.0))
+    snap = rects.snapshot()
+    assert len(snap) == 5
+    assert np.shares_memory(snap.to_arrays()["x"], rects.to_arrays()["x"])
+    # Adding children does not copy
+    rects.add_many(x=[10.0], y=0.0, width=1.0, height=1.0)
+    assert np.shares_memory(snap.to_arrays()["x"], rects.to_arrays()["x"])
+    assert len(snap.to_arrays()["x"]) == 5
+    # Changing a child copies the storage, leaving the snapshot unchanged
+    rects.children[0].xy = (20.0, 20.0)
+    assert not np.shares_memory(snap.to_arrays()["x"], rects.to_arrays()["x"])
+    assert np.array_equal(snap.to_arrays()["x"], np.arange(5.0))
+    assert rects.to_arrays()["x"][0] == 20.0
+
+
+def test_snapshot_arrays_are_read_only(make_rectangles):
+    _, ax = plt.subplots()
+    snap = make_rectangles(ax, x=np.arange(5.0)).snapshot()
+    with pytest.raises(ValueError, match="read-only"):
+        snap.to_arrays()["x"][0] = 1.0
+
+
+def test_diff_reports_added_removed_and_modified(make_rectangles):
+    _, ax = plt.subplots()
+    rects = make_rectangles(ax, x=np.arange(5.0))
+    ids = [child.id for child in rects.children]
+    a = rects.snapshot()
+    new = rects.add_many(x=[10.0], y=0.0, width=1.0, height=1.0)
+    rects.remove_many([ids[0]])
+    rects.get_child(ids[2]).width = 3.0
+    b = rects.snapshot()
+    assert tbx.diff(a, b) == ([new[0].id], [ids[0]], [ids[2]])
+    assert tbx.diff(b, a) == ([ids[0]], [new[0].id], [ids[2]])
+    assert a.ids == ids
+    assert b.ids == [*ids[1:], new[0].id]
+    assert tbx.diff(b, rects.snapshot()) == ([], [], [])
+
+
+def test_diff_ignores_children_created_and_removed_in_between(make_rectangles):
+    _, ax = plt.subplots()
+    rects = make_rectangles(ax, x=np.arange(5.0))
+    a = rects.snapshot()
+    new = rects.add_many(x=[10.0], y=0.0, width=1.0, height=1.0)
+    rects.remove_many(new)
+    first = rects.children[0]
+    rects.remove(first)
+    b = rects.snapshot()
+    assert tbx.diff(a, b) == ([], [first.id], [])
+
+
+def test_diff_across_several_snapshots(make_rectangles):
+    _, ax = plt.subplots()
+    rects = make_rectangles(ax, x=np.arange(5.0))
+    a = rects.snapshot()
+    rects.children[1].width = 5.0
+    rects.snapshot()
+    rects.children[3].width = 5.0
+    c = rects.snapshot()
+    assert tbx.diff(a, c).modified == [rects.children[1].id, rects.children[3].id]
+
+
+def test_diff_of_lines():
+    _, ax = plt.subplots()
+    lines = tbx.Lines(ax=ax)
+    lines.add_many(x=[0.0, 1.0, 2.0, 3.0], y=[0.0, 1.0, 0.0, 1.0], offsets=[0, 2, 4])
+    a = lines.snapshot()
+    lines.children[1].x = [2.0, 9.0]
+    b = lines.snapshot()
+    assert tbx.diff(a, b) == ([], [], [lines.children[1].id])
+    assert np.array_equal(a.to_arrays()["x"], [0.0, 1.0, 2.0, 3.0])
+    assert np.array_equal(b.to_arrays()["x"], [0.0, 1.0, 2.0, 9.0])
+    assert np.array_equal(b.to_arrays()["offsets"], [0, 2, 4])
+
+
+def test_changes_are_only_logged_while_snapshots_are_alive(make_rectangles):
+    _, ax = plt.subplots()
+    rects = make_rectangles(ax, x=np.arange(5.0))
+    a = rects.snapshot()
+    rects.remove_many([0])
+    b = rects.snapshot()
+    rects.remove_many([0])
+    del a
+    # The changes before the oldest snapshot are forgotten
+    assert len(rects._changes) == 1
+    assert len(rects._removed_ids) == 1
+    del b
+    assert rects._changes == []
+    assert rects._removed_ids == {}
+    rects.remove_many([0])
+    assert rects._changes == []
+
+
+def test_diff_of_different_tools_raises(make_rectangles):
+    _, ax = plt.subplots()
+    a = make_rectangles(ax, x=np.arange(5.0)).snapshot()
+    b = make_rectangles(ax, x=np.arange(5.0)).snapshot()
+    with pytest.raises(ValueError, match="same tool"):
+        tbx.diff(a, b)
@@ -0,0 +1,160 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) Scipp contributors (https://github.com/scipp)
+
+import numpy as np
+
+from mpltoolbox.spatial import BoxIndex, IntervalIndex, SegmentIndex
+from mpltoolbox.store import VertexBuffer
+from mpltoolbox.utils import segment_distances
+
+
+def test_box_index_grows_and_keeps_insertion_order():
+    index = BoxIndex(capacity=2)
+    for i in range(5):
+        index.add(f"k{i}", (i, i, i + 1, i + 1))
+    assert len(index) == 5
+    assert index.keys == ["k0", "k1", "k2", "k3", "k4"]
+    assert np.array_equal(index.boxes[:, 0], np.arange(5))
+
+
+def test_box_index_remove_shifts_rows():
+    index = BoxIndex()
+    for i in range(4):
+        index.add(i, (i, i, i + 1, i + 1))
+    index.remove(1)
+    assert index.keys == [0, 2, 3]
+    assert index.row(3) == 2
+    assert np.array_equal(index.boxes[:, 0], [0, 2, 3])
+    index.remove(3)
+    assert 3 not in index
+    assert np.array_equal(index.boxes[:, 0], [0, 2])
+
+
+def test_box_index_query_point():
+    index = BoxIndex()
+    index.add("a", (0, 0, 10, 10))
+    index.add("b", (5, 5, 20, 20))
+    index.add("c", (-np.inf, 30, np.inf, 40))
+    assert list(index.query_point(7, 7)) == [0, 1]
+    assert list(index.query_point(15, 15)) == [1]
+    assert list(index.query_point(1000, 35)) == [2]
+    assert list(index.query_point(21, 21)) == []
+    assert list(index.query_point(21, 21, xtol=2, ytol=2)) == [1]
+    index.update("a", (100, 100, 110, 110))
+    assert list(index.query_point(7, 7)) == [1]
+
+
+def test_box_index_query_box():
+    index = BoxIndex()
+    index.add("a", (0, 0, 10, 10))
+    index.add("b", (5, 5, 20, 20))
+    index.add("c", (30, -np.inf, 40, np.inf))
+    assert list(index.query_box(8, 8, 9, 9)) == [0, 1]
+    assert list(index.query_box(15, 15, 35, 16)) == [1, 2]
+    assert list(index.query_box(50, 50, 60, 60)) == []
+
+
+def test_box_index_nearest():
+    index = BoxIndex()
+    index.add("a", (0, 0, 1, 1))
+    index.add("b", (10, 10, 11, 11))
+    index.add("c", (4, 4, 5, 5))
+    assert list(index.nearest(9, 9, k=1)) == [1]
+    assert list(index.nearest(9, 9, k=2)) == [1, 2]
+    assert list(index.nearest(9, 9, k=10)) == [1, 2, 0]
+    assert list(BoxIndex().nearest(0, 0)) == []
+
+
+def test_interval_index_counts():
+    index = IntervalIndex()
+    for i, (lo, hi) in enumerate([(0, 10), (5, 15), (20, 30)]):
+        index.add(i, (lo, hi))
+    t = np.array([-1, 0, 7, 10, 12, 17, 25, 31])
+    assert np.array_equal(index.count_containing(t), [0, 1, 2, 2, 1, 0, 1, 0])
+    assert np.array_equal(
+        index.count_overlapping([11, 16, -5], [19, 20, 100]), [1, 1, 3]
+    )
+
+
+def test_interval_index_listing_matches_brute_force():
+    rng = np.random.default_rng(42)
+    lo = rng.uniform(0, 100, 200)
+    hi = lo + rng.uniform(0, 5, 200)
+    index = IntervalIndex()
+    for i in range(200):
+        index.add(i, (lo[i], hi[i]))
+    for t in rng.uniform(0, 100, 20):
+        expected = np.flatnonzero((lo <= t) & (hi >= t))
+        assert np.array_equal(index.containing(t), expected)
+        assert index.count_containing(t) == len(expected)
+    for a in rng.uniform(0, 100, 20):
+        expected = np.flatnonzero((lo <= a + 3) & (hi >= a))
+        assert np.array_equal(index.overlapping(a, a + 3), expected)
+
+
+def test_interval_index_follows_updates_and_removals():
+    index = IntervalIndex()
+    index.add("a", (0, 1))
+    index.add("b", (2, 3))
+    assert list(index.containing(2.5)) == [1]
+    index.update("a", (2, 10))
+    assert list(index.containing(2.5)) == [0, 1]
+    index.remove("b")
+    assert list(index.containing(2.5)) == [0]
+    assert index.count_containing(9) == 1
+    index.clear()
+    assert index.count_containing(9) == 0
+    assert list(index.containing(9)) == []
+
+
+def brute_force_hits(vertices, point, radius):
+    dist = np.hypot(*(vertices - point).T)
+    points = np.flatnonzero(dist <= radius)
+    segs = segment_distances(vertices[:-1], vertices[1:], point)
+    return points, np.flatnonzero(segs <= radius)
+
+
+def test_segment_index_matches_brute_force():
+    rng = np.random.default_rng(3)
+    vertices = np.cumsum(rng.normal(size=(1001, 2)), axis=0)
+    index = SegmentIndex(vertices)
+    for point in vertices[rng.integers(0, 1001, 20)] + rng.normal(size=(20, 2)):
+        points, segs = brute_force_hits(vertices, point, 1.5)
+        hits = index.query(point, 1.5)
+        assert np.array_equal(hits[: len(points)], points)
+        assert np.array_equal(hits[len(points) :], segs)
+        assert np.array_equal(index.query(point, 1.5, segments=False), points)
+
+
+def test_segment_index_update_vertex():
+    rng = np.random.default_rng(4)
+    vertices = np.cumsum(rng.normal(size=(101, 2)), axis=0)
+    index = SegmentIndex(vertices)
+    for ind in (0, 50, 100):
+        vertices[ind] = (500.0, 500.0)
+        index.update_vertex(ind, (500.0, 500.0))
+    rebuilt = SegmentIndex(vertices)
+    for point in [(500.0, 500.0), (500.0, 499.0), *vertices[::10]]:
+        assert np.array_equal(index.query(point, 2.0), rebuilt.query(point, 2.0))
+
+
+def test_segment_index_single_vertex():
+    index = SegmentIndex(np.array([[1.0, 2.0]]))
+    assert list(index.query((1.0, 3.0), 1.5)) == [0]
+    assert list(index.query((1.0, 4.0), 1.5)) == []
+
+
+def test_vertex_buffer_grows_geometrically():
+    buffer = VertexBuffer([0.0], [1.0], capacity=2)
+    capacities = set()
+    for i in range(1, 100):
+        buffer.append(i, i + 1)
+        capacities.add(len(buffer._data))
+    assert len(buffer) == 100
+    assert capacities == {2, 4, 8, 16, 32, 64, 128}
+    assert np.array_equal(buffer.x, np.arange(100))
+    assert np.array_equal(buffer.y, np.arange(100) + 1)
+    buffer.set_vertex([0, -1], 5.0, None)
+    assert buffer.x[0] == 5
+    assert buffer.x[-1] == 5
+    assert buffer.y[-1] == 100
@@ -0,0 +1,205 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) Scipp contributors (https://github.com/scipp)
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+import mpltoolbox as tbx
+
+UNDO_MEMORY = 2**20
+# The geometry of a rectangle drawn from (10, 10) to (20, 30)
+RECT = {"x": [10.0], "height": 20.0, "undo_memory": UNDO_MEMORY}
+
+
+def test_undo_redo_creation(make_rectangles):
+    _, ax = plt.subplots()
+    removed = []
+    created = []
+    rects = make_rectangles(ax, **RECT, on_remove=removed.append)
+    rects.on_create(created.append)
+    assert rects.undo()
+    assert len(rects.children) == 0
+    assert len(ax.patches) == 0
+    assert len(removed) == 1
+    assert rects.redo()
+    assert len(rects.children) == 1
+    assert rects.children[0].xy == (10, 10)
+    assert rects.children[0].width == 10
+    assert rects.children[0].height == 20
+    assert len(created) == 1
+    assert not rects.redo()
+
+
+def test_undo_redo_calls_per_child_callbacks(make_rectangles):
+    _, ax = plt.subplots()
+    log = []
+    rects = make_rectangles(
+        ax,
+        **RECT,
+        on_create=lambda c: log.append(("create", c.xy)),
+        on_remove=lambda c: log.append(("remove", c.xy)),
+    )
+    batches = []
+    rects.on_remove_batch(lambda c, ids: batches.append(("remove", len(c))))
+    rects.on_create_batch(lambda c, ids: batches.append(("create", len(c))))
+    log.clear()
+    assert rects.undo()
+    assert rects.redo()
+    assert log == [("remove", (10, 10)), ("create", (10, 10))]
+    assert batches == [("remove", 1), ("create", 1)]
+
+
+def test_undo_removal_restores_id_and_index(make_rectangles):
+    _, ax = plt.subplots()
+    rects = make_rectangles(ax, **RECT)
+    rects.click(50, 50)
+    rects.click(60, 70)
+    first = rects.children[0]
+    uid = first.id
+    rects.remove(first)
+    assert rects.containing(15, 15) == []
+    assert rects.undo()
+    assert len(rects.children) == 2
+    restored = rects.get_child(uid)
+    assert restored.xy == (10, 10)
+    assert rects.containing(15, 15) == [restored]
+
+
+def test_undo_redo_creation_keeps_id(make_rectangles):
+    _, ax = plt.subplots()
+    rects = make_rectangles(ax, **RECT)
+    # The uuid is only generated here, after the creation was recorded
+    uid = rects.children[0].id
+    assert rects.undo()
+    assert rects.redo()
+    assert rects.children[0].id == uid
+    # Also when the restored child is removed again and restored a second time
+    rects.remove(rects.children[0])
+    assert rects.undo()
+    assert rects.children[0].id == uid
+
+
+def test_redo_removal_keeps_id(make_rectangles):
+    _, ax = plt.subplots()
+    rects = make_rectangles(ax, **RECT)
+    rects.remove(rects.children[0])
+    assert rects.undo()
+    uid = rects.children[0].id
+    assert rects.redo()
+    assert rects.undo()
+    assert rects.children[0].id == uid
+
+
+def test_undo_add_many_is_a_single_step():
+    _, ax = plt.subplots()
+    points = tbx.Points(ax=ax, undo_memory=UNDO_MEMORY)
+    points.add_many(x=np.arange(100.0), y=np.zeros(100))
+    points.add_many(x=[200.0], y=[1.0])
+    assert points.undo()
+    assert len(points.children) == 100
+    assert points.undo()
+    assert len(points.children) == 0
+    assert not points.undo()
+    assert points.redo()
+    assert np.array_equal(points.to_arrays()["x"], np.arange(100.0))
+
+
+def test_undo_vertex_move_and_drag(drag, make_rectangles):
+    _, ax = plt.subplots()
+    rects = make_rectangles(ax, **RECT)
+    # Move the top-right corner, with several motion events
+    drag(ax, [(20, 30), (25, 32), (30, 40)])
+    r = rects.children[0]
+    assert np.allclose((r.width, r.height), (20, 30))
+    # Drag the whole rectangle
+    drag(ax, [(15, 15), (20, 20), (25, 25)], button=3)
+    assert np.allclose(r.xy, (20, 20))
+    assert rects.undo()
+    assert np.allclose(r.xy, (10, 10))
+    assert np.allclose((r.width, r.height), (20, 30))
+    assert rects.undo()
+    assert np.allclose((r.width, r.height), (10, 20))
+    assert rects.containing(25, 35) == []
+    assert rects.redo()
+    assert rects.redo()
+    assert np.allclose(r.xy, (20, 20))
+    assert np.allclose((r.width, r.height), (20, 30))
+    assert rects.containing(35, 45) == [r]
+
+
+def test_undo_set_geometry():
+    _, ax = plt.subplots()
+    changed = []
+    vspans = tbx.Vspans(ax=ax, on_change=changed.append, undo_memory=UNDO_MEMORY)
+    vspans.add_many(left=[1.0, 5.0], right=[2.0, 6.0])
+    vspans.set_geometry(left=[0.0, 4.0], right=[3.0, 7.0])
+    changed.clear()
+    assert vspans.undo()
+    assert np.array_equal(vspans.to_arrays()["left"], [1.0, 5.0])
+    assert np.array_equal(vspans.to_arrays()["right"], [2.0, 6.0])
+    assert len(changed) == 2
+
+
+def test_polyline_change_stores_only_moved_vertices():
+    _, ax = plt.subplots()
+    lines = tbx.Lines(ax=ax, undo_memory=UNDO_MEMORY)
+    n = 10_000
+    x = np.linspace(0, 100, n)
+    lines.add_many(x=x, y=np.sin(x), offsets=[0, n])
+    after_create = lines._history.nbytes
+    y = np.sin(x)
+    y[5000] = 3.0
+    lines.set_geometry(x=x, y=y, offsets=[0, n])
+    # A single vertex changed: the edit is far smaller than the vertices
+    assert lines._history.nbytes - after_create < 1000
+    assert lines.undo()
+    assert np.array_equal(lines.children[0].y, np.sin(x))
+    assert lines.redo()
+    assert lines.children[0].y[5000] == 3.0
+
+
+def test_memory_limit_forgets_oldest_edits():
+    _, ax = plt.subplots()
+    points = tbx.Points(ax=ax, undo_memory=4096)
+    for i in range(100):
+        points.add_many(x=[i], y=[0])
+    assert points._history.nbytes <= 4096
+    count = 0
+    while points.undo():
+        count += 1
+    assert 0 < count < 100
+    assert len(points.children) == 100 - count
+
+
+def test_new_edit_clears_redo(make_rectangles):
+    _, ax = plt.subplots()
+    rects = make_rectangles(ax, **RECT)
+    rects.undo()
+    rects.click(50, 50)
+    rects.click(60, 60)
+    assert not rects.redo()
+    assert len(rects.children) == 1
+
+
+def test_undo_skips_evicted_children():
+    _, ax = plt.subplots()
+    points = tbx.Points(ax=ax, max_children=2, undo_memory=UNDO_MEMORY)
+    for i in range(4):
+        points.add_many(x=[i], y=[0])
+    assert points.undo()
+    assert points.undo()
+    assert len(points.children) == 0
+    # The first two points were evicted and cannot be removed again
+    assert not points.undo()
+
+
+def test_undo_disabled():
+    _, ax = plt.subplots()
+    ax.set(xlim=(0, 100), ylim=(0, 100))
+    # Undo is disabled by default
+    rects = tbx.Rectangles(ax=ax)
+    rects.click(10, 10)
+    rects.click(20, 30)
+    assert rects._history is None
+    assert not rects.undo()
+    assert len(rects.children) == 1
@@ -0,0 +1,73 @@
+# SPDX-License-Identifier: BSD-3-Clause
+# Copyright (c) Scipp contributors (https://github.com/scipp)
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+import mpltoolbox as tbx
+
+
+def test_version_increases_on_every_change():
+    _, ax = plt.subplots()
+    rects = tbx.Rectangles(ax=ax)
+    versions = [rects.version]
+    rects.add_many(x=[0.0, 5.0], y=0.0, width=1.0, height=1.0)
+    versions.append(rects.version)
+    rects.children[0].width = 2.0
+    versions.append(rects.version)
+    rects.remove_many([1])
+    versions.append(rects.version)
+    rects.clear()
+    versions.append(rects.version)
+    assert np.all(np.diff(versions) > 0)
+
+
+def test_changed_since():
+    _, ax = plt.subplots()
+    points = tbx.Points(ax=ax)
+    points.add_many(x=np.arange(10.0), y=0.0)
+    version = points.version
+    assert points.changed_since(version) == []
+    points.children[3].xy = (3.0, 1.0)
+    points.children[7].xy = (7.0, 1.0)
+    new = points.add_many(x=[20.0], y=0.0)
+    expected = [points.children[3].id, points.children[7].id, new[0].id]
+    assert points.changed_since(version) == expected
+    version = points.version
+    points.remove_many([3])
+    assert points.changed_since(version) == []
+    assert points.version > version
+
+
+def test_changed_since_follows_drag_and_vertex_move(drag, make_rectangles):
+    _, ax = plt.subplots()
+    rects = make_rectangles(ax)
+    version = rects.version
+    drag(ax, [(15, 15), (20, 20), (25, 25)], button=3)
+    # Every motion event is a new version
+    assert rects.version >= version + 2
+    assert rects.changed_since(version) == [rects.children[0].id]
+    version = rects.version
+    drag(ax, [(60, 20), (70, 30)], button=1)
+    assert rects.changed_since(version) == [rects.children[1].id]
+
+
+def test_changed_since_of_lines():
+    _, ax = plt.subplots()
+    lines = tbx.Lines(ax=ax)
+    lines.add_many(x=[0.0, 1.0, 2.0, 3.0], y=[0.0, 1.0, 0.0, 1.0], offsets=[0, 2, 4])
+    version = lines.version
+    lines.children[0].y = [5.0, 5.0]
+    assert lines.changed_since(version) == [lines.children[0].id]
+
+
+def test_point_move_is_a_single_version(drag):
+    _, ax = plt.subplots()
+    ax.set(xlim=(0, 100), ylim=(0, 100))
+    points = tbx.Points(ax=ax)
+    points.add_many(x=[10.0, 50.0], y=10.0)
+    version = points.version
+    drag(ax, [(10, 10), (12, 12), (14, 14), (16, 16)], button=1)
+    # One version per motion event
+    assert points.version == version + 3
+    assert np.allclose(points.children[0].xy, (16, 16))
@@ -191,3 +191,34 @@ def test_vspans_shutdown():
     vspans.click(x=30, y=0)
     vspans.click(x=40, y=0)
     assert len(ax.patches) == 0
+
+
+def test_vspans_interval_queries():
+    _, ax = plt.subplots()
+    spans = tbx.Vspans(ax=ax)
+    for left, right in [(10, 20), (15, 30), (50, 40)]:
+        spans.click(x=left, y=5)
+        spans.click(x=right, y=5)
+    assert spans.spans_containing(17) == spans.children[:2]
+    assert spans.spans_containing(45) == [spans.children[2]]
+    assert spans.spans_overlapping(25, 42) == spans.children[1:]
+    assert list(spans.count_containing([5, 12, 17, 45])) == [0, 1, 2, 1]
+    assert list(spans.overlaps([0, 31], [9, 39])) == [False, False]
+    assert list(spans.overlaps([0, 31], [10, 40])) == [True, True]
+
+
+def test_vspans_interval_queries_follow_changes():
+    _, ax = plt.subplots()
+    spans = tbx.Vspans(ax=ax)
+    spans.click(x=10, y=5)
+    spans.click(x=20, y=5)
+    spans.click(x=30, y=5)
+    spans.click(x=40, y=5)
+    spans.children[0].right = 35
+    assert spans.spans_containing(32) == spans.children
+    spans.children[1].xy = (100, 0)
+    assert spans.spans_containing(32) == [spans.children[0]]
+    assert spans.spans_containing(105) == [spans.children[1]]
+    spans.remove(0)
+    assert spans.spans_containing(32) == []
+    assert spans.count_containing(105) == 1